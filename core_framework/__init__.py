@@ -184,6 +184,7 @@ from .common import (
     get_log_dir,
     get_log_level,
     get_temp_dir,
+    get_private_temp_dir,
     get_delivered_by,
     get_aws_profile,
     get_aws_region,
@@ -241,6 +242,7 @@ from .common import (
     get_valid_mimetypes,
     is_local_mode,
     is_use_s3,
+    get_artefact_compression,
     is_enforce_validation,
     is_json_log,
     is_console_log,
@@ -326,6 +328,7 @@ __all__ = [
     "get_log_dir",
     "get_log_level",
     "get_temp_dir",
+    "get_private_temp_dir",
     "get_delivered_by",
     "get_aws_profile",
     "get_aws_region",
@@ -386,6 +389,7 @@ __all__ = [
     "get_valid_mimetypes",
     "is_local_mode",
     "is_use_s3",
+    "get_artefact_compression",
     "is_enforce_validation",
     "is_json_log",
     "is_console_log",
@@ -15,6 +15,7 @@ import datetime
 from decimal import Decimal
 import os
 import re
+import stat
 import boto3
 from botocore.exceptions import ProfileNotFound
 
@@ -58,6 +59,7 @@ from .constants import (
     ENV_DELIVERED_BY,
     ENV_LOG_DIR,
     ENV_USE_S3,
+    ENV_ARTEFACT_COMPRESSION,
     ENV_LOG_AS_JSON,
     ENV_LOG_LEVEL,
     ENV_CORRELATION_ID,
@@ -801,6 +803,31 @@ def is_use_s3() -> bool:
     return os.getenv(ENV_USE_S3, V_FALSE).lower() == V_TRUE
 
 
+def get_artefact_compression() -> str | None:
+    """Get the artefact compression mode from the ARTEFACT_COMPRESSION environment variable.
+
+    "true" and "auto" select the encoding per content type. "gzip" or "zstd"
+    force that encoding for every compressible artefact. Any other value
+    disables compression.
+
+    Returns
+    -------
+    str | None
+        "auto", "gzip" or "zstd", or None if compression is disabled
+
+    Examples
+    --------
+    >>> get_artefact_compression()
+    'auto'
+    """
+    mode = os.getenv(ENV_ARTEFACT_COMPRESSION, V_FALSE).lower()
+    if mode in (V_TRUE, "auto"):
+        return "auto"
+    if mode in ("gzip", "zstd"):
+        return mode
+    return None
+
+
 def is_json_log() -> bool:
     """Check if log output is in JSON format.
 
@@ -909,6 +936,52 @@ def get_temp_dir(path: str | None = None) -> str:
     return os.path.join(folder, path) if path else folder
 
 
+def get_private_temp_dir(path: str) -> str | None:
+    """Get a temporary directory only the current user can access.
+
+    The directory is ``<temp dir>/<path>-<uid>``, created with mode 0700. Like
+    Jinja2's default bytecode cache directory, it is only returned while it is
+    owned by the current user with that mode, so other users of a shared
+    temp directory cannot pre-create it and plant files in it.
+
+    Args:
+        path: Folder name prefix within the temp directory.
+
+    Returns:
+        The directory path, or None if it exists with another owner or mode,
+        cannot be created, or the platform has no user ids.
+
+    Examples
+    --------
+    >>> get_private_temp_dir("s3-cache")
+    '/tmp/s3-cache-1000'
+    """
+    if not hasattr(os, "getuid"):
+        return None
+    directory = get_temp_dir(f"{path}-{os.getuid()}")
+
+    try:
+        os.mkdir(directory, stat.S_IRWXU)
+        # The umask may have removed permissions the owner needs
+        os.chmod(directory, stat.S_IRWXU)
+    except FileExistsError:
+        pass
+    except OSError:
+        return None
+
+    try:
+        st = os.lstat(directory)
+    except OSError:
+        return None
+    if (
+        not stat.S_ISDIR(st.st_mode)
+        or st.st_uid != os.getuid()
+        or stat.S_IMODE(st.st_mode) != stat.S_IRWXU
+    ):
+        return None
+    return directory
+
+
 def get_mode() -> str:
     """Get deployment mode.
 
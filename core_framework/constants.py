@@ -682,6 +682,9 @@ ENV_LOG_DIR = "LOG_DIR"
 ENV_USE_S3 = "USE_S3"
 """Use S3 environment variable."""
 
+ENV_ARTEFACT_COMPRESSION = "ARTEFACT_COMPRESSION"
+"""Artefact compression mode environment variable (auto, gzip, zstd or false)."""
+
 ENV_CORRELATION_ID = "CORRELATION_ID"
 """Correlation ID environment variable."""
 
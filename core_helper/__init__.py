@@ -9,6 +9,9 @@ Key Modules:
     - **aws**: AWS session management, authentication, and service client creation
     - **cache**: Thread-safe in-memory caching with sliding TTL for performance optimization
     - **magic**: S3 emulation for local development and testing without AWS infrastructure
+    - **s3_cache**: ETag-validated on-disk read-through cache for S3 objects
+    - **s3_server**: Local S3-compatible HTTP endpoint over the magic storage volume
+    - **compression**: Transparent gzip/zstd compression of stored artefacts
 
 Architecture:
     The helper modules follow a layered approach where higher-level operations
@@ -160,6 +163,23 @@ from .cache import (
     DEFAULT_TTL,
 )
 
+from .s3_cache import (
+    # S3 object caching
+    S3ObjectCache,
+    CachedS3Client,
+    CachedS3Bucket,
+    get_object_cache,
+    DEFAULT_CACHE_MAX_SIZE,
+)
+
+from .compression import (
+    # Artefact compression
+    CompressingS3Client,
+    CompressingS3Bucket,
+    DecodingStreamingBody,
+    choose_encoding,
+)
+
 from .magic import (
     # S3 emulation classes
     FileStreamingBody,
@@ -169,6 +189,12 @@ from .magic import (
     SeekableStreamWrapper,
 )
 
+from .s3_server import (
+    # Local S3 endpoint
+    LocalS3Server,
+    start_server,
+)
+
 __all__ = [
     # AWS Session and Credential Management
     "get_session",
@@ -218,12 +244,23 @@ __all__ = [
     # Caching
     "InMemoryCache",
     "DEFAULT_TTL",
+    "S3ObjectCache",
+    "CachedS3Client",
+    "CachedS3Bucket",
+    "get_object_cache",
+    "DEFAULT_CACHE_MAX_SIZE",
     # S3 Emulation
     "FileStreamingBody",
     "MagicObject",
     "MagicBucket",
     "MagicS3Client",
     "SeekableStreamWrapper",
+    "LocalS3Server",
+    "start_server",
+    "CompressingS3Client",
+    "CompressingS3Bucket",
+    "DecodingStreamingBody",
+    "choose_encoding",
 ]
 
 # Categorized function lists for documentation and IDE assistance
@@ -292,6 +329,11 @@ IAM_MANAGEMENT_FUNCTIONS = [
 CACHING_COMPONENTS = [
     "InMemoryCache",
     "DEFAULT_TTL",
+    "S3ObjectCache",
+    "CachedS3Client",
+    "CachedS3Bucket",
+    "get_object_cache",
+    "DEFAULT_CACHE_MAX_SIZE",
 ]
 
 #: S3 emulation and magic storage components
@@ -301,6 +343,12 @@ STORAGE_EMULATION_COMPONENTS = [
     "MagicBucket",
     "MagicS3Client",
     "SeekableStreamWrapper",
+    "LocalS3Server",
+    "start_server",
+    "CompressingS3Client",
+    "CompressingS3Bucket",
+    "DecodingStreamingBody",
+    "choose_encoding",
 ]
 
 
@@ -372,6 +420,7 @@ def get_helper_info() -> dict[str, any]:
                     "Background cleanup for memory management",
                     "AWS session and credential specialized storage",
                     "Lambda execution environment optimization",
+                    "ETag-validated on-disk S3 object cache",
                 ],
                 "component_count": len(CACHING_COMPONENTS),
             },
@@ -383,6 +432,8 @@ def get_helper_info() -> dict[str, any]:
                     "API-compatible emulation with proper error handling",
                     "Streaming support with resource management",
                     "Metadata generation for local files",
+                    "Local S3-compatible HTTP endpoint for other processes",
+                    "Opt-in gzip/zstd artefact compression with ContentEncoding",
                 ],
                 "component_count": len(STORAGE_EMULATION_COMPONENTS),
             },
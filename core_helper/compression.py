@@ -0,0 +1,503 @@
+"""Transparent Compression for Local and S3 Artefacts.
+
+This module provides opt-in compression of stored artefacts such as rendered
+CloudFormation templates and action files, which typically compress 5-10x. When
+enabled with the ``ARTEFACT_COMPRESSION`` environment variable, writes through
+``MagicS3Client``/``MagicBucket`` (local storage) or the proxies returned by
+``MagicS3Client.get_client``/``get_bucket`` (S3) are compressed, and reads are
+decompressed on the fly, so callers do not change.
+
+Key Features:
+    - **Per Content Type Encoding**: Structured artefacts (JSON, YAML, XML) use
+      zstd when it is available; web assets use gzip which every browser and CDN
+      understands. Already-compressed and binary content is stored as is,
+      including keys with a compression suffix such as ``.json.gz``, which are
+      also never decoded on read
+    - **ContentEncoding**: Compressed S3 objects carry the ``ContentEncoding``
+      header and local objects report it in head/get responses. Ranged reads
+      return the stored (encoded) bytes, which cannot be decoded on their own
+    - **Streaming**: Compression and decompression are incremental so large
+      artefacts are never held in memory
+    - **Compressed ETags**: ETags are computed over the stored (compressed) bytes
+
+Modes:
+    - **auto** (or ``true``): choose the encoding per content type
+    - **gzip** / **zstd**: force one encoding for every compressible artefact
+    - anything else: compression disabled (reads still decode compressed data)
+
+Optional Dependencies:
+    zstd uses ``compression.zstd`` (Python 3.14+) or the ``zstandard`` package.
+    When neither is installed, gzip is used instead.
+"""
+
+from typing import Any, IO
+
+import os
+import gzip
+import shutil
+import tempfile
+import mimetypes
+
+from core_framework.common import get_artefact_compression
+
+ENCODING_GZIP = "gzip"
+ENCODING_ZSTD = "zstd"
+
+# Encodings this module can decode
+SUPPORTED_ENCODINGS = (ENCODING_GZIP, ENCODING_ZSTD)
+
+# Preferred encoding per content type in "auto" mode
+CONTENT_TYPE_ENCODINGS = {
+    "application/json": ENCODING_ZSTD,
+    "application/x-yaml": ENCODING_ZSTD,
+    "application/yaml": ENCODING_ZSTD,
+    "text/yaml": ENCODING_ZSTD,
+    "text/x-yaml": ENCODING_ZSTD,
+    "application/xml": ENCODING_ZSTD,
+    "text/xml": ENCODING_ZSTD,
+    "text/plain": ENCODING_GZIP,
+    "text/html": ENCODING_GZIP,
+    "text/css": ENCODING_GZIP,
+    "text/csv": ENCODING_GZIP,
+    "text/markdown": ENCODING_GZIP,
+    "text/javascript": ENCODING_GZIP,
+    "application/javascript": ENCODING_GZIP,
+    "image/svg+xml": ENCODING_GZIP,
+}
+
+# Content types of framework artefacts that mimetypes does not know about
+EXTENSION_CONTENT_TYPES = {
+    ".yaml": "application/yaml",
+    ".yml": "application/yaml",
+    ".actions": "application/json",
+    ".state": "application/json",
+}
+
+# Leading bytes of each encoding's stream format
+_MAGIC_NUMBERS = {
+    b"\x1f\x8b": ENCODING_GZIP,
+    b"\x28\xb5\x2f\xfd": ENCODING_ZSTD,
+}
+
+# Size of the chunks streamed through the compressors
+STREAM_CHUNK_SIZE = 64 * 1024
+
+# Bytes of a compressed upload kept in memory before spilling to a temporary file
+MAX_MEMORY_BODY_SIZE = 8 * 1024 * 1024
+
+_zstd_module: Any = None
+_zstd_checked = False
+
+
+def get_zstd() -> Any | None:
+    """Return the available zstd implementation, or None if zstd is unavailable.
+
+    Returns:
+        The ``compression.zstd`` or ``zstandard`` module.
+    """
+    global _zstd_module, _zstd_checked
+    if not _zstd_checked:
+        try:
+            from compression import zstd as module
+        except ImportError:
+            try:
+                import zstandard as module
+            except ImportError:
+                module = None
+        _zstd_module = module
+        _zstd_checked = True
+    return _zstd_module
+
+
+def guess_content_type(key: str) -> str | None:
+    """Guess the content type of an object from its key.
+
+    Args:
+        key: The object key.
+
+    Returns:
+        The content type, or None if unknown or if the key names a compressed
+        file (e.g. ``.json.gz``), whose bytes are not of that content type.
+    """
+    content_type, encoding = mimetypes.guess_type(os.path.basename(key))
+    if encoding is not None:
+        return None
+    if content_type is None:
+        _, ext = os.path.splitext(key)
+        content_type = EXTENSION_CONTENT_TYPES.get(ext.lower())
+    return content_type
+
+
+def choose_encoding(
+    key: str, content_type: str | None = None, mode: str | None = None
+) -> str | None:
+    """Choose the content encoding to store an object with.
+
+    Args:
+        key: The object key, used to guess the content type.
+        content_type: The content type if known.
+        mode: The compression mode. Defaults to ``get_artefact_compression()``.
+
+    Returns:
+        "gzip", "zstd" or None if the object should be stored uncompressed.
+    """
+    mode = mode if mode is not None else get_artefact_compression()
+    if not mode or is_encoded_key(key):
+        return None
+
+    content_type = (content_type or guess_content_type(key) or "").split(";")[0]
+    encoding = CONTENT_TYPE_ENCODINGS.get(content_type.strip().lower())
+    if encoding is None:
+        return None
+
+    if mode != "auto":
+        encoding = mode
+    if encoding == ENCODING_ZSTD and get_zstd() is None:
+        encoding = ENCODING_GZIP
+    return encoding
+
+
+def is_encoded_key(key: str) -> bool:
+    """True if the key names a compressed file, e.g. ``.json.gz`` or ``.svgz``.
+
+    Such objects are stored and read as is: this module never compresses them,
+    so their content is never decoded either.
+    """
+    _, encoding = mimetypes.guess_type(os.path.basename(key))
+    return encoding is not None
+
+
+def detect_encoding(header: bytes) -> str | None:
+    """Detect the encoding of a stored object from its leading bytes.
+
+    Args:
+        header: At least the first four bytes of the object.
+
+    Returns:
+        "gzip", "zstd" or None if the data is not compressed.
+    """
+    for magic, encoding in _MAGIC_NUMBERS.items():
+        if header.startswith(magic):
+            return encoding
+    return None
+
+
+def detect_file_encoding(file_path: str, key: str) -> str | None:
+    """Detect the encoding of a local object.
+
+    Only objects this module would have compressed are inspected (keys with a
+    compressible content type and no compression suffix), so objects stored as
+    gzip files (e.g. ``.tar.gz`` or ``.json.gz``) are not decoded.
+
+    Args:
+        file_path: Path of the stored object.
+        key: The object key.
+
+    Returns:
+        "gzip", "zstd" or None if the file is stored uncompressed.
+    """
+    if choose_encoding(key, mode="auto") is None:
+        return None
+    try:
+        with open(file_path, "rb") as f:
+            return detect_encoding(f.read(4))
+    except FileNotFoundError:
+        return None
+
+
+def open_compressor(fileobj: IO, encoding: str) -> IO:
+    """Open a writable stream that compresses into fileobj.
+
+    Closing the returned stream flushes the compressed data but leaves
+    fileobj open.
+
+    Args:
+        fileobj: Binary file-like object receiving compressed data.
+        encoding: "gzip" or "zstd".
+
+    Returns:
+        A writable binary stream.
+    """
+    if encoding == ENCODING_GZIP:
+        # mtime=0 keeps the output (and so the ETag) stable for the same content
+        return gzip.GzipFile(fileobj=fileobj, mode="wb", mtime=0)
+    if encoding == ENCODING_ZSTD:
+        zstd = get_zstd()
+        if hasattr(zstd, "ZstdFile"):
+            return zstd.ZstdFile(fileobj, mode="wb")
+        return zstd.ZstdCompressor().stream_writer(fileobj, closefd=False)
+    raise ValueError(f"Unsupported content encoding: {encoding}")
+
+
+def open_decompressor(fileobj: IO, encoding: str) -> IO:
+    """Open a readable stream that decompresses fileobj incrementally.
+
+    Args:
+        fileobj: Binary file-like object providing compressed data.
+        encoding: "gzip" or "zstd".
+
+    Returns:
+        A readable binary stream.
+
+    Raises:
+        ValueError: If the encoding is not supported or zstd is unavailable.
+    """
+    if encoding == ENCODING_GZIP:
+        return gzip.GzipFile(fileobj=fileobj, mode="rb")
+    if encoding == ENCODING_ZSTD:
+        zstd = get_zstd()
+        if zstd is None:
+            raise ValueError("zstd content encoding requires the zstandard package")
+        if hasattr(zstd, "ZstdFile"):
+            return zstd.ZstdFile(fileobj, mode="rb")
+        return zstd.ZstdDecompressor().stream_reader(
+            fileobj, read_across_frames=True, closefd=False
+        )
+    raise ValueError(f"Unsupported content encoding: {encoding}")
+
+
+def compress_file(source: str, target: str, encoding: str) -> None:
+    """Compress a file into another file.
+
+    Args:
+        source: Path of the uncompressed file.
+        target: Path of the compressed file to write.
+        encoding: "gzip" or "zstd".
+    """
+    with open(source, "rb") as src, open(target, "wb") as dst:
+        with open_compressor(dst, encoding) as writer:
+            shutil.copyfileobj(src, writer, STREAM_CHUNK_SIZE)
+
+
+def compress_body(body: Any, encoding: str) -> IO:
+    """Compress a put_object Body into a seekable binary stream.
+
+    Args:
+        body: A string, bytes, or readable binary file-like object.
+        encoding: "gzip" or "zstd".
+
+    Returns:
+        A binary stream positioned at the start of the compressed data. Small
+        bodies stay in memory; large ones spill to a temporary file.
+    """
+    output = tempfile.SpooledTemporaryFile(max_size=MAX_MEMORY_BODY_SIZE)
+    with open_compressor(output, encoding) as writer:
+        if isinstance(body, str):
+            writer.write(body.encode("utf-8"))
+        elif isinstance(body, (bytes, bytearray, memoryview)):
+            writer.write(body)
+        else:
+            shutil.copyfileobj(body, writer, STREAM_CHUNK_SIZE)
+    output.seek(0)
+    return output
+
+
+class DecodingStreamingBody:
+    """Streaming body that decompresses a compressed object body as it is read.
+
+    Provides the read/close/context-manager interface of boto3's StreamingBody
+    over the decoded content.
+
+    Attributes:
+        encoding: The content encoding being decoded.
+    """
+
+    def __init__(self, raw: Any, encoding: str):
+        """Initialize the body.
+
+        Args:
+            raw: The compressed streaming body.
+            encoding: "gzip" or "zstd".
+        """
+        self.encoding = encoding
+        self._raw = raw
+        self._reader = open_decompressor(raw, encoding)
+        self._closed = False
+
+    def read(self, amt: int | None = None) -> bytes:
+        """Read up to amt decoded bytes, or everything if amt is None."""
+        if self._closed:
+            raise ValueError("I/O operation on closed file.")
+        return self._reader.read(-1 if amt is None else amt)
+
+    def iter_chunks(self, chunk_size: int = STREAM_CHUNK_SIZE):
+        """Yield decoded chunks of up to chunk_size bytes."""
+        while True:
+            chunk = self.read(chunk_size)
+            if not chunk:
+                break
+            yield chunk
+
+    def readable(self) -> bool:
+        return True
+
+    def close(self) -> None:
+        """Close the decoder and the underlying body."""
+        if not self._closed:
+            self._closed = True
+            self._reader.close()
+            self._raw.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def __iter__(self):
+        return self.iter_chunks()
+
+    @property
+    def closed(self) -> bool:
+        """True if the body has been closed."""
+        return self._closed
+
+
+def decode_response(response: dict, key: str = "", ranged: bool = False) -> dict:
+    """Replace the Body of a get_object response with a decoding stream.
+
+    Ranged reads return the raw encoded bytes: a byte range cut out of a gzip
+    or zstd stream cannot be decoded on its own.
+
+    Args:
+        response: A get_object response.
+        key: The object key. Keys naming a compressed file (see
+            is_encoded_key) are returned as stored.
+        ranged: True if the request carried a ``Range``. Responses with a
+            ``ContentRange`` are treated as ranged too.
+
+    Returns:
+        The same response with a DecodingStreamingBody when the object has a
+        supported ContentEncoding and the whole object was read.
+    """
+    encoding = (response.get("ContentEncoding") or "").lower()
+    if (
+        encoding in SUPPORTED_ENCODINGS
+        and response.get("Body") is not None
+        and not is_encoded_key(key)
+        and not ranged
+        and not response.get("ContentRange")
+    ):
+        response["Body"] = DecodingStreamingBody(response["Body"], encoding)
+    return response
+
+
+class CompressingS3Client:
+    """Proxy around a boto3 S3 client that compresses artefacts transparently.
+
+    ``put_object`` compresses compressible bodies and sets ``ContentEncoding``
+    unless the caller already set it. ``get_object`` and ``download_fileobj``
+    decode gzip and zstd objects, except for ranged reads which return the
+    stored bytes. Every other attribute is delegated to the wrapped client.
+    """
+
+    def __init__(self, client: Any, mode: str | None = None):
+        """Initialize the proxy.
+
+        Args:
+            client: The boto3 S3 client (or CachedS3Client) to wrap.
+            mode: The compression mode. Defaults to ``get_artefact_compression()``.
+        """
+        self._client = client
+        self._mode = mode
+
+    def put_object(self, **kwargs) -> dict:
+        """Put an object, compressing the body if its content type allows it."""
+        if "ContentEncoding" not in kwargs and kwargs.get("Body") is not None:
+            encoding = choose_encoding(
+                kwargs.get("Key", ""), kwargs.get("ContentType"), self._mode
+            )
+            if encoding:
+                kwargs["Body"] = compress_body(kwargs["Body"], encoding)
+                kwargs["ContentEncoding"] = encoding
+        return self._client.put_object(**kwargs)
+
+    def get_object(self, **kwargs) -> dict:
+        """Get an object, decoding its body if it is compressed."""
+        return decode_response(
+            self._client.get_object(**kwargs), kwargs.get("Key", ""), "Range" in kwargs
+        )
+
+    def download_fileobj(self, Bucket: str, Key: str, Fileobj: IO, **kwargs) -> None:
+        """Download an object into a file-like object, decoding compressed content."""
+        if kwargs:
+            return self._client.download_fileobj(Bucket, Key, Fileobj, **kwargs)
+        with self.get_object(Bucket=Bucket, Key=Key)["Body"] as body:
+            shutil.copyfileobj(body, Fileobj, STREAM_CHUNK_SIZE)
+
+    def upload_fileobj(
+        self,
+        Fileobj: IO,
+        Bucket: str,
+        Key: str,
+        ExtraArgs: dict | None = None,
+        **kwargs,
+    ) -> None:
+        """Upload a file-like object, compressing it if its content type allows it."""
+        extra_args = dict(ExtraArgs or {})
+        if "ContentEncoding" not in extra_args:
+            encoding = choose_encoding(Key, extra_args.get("ContentType"), self._mode)
+            if encoding:
+                Fileobj = compress_body(Fileobj, encoding)
+                extra_args["ContentEncoding"] = encoding
+        return self._client.upload_fileobj(
+            Fileobj=Fileobj, Bucket=Bucket, Key=Key, ExtraArgs=extra_args, **kwargs
+        )
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._client, name)
+
+
+class CompressingS3Bucket:
+    """Proxy around a boto3 S3 Bucket resource that compresses artefacts transparently.
+
+    Provides compressing ``put_object`` and decoding ``get_object`` and
+    ``download_fileobj`` for the bucket and delegates every other attribute to
+    the wrapped bucket.
+    """
+
+    def __init__(self, bucket: Any, mode: str | None = None):
+        """Initialize the proxy.
+
+        Args:
+            bucket: The boto3 S3 Bucket resource (or CachedS3Bucket) to wrap.
+            mode: The compression mode. Defaults to ``get_artefact_compression()``.
+        """
+        self._bucket = bucket
+        self._mode = mode
+
+    def put_object(self, **kwargs) -> Any:
+        """Put an object, compressing the body if its content type allows it."""
+        if "ContentEncoding" not in kwargs and kwargs.get("Body") is not None:
+            encoding = choose_encoding(
+                kwargs.get("Key", ""), kwargs.get("ContentType"), self._mode
+            )
+            if encoding:
+                kwargs["Body"] = compress_body(kwargs["Body"], encoding)
+                kwargs["ContentEncoding"] = encoding
+        return self._bucket.put_object(**kwargs)
+
+    def get_object(self, **kwargs) -> dict:
+        """Get an object from this bucket, decoding its body if it is compressed."""
+        if hasattr(self._bucket, "get_object"):
+            return decode_response(
+                self._bucket.get_object(**kwargs),
+                kwargs.get("Key", ""),
+                "Range" in kwargs,
+            )
+        client = self._bucket.meta.client
+        return decode_response(
+            client.get_object(Bucket=self._bucket.name, **kwargs),
+            kwargs.get("Key", ""),
+            "Range" in kwargs,
+        )
+
+    def download_fileobj(self, Key: str, Fileobj: IO, **kwargs) -> None:
+        """Download an object into a file-like object, decoding compressed content."""
+        if kwargs:
+            return self._bucket.download_fileobj(Key, Fileobj, **kwargs)
+        with self.get_object(Key=Key)["Body"] as body:
+            shutil.copyfileobj(body, Fileobj, STREAM_CHUNK_SIZE)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._bucket, name)
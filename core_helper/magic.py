@@ -12,17 +12,21 @@ Key Features:
     - **Streaming Support**: Emulates boto3 StreamingBody with file-like interface
     - **Metadata Emulation**: Generates ETag, version ID, and content type locally
     - **Error Handling**: Consistent error responses matching S3 behavior
+    - **Compression**: Optional transparent gzip/zstd compression of artefacts
+      (see core_helper.compression)
 
 Components:
     - **FileStreamingBody**: Emulates boto3's StreamingBody for file reading
     - **MagicObject**: Emulates S3 Object with filesystem operations
     - **MagicBucket**: Emulates S3 Bucket with object management
     - **MagicS3Client**: Emulates S3 Client with bucket operations
+    - **LocalObjectStore**: Lightweight per-object operations used by MagicS3Client
     - **SeekableStreamWrapper**: Adds seek functionality to streaming bodies
 
 Configuration:
     The module uses core_framework configuration to determine whether to use
-    real S3 or local filesystem storage via the is_use_s3() function.
+    real S3 or local filesystem storage via the is_use_s3() function, and
+    whether to compress artefacts via the get_artefact_compression() function.
 
 Integration:
     Designed to work seamlessly with the Core Automation framework's storage
@@ -32,21 +36,81 @@ Integration:
 from typing import Any, Self
 
 import os
+import bisect
 import shutil
+import tempfile
 import mimetypes
 import hashlib
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
 
-from pydantic import BaseModel, Field, ConfigDict
+from pydantic import BaseModel, Field, ConfigDict, PrivateAttr
 
 from core_framework.common import (
     get_storage_volume,
     get_bucket_name,
     get_region,
     is_use_s3,
+    get_artefact_compression,
 )
 
 import core_helper.aws as aws
+from core_helper.s3_cache import CachedS3Bucket, CachedS3Client
+from core_helper.compression import (
+    CompressingS3Bucket,
+    CompressingS3Client,
+    DecodingStreamingBody,
+    choose_encoding,
+    compress_file,
+    detect_file_encoding,
+    open_compressor,
+    open_decompressor,
+)
+
+# Maximum number of keys S3 accepts in a single DeleteObjects request
+MAX_DELETE_OBJECTS = 1000
+
+# Default number of worker threads used for batch filesystem operations
+DEFAULT_MAX_WORKERS = 16
+
+# Maximum number of file ETags remembered by a LocalObjectStore
+MAX_ETAG_CACHE_ENTRIES = 10000
+
+# Bytes SeekableStreamWrapper keeps in memory before spilling to a temporary file
+DEFAULT_SPILL_THRESHOLD = 64 * 1024 * 1024
+
+
+def generate_file_hash(file_path: str, hash_algorithm: str = "sha256") -> str:
+    """Generate a hash of a file for ETag emulation.
+
+    Reads the file in chunks to efficiently compute hash for large files,
+    providing an ETag-like identifier for local files.
+
+    Args:
+        file_path: The path to the file to hash.
+        hash_algorithm: The hash algorithm to use. Defaults to 'sha256'.
+
+    Returns:
+        The hexadecimal hash of the file content.
+    """
+    hash_func = hashlib.new(hash_algorithm)
+
+    with open(file_path, "rb") as f:
+        for chunk in iter(lambda: f.read(65536), b""):
+            hash_func.update(chunk)
+
+    return hash_func.hexdigest()
+
+
+def _copy_decoded(file_path: str, key: str, fileobj: Any) -> None:
+    """Copy a stored object into a file-like object, decoding compressed content."""
+    encoding = detect_file_encoding(file_path, key)
+    with open(file_path, "rb") as file:
+        if encoding:
+            with open_decompressor(file, encoding) as reader:
+                shutil.copyfileobj(reader, fileobj)
+        else:
+            shutil.copyfileobj(file, fileobj)
 
 
 class FileStreamingBody:
@@ -163,6 +227,7 @@ class MagicObject(BaseModel):
         data_path: The root directory for local storage.
         version_id: Emulated version ID using file modification time.
         content_type: MIME type of the object determined from file extension.
+        content_encoding: Compression of the stored object (gzip or zstd).
         etag: Emulated ETag using file hash.
         error: Any error message encountered during operations.
         body: The object body content for streaming operations.
@@ -175,6 +240,7 @@ class MagicObject(BaseModel):
     data_path: str = Field(default_factory=get_storage_volume, alias="DataPath")
     version_id: str | None = Field(default=None, alias="VersionId")
     content_type: str | None = Field(default=None, alias="ContentType")
+    content_encoding: str | None = Field(default=None, alias="ContentEncoding")
     etag: str | None = Field(default=None, alias="ETag")
     error: str | None = Field(default=None, alias="Error")
     body: Any | None = Field(default=None, alias="Body")
@@ -195,8 +261,9 @@ class MagicObject(BaseModel):
 
         Notes:
             - Version ID is generated from file modification timestamp
-            - ETag is generated using SHA256 hash of file content
+            - ETag is generated using SHA256 hash of the stored (compressed) content
             - Content type is determined from file extension
+            - Content encoding is detected from the stored content
             - Missing files result in None values for version_id and etag
         """
         try:
@@ -210,9 +277,11 @@ class MagicObject(BaseModel):
                 # get the timestamp of the file
                 self.version_id = str(int(os.stat(fn).st_mtime))
                 self.etag = self.generate_file_hash(fn)
+                self.content_encoding = detect_file_encoding(fn, self.key)
             else:
                 self.version_id = None
                 self.etag = None
+                self.content_encoding = None
 
             self.content_type, _ = mimetypes.guess_type(os.path.basename(self.key))
 
@@ -238,24 +307,19 @@ class MagicObject(BaseModel):
             IOError: If the file cannot be read.
             ValueError: If the hash algorithm is not supported.
         """
-        hash_func = hashlib.new(hash_algorithm)
-
-        with open(file_path, "rb") as f:
-            for chunk in iter(lambda: f.read(4096), b""):
-                hash_func.update(chunk)
-
-        return hash_func.hexdigest()
+        return generate_file_hash(file_path, hash_algorithm)
 
     def copy_from(self, **kwargs) -> dict:
         """Emulate the S3 copy_from() method to copy an object locally.
 
-        Copies an object from one location to another within the same bucket
-        using filesystem operations. Maintains S3 API compatibility for
-        copy operations.
+        Copies an object from any bucket in the local storage volume to this
+        object's location using filesystem operations. Maintains S3 API
+        compatibility for copy operations.
 
         Args:
             **kwargs: Keyword arguments.
-                CopySource (dict): Dictionary containing source bucket and key.
+                CopySource (dict | str): Dictionary containing source bucket and key,
+                    or a "bucket/key" string.
                     Bucket (str): The source bucket name.
                     Key (str): The source object key.
 
@@ -269,7 +333,7 @@ class MagicObject(BaseModel):
             OSError: If the file copy operation fails.
 
         Notes:
-            - Source and destination must be in the same bucket
+            - Source and destination may be in different buckets
             - Creates target directory structure as needed
             - Updates object metadata after successful copy
         """
@@ -278,8 +342,12 @@ class MagicObject(BaseModel):
             if not source:
                 raise ValueError("Copy source 'CopySource' is required")
 
-            source_bucket = source.get("Bucket", None)
-            source_key = source.get("Key", None)
+            if isinstance(source, str):
+                # boto3 also accepts "bucket/key" for the copy source
+                source_bucket, _, source_key = source.lstrip("/").partition("/")
+            else:
+                source_bucket = source.get("Bucket", None)
+                source_key = source.get("Key", None)
 
             if not source_bucket:
                 raise ValueError("Source bucket 'Bucket' is required")
@@ -290,11 +358,6 @@ class MagicObject(BaseModel):
             if not self.key:
                 raise ValueError("Destination Bucket key has not been specified")
 
-            if source_bucket != self.bucket_name:
-                raise ValueError(
-                    f"Source S3 bucket '{source_bucket}' must be in same bucket as the target '{self.bucket_name}'"
-                )
-
             source_fn = os.path.join(self.data_path, source_bucket, source_key)
             target_fn = os.path.join(self.data_path, self.bucket_name, self.key)
 
@@ -349,6 +412,7 @@ class MagicObject(BaseModel):
 
         Notes:
             - Resets fileobj position to 0 after writing
+            - Compressed objects are decoded while copying
             - Updates object metadata after successful download
             - Supports any file-like object with write() method
         """
@@ -364,8 +428,7 @@ class MagicObject(BaseModel):
                 raise ValueError("Fileobj is required")
 
             if os.path.exists(key):
-                with open(key, "rb") as file:
-                    fileobj.write(file.read())
+                _copy_decoded(key, self.key, fileobj)
                 fileobj.seek(0)
 
             self.head_object()
@@ -387,6 +450,8 @@ class MagicObject(BaseModel):
                 Key (str): The key (path) of the object within the bucket.
                 Body (IO | str | bytes): The content to store.
                 Filename (str): Alternative to Body - path to a local file to upload.
+                ContentEncoding (str): Set when Body is already encoded. Disables
+                    transparent compression for this call.
 
         Returns:
             Self with updated metadata after the put operation.
@@ -401,6 +466,7 @@ class MagicObject(BaseModel):
             - Creates target directory structure automatically
             - Preserves file metadata when using Filename parameter
             - Automatically closes file-like objects after processing
+            - Compresses compressible content when ARTEFACT_COMPRESSION is enabled
             - Updates object metadata after successful storage
         """
         try:
@@ -408,6 +474,10 @@ class MagicObject(BaseModel):
             if not self.key:
                 raise ValueError("Key is required")
 
+            encoding = None
+            if "ContentEncoding" not in kwargs:
+                encoding = choose_encoding(self.key, kwargs.get("ContentType"))
+
             # Check for Filename parameter (used by MagicBucket)
             filename = kwargs.get("Filename")
             if filename:
@@ -415,7 +485,10 @@ class MagicObject(BaseModel):
                 fn = os.path.join(self.data_path, self.bucket_name, self.key)
                 dirname = os.path.dirname(fn)
                 os.makedirs(dirname, exist_ok=True)
-                shutil.copy2(filename, fn)  # Preserves metadata
+                if encoding:
+                    compress_file(filename, fn, encoding)
+                else:
+                    shutil.copy2(filename, fn)  # Preserves metadata
                 self.head_object()
                 return self
 
@@ -432,11 +505,22 @@ class MagicObject(BaseModel):
                 # File-like object (includes BufferedReader, IO streams, etc.)
                 try:
                     with open(fn, "wb") as file:
-                        shutil.copyfileobj(body, file)
+                        if encoding:
+                            with open_compressor(file, encoding) as writer:
+                                shutil.copyfileobj(body, writer)
+                        else:
+                            shutil.copyfileobj(body, file)
                 finally:
                     # Safely close the body if it has a close method
                     if hasattr(body, "close"):
                         body.close()
+            elif encoding and isinstance(body, (str, bytes)):
+                # String or binary content, compressed
+                if isinstance(body, str):
+                    body = body.encode("utf-8")
+                with open(fn, "wb") as file:
+                    with open_compressor(file, encoding) as writer:
+                        writer.write(body)
             elif isinstance(body, str):
                 # String content
                 with open(fn, "w", encoding="utf-8") as file:
@@ -474,8 +558,9 @@ class MagicObject(BaseModel):
             FileNotFoundError: If the object doesn't exist.
 
         Notes:
-            - Returns a FileStreamingBody in the 'Body' field
-            - Includes all object metadata (ETag, ContentType, etc.)
+            - Returns a FileStreamingBody in the 'Body' field, decoding compressed
+              objects on the fly
+            - Includes all object metadata (ETag, ContentType, ContentEncoding, etc.)
             - Maintains S3 API response format compatibility
             - Streaming body supports context manager usage
         """
@@ -491,10 +576,12 @@ class MagicObject(BaseModel):
                     f"Object {self.key} does not exist in bucket {self.bucket_name}"
                 )
 
+            self.head_object()
+
             # the get_object method returns a stream in the Body field
             self.body = FileStreamingBody(key)
-
-            self.head_object()
+            if self.content_encoding:
+                self.body = DecodingStreamingBody(self.body, self.content_encoding)
 
         except Exception as e:
             self.error = "\n".join([self.error or "", str(e)])
@@ -654,6 +741,92 @@ class MagicBucket(BaseModel):
         obj = self.Object(key)
         return obj.delete_object(**kwargs).model_dump(exclude_none=True, by_alias=True)
 
+    def delete_objects(self, **kwargs) -> dict:
+        """Emulate the S3 delete_objects() method at bucket level.
+
+        Removes up to 1000 objects in one call. The individual file deletions
+        are executed concurrently on a thread pool so that tearing down a
+        branch with thousands of artefacts is a single round of parallel
+        filesystem operations.
+
+        Args:
+            **kwargs: Keyword arguments.
+                Delete (dict): The delete request.
+                    Objects (list[dict]): List of ``{"Key": str}`` entries to delete.
+                    Quiet (bool): If True, only errors are reported.
+                MaxWorkers (int): Number of worker threads. Optional.
+
+        Returns:
+            A dictionary in the S3 DeleteObjects response shape with ``Deleted``
+            and ``Errors`` lists.
+
+        Raises:
+            ValueError: If no objects are specified or more than 1000 keys are requested.
+
+        Notes:
+            - Deleting a key that does not exist is reported as ``Deleted``, as S3 does
+            - Results are reported in the same order as the requested keys
+        """
+        delete = kwargs.get("Delete") or {}
+        objects = delete.get("Objects") or []
+        quiet = delete.get("Quiet", False)
+
+        if not objects:
+            raise ValueError("Delete 'Objects' is required")
+
+        if len(objects) > MAX_DELETE_OBJECTS:
+            raise ValueError(
+                f"Cannot delete more than {MAX_DELETE_OBJECTS} objects in a single request"
+            )
+
+        data_path = self.data_path or get_storage_volume()
+        max_workers = kwargs.get("MaxWorkers", DEFAULT_MAX_WORKERS)
+
+        def _delete(item: dict) -> tuple[dict | None, dict | None]:
+            key = item.get("Key") if isinstance(item, dict) else None
+            if not key:
+                return None, {
+                    "Key": key,
+                    "Code": "InvalidArgument",
+                    "Message": "Key is required",
+                }
+            try:
+                os.remove(os.path.join(data_path, self.name, key))
+            except FileNotFoundError:
+                pass
+            except PermissionError as e:
+                return None, {"Key": key, "Code": "AccessDenied", "Message": str(e)}
+            except OSError as e:
+                return None, {"Key": key, "Code": "InternalError", "Message": str(e)}
+            return {"Key": key}, None
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(_delete, objects))
+
+        rv: dict = {"Errors": [error for _, error in results if error]}
+        if not quiet:
+            rv["Deleted"] = [deleted for deleted, _ in results if deleted]
+
+        return rv
+
+    def copy_object(self, **kwargs) -> dict:
+        """Emulate the S3 copy_object() method at bucket level.
+
+        Delegates to a MagicObject to copy an object from any bucket in the
+        local storage volume into this bucket.
+
+        Args:
+            **kwargs: Keyword arguments.
+                Key (str): The destination key in this bucket.
+                CopySource (dict | str): The source bucket and key.
+
+        Returns:
+            A dictionary emulating the S3 CopyObjectResult.
+        """
+        key = kwargs.pop("Key", None)
+        obj = self.Object(key)
+        return obj.copy_from(**kwargs)
+
     def Object(self, key: str | None) -> MagicObject:
         """Create a MagicObject instance for the specified key.
 
@@ -672,6 +845,164 @@ class MagicBucket(BaseModel):
             return MagicObject(Bucket=self.name, Key=key)
 
 
+class LocalObjectStore:
+    """Lightweight, non-pydantic implementation of the local S3 object operations.
+
+    MagicS3Client uses this class for its per-object calls so that tight loops over
+    thousands of keys do not construct MagicBucket/MagicObject models, resolve
+    configuration or call ``model_dump`` on every request. The storage volume is
+    resolved once when the store is created and every method returns a plain
+    dictionary in the same shape as the equivalent MagicObject ``model_dump``.
+
+    ETags and content encodings are cached per file and revalidated by modification
+    time and size, so repeated head_object calls on unchanged files do not re-hash
+    their content.
+
+    Attributes:
+        data_path: The root directory for local storage.
+    """
+
+    __slots__ = ("data_path", "_etags")
+
+    def __init__(self, data_path: str):
+        """Initialize the store.
+
+        Args:
+            data_path: The root directory for local storage.
+        """
+        self.data_path = data_path
+        # Storage format: {file_path: (st_mtime_ns, st_size, etag, content_encoding)}
+        self._etags: dict[str, tuple[int, int, str, str | None]] = {}
+
+    def head_object(self, bucket: str, key: str | None) -> dict:
+        """Get object metadata.
+
+        Args:
+            bucket: The bucket name.
+            key: The object key.
+
+        Returns:
+            A dictionary of the object's metadata in S3 format.
+        """
+        rv = {"Bucket": bucket, "Key": key, "DataPath": self.data_path}
+        try:
+            self._head(rv, self._path(bucket, key))
+        except Exception as e:
+            rv["Error"] = "\n" + str(e)
+        return rv
+
+    def get_object(self, bucket: str, key: str | None) -> dict:
+        """Get object metadata and a streaming body.
+
+        Args:
+            bucket: The bucket name.
+            key: The object key.
+
+        Returns:
+            A dictionary of the object's metadata with a FileStreamingBody in ``Body``.
+        """
+        rv = {"Bucket": bucket, "Key": key, "DataPath": self.data_path}
+        try:
+            fn = self._path(bucket, key)
+            if not os.path.exists(fn):
+                raise FileNotFoundError(
+                    f"Object {key} does not exist in bucket {bucket}"
+                )
+            self._head(rv, fn)
+            body = FileStreamingBody(fn)
+            encoding = rv.get("ContentEncoding")
+            rv["Body"] = DecodingStreamingBody(body, encoding) if encoding else body
+        except Exception as e:
+            rv["Error"] = "\n" + str(e)
+        return rv
+
+    def download_fileobj(self, bucket: str, key: str | None, fileobj: Any) -> dict:
+        """Copy object content into a file-like object.
+
+        Args:
+            bucket: The bucket name.
+            key: The object key.
+            fileobj: File-like object to write the content to.
+
+        Returns:
+            A dictionary of the object's metadata after download.
+        """
+        rv = {"Bucket": bucket, "Key": key, "DataPath": self.data_path}
+        try:
+            fn = self._path(bucket, key)
+            if fileobj is None:
+                raise ValueError("Fileobj is required")
+            if os.path.exists(fn):
+                _copy_decoded(fn, key, fileobj)
+                fileobj.seek(0)
+            self._head(rv, fn)
+        except Exception as e:
+            rv["Error"] = "\n" + str(e)
+        return rv
+
+    def delete_object(self, bucket: str, key: str | None) -> dict:
+        """Delete an object.
+
+        Args:
+            bucket: The bucket name.
+            key: The object key.
+
+        Returns:
+            A dictionary indicating the result of the delete operation.
+        """
+        rv = {"Bucket": bucket, "Key": key, "DataPath": self.data_path}
+        try:
+            fn = self._path(bucket, key)
+            self._etags.pop(fn, None)
+            try:
+                os.remove(fn)
+            except FileNotFoundError:
+                raise FileNotFoundError(
+                    f"Object {key} does not exist in bucket {bucket}"
+                )
+        except Exception as e:
+            rv["Error"] = "\n" + str(e)
+        return rv
+
+    def _path(self, bucket: str, key: str | None) -> str:
+        """Resolve the file path of an object.
+
+        Raises:
+            ValueError: If the bucket or key is missing.
+        """
+        if not bucket:
+            raise ValueError("Bucket is required")
+        if not key:
+            raise ValueError("Key is required")
+        return os.path.join(self.data_path, bucket, key)
+
+    def _head(self, rv: dict, fn: str) -> None:
+        """Populate VersionId, ETag, ContentEncoding and ContentType for a file into rv."""
+        try:
+            st = os.stat(fn)
+        except FileNotFoundError:
+            st = None
+
+        if st is not None:
+            rv["VersionId"] = str(int(st.st_mtime))
+            cached = self._etags.get(fn)
+            if cached and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+                rv["ETag"], encoding = cached[2], cached[3]
+            else:
+                etag = generate_file_hash(fn)
+                encoding = detect_file_encoding(fn, rv["Key"])
+                if len(self._etags) >= MAX_ETAG_CACHE_ENTRIES:
+                    self._etags.clear()
+                self._etags[fn] = (st.st_mtime_ns, st.st_size, etag, encoding)
+                rv["ETag"] = etag
+            if encoding:
+                rv["ContentEncoding"] = encoding
+
+        content_type, _ = mimetypes.guess_type(os.path.basename(rv["Key"]))
+        if content_type:
+            rv["ContentType"] = content_type
+
+
 class MagicS3Client(BaseModel):
     """Emulate an S3 client to allow local filesystem storage via the S3 API.
 
@@ -682,6 +1013,10 @@ class MagicS3Client(BaseModel):
     Supports both bucket operations and direct object operations, acting as
     the top-level interface for S3-like operations on local storage.
 
+    The storage volume is resolved once when the client is created. Per-object
+    read and delete calls go through a LocalObjectStore and return plain
+    dictionaries without constructing MagicBucket/MagicObject models.
+
     Attributes:
         region: The AWS region (maintained for API compatibility).
         role_arn: The ARN of the role to assume (maintained for API compatibility).
@@ -704,11 +1039,17 @@ class MagicS3Client(BaseModel):
         description="The local storage path if not using S3.",
     )
 
+    _store: LocalObjectStore = PrivateAttr()
+
+    def model_post_init(self, __context: Any) -> None:
+        """Resolve the storage volume once for all operations of this client."""
+        self._store = LocalObjectStore(self.data_path or get_storage_volume())
+
     def head_object(self, **kwargs) -> dict:
         """Emulate the S3 client.head_object() method.
 
-        Provides client-level access to object metadata operations by
-        delegating to the appropriate bucket instance.
+        Provides client-level access to object metadata operations through
+        the lightweight LocalObjectStore.
 
         Args:
             **kwargs: Keyword arguments.
@@ -718,15 +1059,29 @@ class MagicS3Client(BaseModel):
         Returns:
             A dictionary of the object's metadata.
         """
-        bucket_name = kwargs.pop("Bucket", None)
-        bucket = self.Bucket(bucket_name)
-        return bucket.head_object(**kwargs)
+        return self._store.head_object(kwargs.get("Bucket"), kwargs.get("Key"))
+
+    def get_object(self, **kwargs) -> dict:
+        """Emulate the S3 client.get_object() method.
+
+        Provides client-level access to object retrieval through the
+        lightweight LocalObjectStore.
+
+        Args:
+            **kwargs: Keyword arguments.
+                Bucket (str): The name of the bucket.
+                Key (str): The key of the object to retrieve.
+
+        Returns:
+            A dictionary of the object's metadata and streaming body.
+        """
+        return self._store.get_object(kwargs.get("Bucket"), kwargs.get("Key"))
 
     def download_fileobj(self, **kwargs) -> dict:
         """Emulate the S3 client.download_fileobj() method.
 
-        Provides client-level access to object download operations by
-        delegating to the appropriate bucket instance.
+        Provides client-level access to object download operations through
+        the lightweight LocalObjectStore.
 
         Args:
             **kwargs: Keyword arguments.
@@ -737,9 +1092,9 @@ class MagicS3Client(BaseModel):
         Returns:
             A dictionary of the object's metadata after download.
         """
-        bucket_name = kwargs.pop("Bucket", None)
-        bucket = self.Bucket(bucket_name)
-        return bucket.download_fileobj(**kwargs)
+        return self._store.download_fileobj(
+            kwargs.get("Bucket"), kwargs.get("Key"), kwargs.get("Fileobj")
+        )
 
     def put_object(self, **kwargs) -> MagicObject:
         """Emulate the S3 client.put_object() method.
@@ -764,11 +1119,38 @@ class MagicS3Client(BaseModel):
         bucket = self.Bucket(bucket_name)
         return bucket.put_object(**kwargs)
 
+    def upload_fileobj(self, **kwargs) -> None:
+        """Emulate the S3 client.upload_fileobj() method.
+
+        The file-like object is streamed to local storage, so readers producing
+        their content on demand are never held in memory.
+
+        Args:
+            **kwargs: Keyword arguments.
+                Fileobj (IO): Readable binary file-like object to upload.
+                Bucket (str): The name of the bucket.
+                Key (str): The key of the object to write.
+                ExtraArgs (dict): Additional put_object arguments such as
+                    ContentType or ContentEncoding.
+
+        Raises:
+            OSError: If the object could not be written.
+        """
+        extra_args = kwargs.get("ExtraArgs") or {}
+        result = self.put_object(
+            Bucket=kwargs.get("Bucket"),
+            Key=kwargs.get("Key"),
+            Body=kwargs.get("Fileobj"),
+            **extra_args,
+        )
+        if result.error:
+            raise OSError(result.error.strip())
+
     def delete_object(self, **kwargs) -> dict:
         """Emulate the S3 client.delete_object() method.
 
-        Provides client-level access to object deletion operations by
-        delegating to the appropriate bucket instance.
+        Provides client-level access to object deletion operations through
+        the lightweight LocalObjectStore.
 
         Args:
             **kwargs: Keyword arguments.
@@ -778,9 +1160,44 @@ class MagicS3Client(BaseModel):
         Returns:
             A dictionary indicating the result of the delete operation.
         """
+        return self._store.delete_object(kwargs.get("Bucket"), kwargs.get("Key"))
+
+    def delete_objects(self, **kwargs) -> dict:
+        """Emulate the S3 client.delete_objects() method.
+
+        Provides client-level access to batch object deletion by delegating
+        to the appropriate bucket instance.
+
+        Args:
+            **kwargs: Keyword arguments.
+                Bucket (str): The name of the bucket.
+                Delete (dict): The delete request with ``Objects`` and ``Quiet``.
+
+        Returns:
+            A dictionary with ``Deleted`` and ``Errors`` lists.
+        """
         bucket_name = kwargs.pop("Bucket", None)
         bucket = self.Bucket(bucket_name)
-        return bucket.delete_object(**kwargs)
+        return bucket.delete_objects(**kwargs)
+
+    def copy_object(self, **kwargs) -> dict:
+        """Emulate the S3 client.copy_object() method.
+
+        Copies an object between buckets of the local storage volume by
+        delegating to the destination bucket instance.
+
+        Args:
+            **kwargs: Keyword arguments.
+                Bucket (str): The destination bucket name.
+                Key (str): The destination key.
+                CopySource (dict | str): The source bucket and key.
+
+        Returns:
+            A dictionary emulating the S3 CopyObjectResult.
+        """
+        bucket_name = kwargs.pop("Bucket", None)
+        bucket = self.Bucket(bucket_name)
+        return bucket.copy_object(**kwargs)
 
     def Bucket(self, bucket_name: str) -> MagicBucket:
         """Create a MagicBucket instance for the specified bucket name.
@@ -794,11 +1211,15 @@ class MagicS3Client(BaseModel):
         Returns:
             A MagicBucket instance configured for the specified bucket.
         """
-        return MagicBucket(Bucket=bucket_name, DataPath=self.data_path)
+        return MagicBucket(Bucket=bucket_name, DataPath=self._store.data_path)
 
     @staticmethod
     def get_bucket(
-        Region: str, BucketName: str, RoleArn: str = None, DataPath: str | None = None
+        Region: str,
+        BucketName: str,
+        RoleArn: str = None,
+        DataPath: str | None = None,
+        UseCache: bool = False,
     ) -> Any:
         """Get a Bucket object, either real S3 or MagicBucket based on configuration.
 
@@ -811,10 +1232,13 @@ class MagicS3Client(BaseModel):
             BucketName: The name of the bucket.
             RoleArn: The ARN of the role to assume for the client. Optional.
             DataPath: The local storage path if not using S3. Optional.
+            UseCache: Serve object reads through the on-disk ETag-validated
+                cache when using S3. Optional.
 
         Returns:
-            Either a boto3 S3 Bucket or a MagicBucket instance depending
-            on configuration.
+            Either a boto3 S3 Bucket (wrapped in a CachedS3Bucket when UseCache
+            is set and a CompressingS3Bucket when artefact compression is
+            enabled) or a MagicBucket instance depending on configuration.
 
         Notes:
             - Uses is_use_s3() to determine which implementation to return
@@ -826,6 +1250,10 @@ class MagicS3Client(BaseModel):
         if is_use_s3():
             s3 = aws.s3_resource(region=Region, role_arn=RoleArn)
             bucket = s3.Bucket(BucketName)
+            if UseCache:
+                bucket = CachedS3Bucket(bucket)
+            if get_artefact_compression():
+                bucket = CompressingS3Bucket(bucket)
         else:
             local = MagicS3Client(Region=Region, RoleArn=RoleArn, DataPath=DataPath)
             bucket = local.Bucket(BucketName)
@@ -834,7 +1262,10 @@ class MagicS3Client(BaseModel):
 
     @staticmethod
     def get_client(
-        Region: str, RoleArn: str = None, DataPath: str | None = None
+        Region: str,
+        RoleArn: str = None,
+        DataPath: str | None = None,
+        UseCache: bool = False,
     ) -> Any:
         """Get an S3 client, either real boto3 or MagicS3Client based on configuration.
 
@@ -845,10 +1276,13 @@ class MagicS3Client(BaseModel):
             Region: The AWS region for the client.
             RoleArn: The ARN of the role to assume for the client. Optional.
             DataPath: The local storage path if not using S3. Optional.
+            UseCache: Serve object reads through the on-disk ETag-validated
+                cache when using S3. Optional.
 
         Returns:
-            Either a boto3 S3 client or a MagicS3Client instance depending
-            on configuration.
+            Either a boto3 S3 client (wrapped in a CachedS3Client when UseCache
+            is set and a CompressingS3Client when artefact compression is
+            enabled) or a MagicS3Client instance depending on configuration.
 
         Notes:
             - Uses is_use_s3() to determine which implementation to return
@@ -858,6 +1292,10 @@ class MagicS3Client(BaseModel):
         """
         if is_use_s3():
             client = aws.s3_client(region=Region, role_arn=RoleArn)
+            if UseCache:
+                client = CachedS3Client(client)
+            if get_artefact_compression():
+                client = CompressingS3Client(client)
         else:
             client = MagicS3Client(Region=Region, RoleArn=RoleArn, DataPath=DataPath)
 
@@ -871,32 +1309,91 @@ class SeekableStreamWrapper:
     as it's read. Useful for making streaming responses seekable for processing
     that requires random access to stream data.
 
-    The wrapper reads chunks from the original stream on-demand and maintains
-    an internal buffer to support seek operations. This enables compatibility
-    with code that expects seekable streams.
+    The wrapper reads chunks from the original stream on-demand and keeps them
+    as immutable ``bytes`` so that reads falling inside a single chunk can be
+    served as zero-copy ``memoryview`` slices. Once the buffered data exceeds
+    ``max_memory_size`` the buffer spills to an anonymous temporary file, which
+    keeps peak memory bounded for very large streams (multi-GB packages).
+
+    When only forward seeks are needed (``forward_only=True``) the regions that
+    have already been consumed are discarded as the position advances, and a
+    spill file is rewritten without them once they outweigh the data kept.
 
     Attributes:
         stream: The original stream to wrap.
         chunk_size: Size of chunks to read when buffering.
-        buffer: Internal buffer for storing read data.
+        max_memory_size: Number of buffered bytes kept in memory before spilling
+            to a temporary file. None disables spilling.
+        spill_dir: Directory for the spill file. Defaults to the system temp dir.
+        forward_only: Discard consumed data as the position advances.
+        buffer: Copy of the buffered data not yet discarded (compatibility).
         position: Current position in the buffered data.
         eof_reached: Flag indicating if end of stream was reached.
     """
 
-    def __init__(self, stream, chunk_size: int = 8192):
+    def __init__(
+        self,
+        stream,
+        chunk_size: int = 8192,
+        max_memory_size: int | None = DEFAULT_SPILL_THRESHOLD,
+        spill_dir: str | None = None,
+        forward_only: bool = False,
+    ):
         """Initialize the seekable stream wrapper.
 
         Args:
             stream: The original stream to wrap. Should have a read() method.
             chunk_size: Size of chunks to read when buffering. Larger chunks
                        use more memory but may be more efficient for large streams.
+            max_memory_size: In-memory buffer limit in bytes before spilling to
+                       a temporary file. None keeps everything in memory.
+            spill_dir: Directory in which the spill file is created.
+            forward_only: If True, data before the current position is discarded
+                       and seeking backwards into it raises ValueError.
         """
         self.stream = stream
         self.chunk_size = chunk_size
-        self.buffer = bytearray()
+        self.max_memory_size = max_memory_size
+        self.spill_dir = spill_dir
+        self.forward_only = forward_only
         self.position = 0
         self.eof_reached = False
 
+        # In-memory chunks and the absolute stream offset of each chunk
+        self._chunks: list[bytes] = []
+        self._offsets: list[int] = []
+        self._memory_size = 0
+
+        # Absolute offset of the first byte still available (after discards)
+        self._base = 0
+
+        # Absolute offset of the end of the buffered data
+        self._size = 0
+
+        # Spill file and the absolute offset of its first byte
+        self._spill = None
+        self._spill_base = 0
+
+    @property
+    def size(self) -> int:
+        """Number of bytes read from the underlying stream so far."""
+        return self._size
+
+    @property
+    def spilled(self) -> bool:
+        """True if the buffer has been moved to a temporary file."""
+        return self._spill is not None
+
+    @property
+    def buffer(self) -> bytearray:
+        """Copy of the buffered data, kept for callers of the former bytearray buffer.
+
+        Indexes match stream offsets only while nothing has been discarded. The
+        copy holds the whole buffer in memory, even when it has been spilled;
+        prefer read() and seek().
+        """
+        return bytearray(self._slice(self._base, self._size))
+
     def read(self, size: int = -1) -> bytes:
         """Read up to size bytes from the wrapped stream.
 
@@ -914,19 +1411,54 @@ class SeekableStreamWrapper:
             - Updates internal position after reading
             - Returns empty bytes when end of stream is reached
         """
-        # Ensure we have enough data buffered
-        if size == -1:
+        result = self.read_view(size)
+
+        # Whole chunks and joined reads are already bytes objects
+        if isinstance(result.obj, bytes) and len(result) == len(result.obj):
+            return result.obj
+
+        return result.tobytes()
+
+    def read_view(self, size: int = -1) -> memoryview:
+        """Read up to size bytes and return them as a memoryview.
+
+        Reads that fall within a single buffered chunk are returned without
+        copying. Reads spanning several chunks, or served from the spill file,
+        are returned as a view over a newly built ``bytes`` object.
+
+        Args:
+            size: Number of bytes to read. If -1, reads all remaining data.
+
+        Returns:
+            A read-only memoryview over the data read.
+        """
+        if size is None or size < 0:
             self._read_all()
-            result = bytes(self.buffer[self.position :])
-            self.position = len(self.buffer)
+            end_pos = self._size
         else:
             self._ensure_buffered(self.position + size)
-            end_pos = min(self.position + size, len(self.buffer))
-            result = bytes(self.buffer[self.position : end_pos])
-            self.position = end_pos
+            end_pos = min(self.position + size, self._size)
+
+        result = self._slice(self.position, end_pos)
+        self.position = end_pos
+        self._discard_consumed()
 
         return result
 
+    def readinto(self, b) -> int:
+        """Read bytes into a pre-allocated, writable bytes-like object.
+
+        Args:
+            b: The buffer to fill.
+
+        Returns:
+            The number of bytes read, 0 at end of stream.
+        """
+        view = memoryview(b).cast("B")
+        data = self.read_view(len(view))
+        view[: len(data)] = data
+        return len(data)
+
     def seek(self, offset: int, whence: int = 0) -> int:
         """Seek to a specific position in the stream.
 
@@ -943,22 +1475,183 @@ class SeekableStreamWrapper:
         Returns:
             The new absolute position in the stream.
 
+        Raises:
+            ValueError: If the target position has already been discarded.
+
         Notes:
             - SEEK_END requires reading the entire stream to determine size
             - Position is clamped to valid range [0, buffer_length]
             - Automatically buffers data as needed for seeking
         """
         if whence == 0:  # SEEK_SET
-            self.position = offset
+            position = offset
         elif whence == 1:  # SEEK_CUR
-            self.position += offset
+            position = self.position + offset
         elif whence == 2:  # SEEK_END
             self._read_all()
-            self.position = len(self.buffer) + offset
+            position = self._size + offset
+        else:
+            raise ValueError(f"Invalid whence ({whence})")
 
-        self.position = max(0, min(self.position, len(self.buffer)))
+        # Seeking forward past the buffered data pulls it in from the stream
+        if position > self._size:
+            self._ensure_buffered(position)
+
+        position = max(0, min(position, self._size))
+
+        if position < self._base:
+            raise ValueError(
+                f"Cannot seek to {position}, data before {self._base} has been discarded"
+            )
+
+        self.position = position
+        self._discard_consumed()
+        return self.position
+
+    def tell(self) -> int:
+        """Return the current position in the stream."""
         return self.position
 
+    def seekable(self) -> bool:
+        """Return True, the wrapper always supports seeking."""
+        return True
+
+    def readable(self) -> bool:
+        """Return True, the wrapper always supports reading."""
+        return True
+
+    def discard(self, upto: int | None = None) -> None:
+        """Release buffered data before the given absolute offset.
+
+        Whole in-memory chunks that end at or before the offset are dropped.
+        After a discard, seeking before the released region raises ValueError.
+
+        Args:
+            upto: Absolute offset to discard up to. Defaults to the current position.
+        """
+        upto = min(self.position if upto is None else upto, self.position)
+        if upto <= self._base:
+            return
+
+        if self._spill is not None:
+            # A file cannot be truncated from the front: move the logical start
+            # forward, and rewrite the file once the discarded region outweighs
+            # the data kept, so each byte is copied at most once on average
+            self._base = upto
+            discarded = self._base - self._spill_base
+            if discarded >= max(self._size - self._base, self.max_memory_size or 0):
+                self._rotate_spill()
+            return
+
+        count = 0
+        for chunk_offset, chunk in zip(self._offsets, self._chunks):
+            if chunk_offset + len(chunk) > upto:
+                break
+            self._memory_size -= len(chunk)
+            count += 1
+
+        if count:
+            del self._chunks[:count]
+            del self._offsets[:count]
+        self._base = self._offsets[0] if self._offsets else self._size
+
+    def close(self) -> None:
+        """Release the buffer and close the spill file, if any."""
+        self._chunks = []
+        self._offsets = []
+        self._memory_size = 0
+        if self._spill is not None:
+            self._spill.close()
+            self._spill = None
+
+    def _discard_consumed(self):
+        """Discard consumed data when operating in forward-only mode."""
+        if self.forward_only:
+            self.discard()
+
+    def _slice(self, start: int, end: int) -> memoryview:
+        """Return the buffered bytes between two absolute offsets.
+
+        Args:
+            start: Absolute start offset (inclusive).
+            end: Absolute end offset (exclusive).
+
+        Returns:
+            A memoryview over the requested data.
+        """
+        if start >= end:
+            return memoryview(b"")
+
+        if self._spill is not None:
+            self._spill.seek(start - self._spill_base)
+            return memoryview(self._spill.read(end - start))
+
+        index = bisect.bisect_right(self._offsets, start) - 1
+        chunk = self._chunks[index]
+        chunk_start = self._offsets[index]
+
+        if end <= chunk_start + len(chunk):
+            # Entirely within one chunk, no copy needed
+            return memoryview(chunk)[start - chunk_start : end - chunk_start]
+
+        parts = []
+        while start < end:
+            chunk = self._chunks[index]
+            chunk_start = self._offsets[index]
+            chunk_end = min(end, chunk_start + len(chunk))
+            parts.append(
+                memoryview(chunk)[start - chunk_start : chunk_end - chunk_start]
+            )
+            start = chunk_end
+            index += 1
+
+        return memoryview(b"".join(parts))
+
+    def _append(self, chunk: bytes):
+        """Append a chunk read from the underlying stream to the buffer.
+
+        Args:
+            chunk: The data read from the stream.
+        """
+        if not isinstance(chunk, bytes):
+            chunk = bytes(chunk)
+
+        if self._spill is not None:
+            self._spill.seek(0, os.SEEK_END)
+            self._spill.write(chunk)
+        else:
+            self._chunks.append(chunk)
+            self._offsets.append(self._size)
+            self._memory_size += len(chunk)
+
+        self._size += len(chunk)
+
+        if (
+            self._spill is None
+            and self.max_memory_size is not None
+            and self._memory_size > self.max_memory_size
+        ):
+            self._spill_to_file()
+
+    def _spill_to_file(self):
+        """Move the in-memory chunks to an anonymous temporary file."""
+        self._spill = tempfile.TemporaryFile(dir=self.spill_dir)
+        self._spill_base = self._offsets[0] if self._offsets else self._size
+        for chunk in self._chunks:
+            self._spill.write(chunk)
+        self._chunks = []
+        self._offsets = []
+        self._memory_size = 0
+
+    def _rotate_spill(self):
+        """Move the data not yet discarded to a fresh spill file and release the old one."""
+        spill = tempfile.TemporaryFile(dir=self.spill_dir)
+        self._spill.seek(self._base - self._spill_base)
+        shutil.copyfileobj(self._spill, spill)
+        self._spill.close()
+        self._spill = spill
+        self._spill_base = self._base
+
     def _ensure_buffered(self, target_size: int):
         """Ensure the buffer contains at least target_size bytes.
 
@@ -968,12 +1661,12 @@ class SeekableStreamWrapper:
         Args:
             target_size: Minimum number of bytes needed in the buffer.
         """
-        while len(self.buffer) < target_size and not self.eof_reached:
+        while self._size < target_size and not self.eof_reached:
             chunk = self.stream.read(self.chunk_size)
             if not chunk:
                 self.eof_reached = True
                 break
-            self.buffer.extend(chunk)
+            self._append(chunk)
 
     def _read_all(self):
         """Read all remaining data from the underlying stream into the buffer.
@@ -986,4 +1679,4 @@ class SeekableStreamWrapper:
             if not chunk:
                 self.eof_reached = True
                 break
-            self.buffer.extend(chunk)
+            self._append(chunk)
@@ -0,0 +1,469 @@
+"""ETag-validated On-disk Read-through Cache for S3 Objects.
+
+This module provides a read-through cache for objects fetched from real S3. It is
+designed for warm AWS Lambda containers and long-running workers that repeatedly
+read the same shared templates, facts files and packages between invocations.
+
+Key Features:
+    - **Conditional GET**: Cached objects are revalidated with ``IfNoneMatch`` so an
+      unchanged object costs a single 304 round trip instead of a full download
+    - **On-disk Storage**: Objects are stored under a private per-user folder of
+      the temp directory keyed by bucket, key and ETag
+    - **Size-bounded LRU**: Least recently used objects are evicted once the cache
+      exceeds its configured size
+    - **Atomic Replacement**: Objects and metadata are written to a temporary file
+      and moved into place with ``os.replace`` so readers never see partial data
+    - **Drop-in Proxies**: CachedS3Client and CachedS3Bucket wrap boto3 clients and
+      buckets, serving reads from the cache and passing everything else through
+
+Usage:
+    The cache is enabled through ``MagicS3Client.get_client(..., UseCache=True)`` or
+    ``MagicS3Client.get_bucket(..., UseCache=True)``. A process-wide cache instance
+    is shared so that warm containers reuse the objects downloaded by earlier
+    invocations.
+
+Thread Safety:
+    The index is protected by a lock. Downloads of different objects proceed
+    concurrently; the last writer of the same object wins atomically.
+"""
+
+from typing import Any, IO
+
+import os
+import json
+import shutil
+import hashlib
+import tempfile
+import threading
+from collections import OrderedDict
+
+from botocore.exceptions import ClientError
+
+import core_framework as util
+import core_logging as log
+
+# Default maximum size of the on-disk cache, in bytes (512 MiB)
+DEFAULT_CACHE_MAX_SIZE = 512 * 1024 * 1024
+
+# Default folder name within the temp directory
+DEFAULT_CACHE_FOLDER = "s3-cache"
+
+# get_object parameters that are compatible with serving from the cache
+_CACHEABLE_GET_PARAMS = {"Bucket", "Key"}
+
+
+class S3ObjectCache:
+    """Size-bounded, ETag-validated on-disk cache of S3 objects.
+
+    Each cached object is stored as a data file named after a hash of the bucket
+    and key plus the object's ETag, and a JSON sidecar holding the response
+    metadata. The in-memory index is ordered by recency and rebuilt from the
+    sidecars when a new cache instance is created over an existing directory.
+
+    Attributes:
+        cache_dir: Directory holding the cached objects.
+        max_size: Maximum total size of cached objects in bytes.
+        hits: Number of reads served from the cache after revalidation.
+        misses: Number of reads that downloaded the object.
+    """
+
+    def __init__(
+        self, cache_dir: str | None = None, max_size: int = DEFAULT_CACHE_MAX_SIZE
+    ):
+        """Initialize the cache and load any existing entries from disk.
+
+        Args:
+            cache_dir: Directory for cached objects. Defaults to the private
+                ``s3-cache-<uid>`` folder of the framework temp directory
+                (``/tmp`` on Lambda). When that folder is not private to the
+                user, a new private directory is used for this instance only.
+            max_size: Maximum total size of cached objects in bytes.
+        """
+        if not cache_dir:
+            cache_dir = util.get_private_temp_dir(DEFAULT_CACHE_FOLDER)
+            if cache_dir is None:
+                # Never serve objects another user could have planted
+                log.warning(
+                    "No private S3 cache folder in {}, using a new one",
+                    util.get_temp_dir(),
+                )
+                cache_dir = tempfile.mkdtemp(prefix=f"{DEFAULT_CACHE_FOLDER}-")
+        self.cache_dir = cache_dir
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+
+        # Storage format: {entry_id: metadata}, least recently used first
+        self._index: OrderedDict[str, dict] = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+        os.makedirs(self.cache_dir, exist_ok=True)
+        self._load_index()
+
+    @property
+    def size(self) -> int:
+        """Total size in bytes of the cached objects."""
+        return self._size
+
+    def get_object(self, client: Any, Bucket: str, Key: str) -> dict:
+        """Get an object through the cache.
+
+        If the object is cached, S3 is asked for it with ``IfNoneMatch`` set to the
+        cached ETag. A 304 response serves the cached file; otherwise the new
+        content is stored in the cache and served from disk.
+
+        Args:
+            client: A boto3 S3 client.
+            Bucket: The bucket name.
+            Key: The object key.
+
+        Returns:
+            A dictionary in the S3 get_object response shape whose ``Body`` is a
+            binary file object over the cached data.
+        """
+        entry_id = self._entry_id(Bucket, Key)
+
+        with self._lock:
+            entry = self._index.get(entry_id)
+
+        if entry is not None:
+            try:
+                response = client.get_object(
+                    Bucket=Bucket, Key=Key, IfNoneMatch=entry["ETag"]
+                )
+            except ClientError as e:
+                if not self._is_not_modified(e):
+                    raise
+                cached = self._open(entry_id, entry)
+                if cached is not None:
+                    return cached
+                response = client.get_object(Bucket=Bucket, Key=Key)
+        else:
+            response = client.get_object(Bucket=Bucket, Key=Key)
+
+        with self._lock:
+            self.misses += 1
+
+        content_length = response.get("ContentLength")
+        if content_length is not None and content_length > self.max_size:
+            # Too big to cache, hand back the live response
+            return response
+
+        entry = self._store(entry_id, Bucket, Key, response)
+        return self._open(entry_id, entry, hit=False) or response
+
+    def download_fileobj(self, client: Any, Bucket: str, Key: str, Fileobj: IO) -> None:
+        """Download an object through the cache into a file-like object.
+
+        Args:
+            client: A boto3 S3 client.
+            Bucket: The bucket name.
+            Key: The object key.
+            Fileobj: Binary file-like object to write the content to.
+        """
+        response = self.get_object(client, Bucket, Key)
+        body = response["Body"]
+        try:
+            shutil.copyfileobj(body, Fileobj)
+        finally:
+            body.close()
+
+    def invalidate(self, Bucket: str, Key: str) -> None:
+        """Remove an object from the cache.
+
+        Args:
+            Bucket: The bucket name.
+            Key: The object key.
+        """
+        entry_id = self._entry_id(Bucket, Key)
+        with self._lock:
+            entry = self._index.pop(entry_id, None)
+            if entry is not None:
+                self._size -= entry["ContentLength"]
+                self._remove_files(entry_id, entry)
+
+    def clear(self) -> None:
+        """Remove every object from the cache."""
+        with self._lock:
+            for entry_id, entry in self._index.items():
+                self._remove_files(entry_id, entry)
+            self._index.clear()
+            self._size = 0
+
+    def _open(self, entry_id: str, entry: dict, hit: bool = True) -> dict | None:
+        """Build a get_object response over a cached data file.
+
+        Args:
+            entry_id: The cache entry identifier.
+            entry: The entry metadata.
+            hit: Whether to count the access as a cache hit.
+
+        Returns:
+            The response dictionary, or None if the data file has disappeared.
+        """
+        try:
+            body = open(self._data_path(entry_id, entry["ETag"]), "rb")
+        except FileNotFoundError:
+            with self._lock:
+                if self._index.pop(entry_id, None) is not None:
+                    self._size -= entry["ContentLength"]
+            return None
+
+        with self._lock:
+            if entry_id in self._index:
+                self._index.move_to_end(entry_id)
+            if hit:
+                self.hits += 1
+
+        response = {k: v for k, v in entry.items() if k not in ("Bucket", "Key")}
+        response["Body"] = body
+        return response
+
+    def _store(self, entry_id: str, bucket: str, key: str, response: dict) -> dict:
+        """Write a get_object response into the cache atomically.
+
+        Args:
+            entry_id: The cache entry identifier.
+            bucket: The bucket name.
+            key: The object key.
+            response: The boto3 get_object response.
+
+        Returns:
+            The metadata of the new cache entry.
+        """
+        etag = response.get("ETag", "")
+        body = response["Body"]
+
+        fd, tmp = tempfile.mkstemp(dir=self.cache_dir, prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                shutil.copyfileobj(body, f)
+            size = os.path.getsize(tmp)
+            os.replace(tmp, self._data_path(entry_id, etag))
+        except Exception:
+            if os.path.exists(tmp):
+                os.remove(tmp)
+            raise
+        finally:
+            body.close()
+
+        last_modified = response.get("LastModified")
+        entry = {
+            "Bucket": bucket,
+            "Key": key,
+            "ETag": etag,
+            "ContentLength": size,
+            "ContentType": response.get("ContentType"),
+            "ContentEncoding": response.get("ContentEncoding"),
+            "LastModified": (
+                last_modified.isoformat()
+                if hasattr(last_modified, "isoformat")
+                else last_modified
+            ),
+            "VersionId": response.get("VersionId"),
+            "Metadata": response.get("Metadata", {}),
+        }
+        entry = {k: v for k, v in entry.items() if v is not None}
+        self._write_json(self._meta_path(entry_id), entry)
+
+        with self._lock:
+            previous = self._index.pop(entry_id, None)
+            if previous is not None:
+                self._size -= previous["ContentLength"]
+                if previous["ETag"] != etag:
+                    self._remove_data(entry_id, previous["ETag"])
+            self._index[entry_id] = entry
+            self._size += size
+            self._evict()
+
+        return entry
+
+    def _evict(self) -> None:
+        """Evict least recently used entries until the cache fits. Lock must be held."""
+        while self._size > self.max_size and len(self._index) > 1:
+            entry_id, entry = self._index.popitem(last=False)
+            self._size -= entry["ContentLength"]
+            self._remove_files(entry_id, entry)
+            log.trace(
+                "Evicted s3://{}/{} from the S3 object cache",
+                entry["Bucket"],
+                entry["Key"],
+            )
+
+    def _load_index(self) -> None:
+        """Rebuild the index from the metadata sidecars on disk."""
+        entries = []
+        for name in os.listdir(self.cache_dir):
+            if not name.endswith(".json"):
+                continue
+            entry_id = name[: -len(".json")]
+            meta_path = os.path.join(self.cache_dir, name)
+            try:
+                with open(meta_path, "r", encoding="utf-8") as f:
+                    entry = json.load(f)
+                data_path = self._data_path(entry_id, entry["ETag"])
+                entries.append((os.path.getmtime(data_path), entry_id, entry))
+            except (OSError, ValueError, KeyError):
+                continue
+
+        for _, entry_id, entry in sorted(entries, key=lambda e: e[0]):
+            self._index[entry_id] = entry
+            self._size += entry["ContentLength"]
+
+        with self._lock:
+            self._evict()
+
+    def _remove_files(self, entry_id: str, entry: dict) -> None:
+        """Remove the data file and sidecar of an entry."""
+        self._remove_data(entry_id, entry["ETag"])
+        try:
+            os.remove(self._meta_path(entry_id))
+        except FileNotFoundError:
+            pass
+
+    def _remove_data(self, entry_id: str, etag: str) -> None:
+        """Remove a data file, ignoring files that are already gone."""
+        try:
+            os.remove(self._data_path(entry_id, etag))
+        except FileNotFoundError:
+            pass
+
+    def _write_json(self, path: str, data: dict) -> None:
+        """Atomically write a JSON document."""
+        fd, tmp = tempfile.mkstemp(dir=self.cache_dir, prefix=".tmp-")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+        os.replace(tmp, path)
+
+    def _data_path(self, entry_id: str, etag: str) -> str:
+        """Path of the data file for an entry and ETag."""
+        safe_etag = "".join(c for c in etag if c.isalnum() or c == "-")
+        return os.path.join(self.cache_dir, f"{entry_id}.{safe_etag}")
+
+    def _meta_path(self, entry_id: str) -> str:
+        """Path of the metadata sidecar for an entry."""
+        return os.path.join(self.cache_dir, f"{entry_id}.json")
+
+    @staticmethod
+    def _entry_id(bucket: str, key: str) -> str:
+        """Stable identifier for a bucket and key."""
+        return hashlib.sha256(f"{bucket}/{key}".encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def _is_not_modified(e: ClientError) -> bool:
+        """True if the error is S3's 304 Not Modified response to IfNoneMatch."""
+        status = e.response.get("ResponseMetadata", {}).get("HTTPStatusCode")
+        code = e.response.get("Error", {}).get("Code")
+        return status == 304 or code in ("304", "NotModified")
+
+
+class CachedS3Client:
+    """Proxy around a boto3 S3 client that reads objects through an S3ObjectCache.
+
+    Plain ``get_object`` and ``download_fileobj`` calls are served by the cache.
+    Writes and deletes pass through to the client and invalidate the cached copy.
+    Every other attribute is delegated to the wrapped client.
+    """
+
+    def __init__(self, client: Any, cache: S3ObjectCache | None = None):
+        """Initialize the proxy.
+
+        Args:
+            client: The boto3 S3 client to wrap.
+            cache: The cache to use. Defaults to the process-wide cache.
+        """
+        self._client = client
+        self._cache = cache or get_object_cache()
+
+    def get_object(self, **kwargs) -> dict:
+        """Get an object, through the cache when the request allows it."""
+        if set(kwargs) - _CACHEABLE_GET_PARAMS:
+            # Ranges, versions and conditional requests go straight to S3
+            return self._client.get_object(**kwargs)
+        return self._cache.get_object(self._client, kwargs["Bucket"], kwargs["Key"])
+
+    def download_fileobj(self, Bucket: str, Key: str, Fileobj: IO, **kwargs) -> None:
+        """Download an object into a file-like object through the cache."""
+        if kwargs:
+            return self._client.download_fileobj(Bucket, Key, Fileobj, **kwargs)
+        self._cache.download_fileobj(self._client, Bucket, Key, Fileobj)
+
+    def put_object(self, **kwargs) -> dict:
+        """Put an object and invalidate any cached copy."""
+        self._cache.invalidate(kwargs.get("Bucket"), kwargs.get("Key"))
+        return self._client.put_object(**kwargs)
+
+    def upload_fileobj(self, Fileobj: IO, Bucket: str, Key: str, **kwargs) -> None:
+        """Upload a file-like object and invalidate any cached copy."""
+        self._cache.invalidate(Bucket, Key)
+        return self._client.upload_fileobj(
+            Fileobj=Fileobj, Bucket=Bucket, Key=Key, **kwargs
+        )
+
+    def delete_object(self, **kwargs) -> dict:
+        """Delete an object and invalidate any cached copy."""
+        self._cache.invalidate(kwargs.get("Bucket"), kwargs.get("Key"))
+        return self._client.delete_object(**kwargs)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._client, name)
+
+
+class CachedS3Bucket:
+    """Proxy around a boto3 S3 Bucket resource that reads objects through an S3ObjectCache.
+
+    Provides cached ``get_object`` and ``download_fileobj`` for the bucket and
+    delegates every other attribute to the wrapped bucket.
+    """
+
+    def __init__(self, bucket: Any, cache: S3ObjectCache | None = None):
+        """Initialize the proxy.
+
+        Args:
+            bucket: The boto3 S3 Bucket resource to wrap.
+            cache: The cache to use. Defaults to the process-wide cache.
+        """
+        self._bucket = bucket
+        self._cache = cache or get_object_cache()
+
+    def get_object(self, **kwargs) -> dict:
+        """Get an object from this bucket through the cache."""
+        client = self._bucket.meta.client
+        if set(kwargs) - {"Key"}:
+            return client.get_object(Bucket=self._bucket.name, **kwargs)
+        return self._cache.get_object(client, self._bucket.name, kwargs["Key"])
+
+    def download_fileobj(self, Key: str, Fileobj: IO, **kwargs) -> None:
+        """Download an object from this bucket into a file-like object through the cache."""
+        if kwargs:
+            return self._bucket.download_fileobj(Key, Fileobj, **kwargs)
+        self._cache.download_fileobj(
+            self._bucket.meta.client, self._bucket.name, Key, Fileobj
+        )
+
+    def put_object(self, **kwargs) -> Any:
+        """Put an object and invalidate any cached copy."""
+        self._cache.invalidate(self._bucket.name, kwargs.get("Key"))
+        return self._bucket.put_object(**kwargs)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._bucket, name)
+
+
+# Process-wide cache shared by all proxies so warm containers reuse downloads
+_object_cache: S3ObjectCache | None = None
+_object_cache_lock = threading.Lock()
+
+
+def get_object_cache() -> S3ObjectCache:
+    """Return the process-wide S3 object cache, creating it on first use.
+
+    Returns:
+        The shared S3ObjectCache instance.
+    """
+    global _object_cache
+    with _object_cache_lock:
+        if _object_cache is None:
+            _object_cache = S3ObjectCache()
+        return _object_cache
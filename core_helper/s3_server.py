@@ -0,0 +1,870 @@
+"""Local S3-compatible HTTP Endpoint for the MagicS3Client Storage Volume.
+
+This module provides an optional embedded HTTP server that exposes the local storage
+volume used by ``core_helper.magic`` through the subset of the S3 REST API that the
+framework emulates. Worker processes and non-Python tools (the CLI upload step,
+cfn-lint, the UI) can then share the local volume by pointing boto3 or any S3 SDK
+at the server with ``endpoint_url``.
+
+Supported Operations:
+    - **Service**: ListBuckets
+    - **Bucket**: CreateBucket, HeadBucket, DeleteBucket, ListObjects (v1 and v2),
+      DeleteObjects
+    - **Object**: GetObject (with Range), HeadObject, PutObject, CopyObject,
+      DeleteObject
+    - **Multipart**: CreateMultipartUpload, UploadPart, CompleteMultipartUpload,
+      AbortMultipartUpload
+
+Architecture:
+    The server is built on ``http.server.ThreadingHTTPServer`` speaking HTTP/1.1,
+    so connections are kept alive and each connection is served on its own thread.
+    Request and response bodies are streamed in fixed-size chunks between the socket
+    and the filesystem, and uploads are written to a temporary file that is moved
+    into place atomically once complete.
+
+Usage:
+    Start the server in-process with ``start_server()`` or from the command line::
+
+        python -m core_helper.s3_server --port 9000 --data-path /mnt/data/core
+
+    Then configure boto3 with path-style addressing::
+
+        boto3.client(
+            "s3",
+            endpoint_url="http://localhost:9000",
+            config=Config(s3={"addressing_style": "path"}),
+        )
+
+Limitations:
+    Requests are not authenticated and signatures are not verified. User metadata,
+    ACLs and versioning are not stored. The server is intended for local and Docker
+    development deployments only.
+"""
+
+from typing import Any
+
+import os
+import re
+import uuid
+import shutil
+import argparse
+import threading
+import mimetypes
+from email.utils import formatdate
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit, parse_qs, unquote
+from xml.etree import ElementTree
+
+from core_framework.common import get_storage_volume
+
+import core_logging as log
+
+from .magic import (
+    LocalObjectStore,
+    MagicS3Client,
+    generate_file_hash,
+    MAX_DELETE_OBJECTS,
+)
+
+# Default port for the local S3 endpoint
+DEFAULT_PORT = 9000
+
+# Size of the chunks streamed between sockets and files
+STREAM_CHUNK_SIZE = 64 * 1024
+
+# Folder within the storage volume that holds in-progress multipart uploads
+MULTIPART_FOLDER = ".multipart"
+
+# Prefix of temporary files written while an upload is in progress
+TEMP_FILE_PREFIX = ".s3tmp-"
+
+S3_NAMESPACE = "http://s3.amazonaws.com/doc/2006-03-01/"
+
+RANGE_REGEX = re.compile(r"^bytes=(\d*)-(\d*)$")
+
+
+class S3Error(Exception):
+    """An S3 error response.
+
+    Attributes:
+        status: HTTP status code.
+        code: S3 error code (e.g. NoSuchKey).
+        message: Human readable message.
+    """
+
+    def __init__(self, status: int, code: str, message: str):
+        super().__init__(message)
+        self.status = status
+        self.code = code
+        self.message = message
+
+
+class LocalS3RequestHandler(BaseHTTPRequestHandler):
+    """HTTP request handler implementing the S3 REST subset over the storage volume."""
+
+    protocol_version = "HTTP/1.1"
+    server_version = "CoreAutomationLocalS3"
+
+    # Set by LocalS3Server
+    server: "LocalS3Server"
+
+    def do_GET(self):
+        self._dispatch("GET")
+
+    def do_HEAD(self):
+        self._dispatch("HEAD")
+
+    def do_PUT(self):
+        self._dispatch("PUT")
+
+    def do_POST(self):
+        self._dispatch("POST")
+
+    def do_DELETE(self):
+        self._dispatch("DELETE")
+
+    def log_message(self, format: str, *args: Any) -> None:
+        log.trace("Local S3 {} - {}", self.address_string(), format % args)
+
+    def _dispatch(self, method: str):
+        """Route a request to the bucket or object operation that handles it."""
+        # The handler serves every request of a keep-alive connection
+        self._body_discarded = False
+        url = urlsplit(self.path)
+        self.query = {
+            k: v[0] for k, v in parse_qs(url.query, keep_blank_values=True).items()
+        }
+
+        path = unquote(url.path).lstrip("/")
+        bucket, _, key = path.partition("/")
+
+        try:
+            if not bucket:
+                if method != "GET":
+                    raise S3Error(405, "MethodNotAllowed", "Method not allowed")
+                return self._list_buckets()
+
+            self.server.validate_bucket_name(bucket)
+
+            if not key:
+                handler = {
+                    "GET": self._list_objects,
+                    "HEAD": self._head_bucket,
+                    "PUT": self._create_bucket,
+                    "DELETE": self._delete_bucket,
+                    "POST": self._delete_objects,
+                }[method]
+                return handler(bucket)
+
+            handler = {
+                "GET": self._get_object,
+                "HEAD": self._get_object,
+                "PUT": self._put_object,
+                "DELETE": self._delete_object,
+                "POST": self._post_object,
+            }[method]
+            return handler(bucket, key)
+
+        except S3Error as e:
+            self._discard_body()
+            self._send_error(e, head=method == "HEAD")
+        except (ConnectionError, BrokenPipeError):
+            self.close_connection = True
+        except Exception as e:
+            log.error("Local S3 request {} {} failed: {}", method, self.path, str(e))
+            self._discard_body()
+            self._send_error(
+                S3Error(500, "InternalError", str(e)), head=method == "HEAD"
+            )
+
+    # Service and bucket operations
+
+    def _list_buckets(self):
+        root = _element("ListAllMyBucketsResult")
+        owner = ElementTree.SubElement(root, "Owner")
+        _sub(owner, "ID", "local")
+        _sub(owner, "DisplayName", "local")
+        buckets = ElementTree.SubElement(root, "Buckets")
+        for name in sorted(os.listdir(self.server.data_path)):
+            fn = os.path.join(self.server.data_path, name)
+            if name.startswith(".") or not os.path.isdir(fn):
+                continue
+            b = ElementTree.SubElement(buckets, "Bucket")
+            _sub(b, "Name", name)
+            _sub(b, "CreationDate", _iso(os.stat(fn).st_ctime))
+        self._send_xml(200, root)
+
+    def _head_bucket(self, bucket: str):
+        self.server.bucket_path(bucket, must_exist=True)
+        self._send_empty(200)
+
+    def _create_bucket(self, bucket: str):
+        self._discard_body()
+        os.makedirs(self.server.bucket_path(bucket), exist_ok=True)
+        self._send_empty(200, {"Location": f"/{bucket}"})
+
+    def _delete_bucket(self, bucket: str):
+        path = self.server.bucket_path(bucket, must_exist=True)
+        for _, _, files in os.walk(path):
+            if files:
+                raise S3Error(
+                    409, "BucketNotEmpty", "The bucket you tried to delete is not empty"
+                )
+        shutil.rmtree(path)
+        self._send_empty(204)
+
+    def _list_objects(self, bucket: str):
+        if (
+            "uploads" in self.query
+            or "location" in self.query
+            or "versioning" in self.query
+        ):
+            raise S3Error(501, "NotImplemented", "Operation not implemented")
+
+        path = self.server.bucket_path(bucket, must_exist=True)
+        v2 = self.query.get("list-type") == "2"
+        prefix = self.query.get("prefix", "")
+        delimiter = self.query.get("delimiter", "")
+        max_keys = int(self.query.get("max-keys", 1000))
+        if v2:
+            start_after = self.query.get("continuation-token") or self.query.get(
+                "start-after", ""
+            )
+        else:
+            start_after = self.query.get("marker", "")
+
+        contents: list[tuple[str, os.stat_result]] = []
+        common_prefixes: list[str] = []
+        truncated = False
+        last = ""
+
+        for key, st in self.server.iter_keys(path, prefix):
+            if key <= start_after:
+                continue
+            if delimiter:
+                pos = key.find(delimiter, len(prefix))
+                if pos >= 0:
+                    common = key[: pos + len(delimiter)]
+                    if common <= start_after or (
+                        common_prefixes and common_prefixes[-1] == common
+                    ):
+                        continue
+                    if len(contents) + len(common_prefixes) >= max_keys:
+                        truncated = True
+                        break
+                    common_prefixes.append(common)
+                    last = common
+                    continue
+            if len(contents) + len(common_prefixes) >= max_keys:
+                truncated = True
+                break
+            contents.append((key, st))
+            last = key
+
+        root = _element("ListBucketResult")
+        _sub(root, "Name", bucket)
+        _sub(root, "Prefix", prefix)
+        _sub(root, "MaxKeys", str(max_keys))
+        if delimiter:
+            _sub(root, "Delimiter", delimiter)
+        _sub(root, "IsTruncated", "true" if truncated else "false")
+        if v2:
+            _sub(root, "KeyCount", str(len(contents) + len(common_prefixes)))
+            if "continuation-token" in self.query:
+                _sub(root, "ContinuationToken", self.query["continuation-token"])
+            if truncated:
+                _sub(root, "NextContinuationToken", last)
+        else:
+            _sub(root, "Marker", start_after)
+            if truncated:
+                _sub(root, "NextMarker", last)
+
+        for key, st in contents:
+            c = ElementTree.SubElement(root, "Contents")
+            _sub(c, "Key", key)
+            _sub(c, "LastModified", _iso(st.st_mtime))
+            _sub(c, "ETag", f'"{self.server.etag(bucket, key)}"')
+            _sub(c, "Size", str(st.st_size))
+            _sub(c, "StorageClass", "STANDARD")
+
+        for common in common_prefixes:
+            p = ElementTree.SubElement(root, "CommonPrefixes")
+            _sub(p, "Prefix", common)
+
+        self._send_xml(200, root)
+
+    def _delete_objects(self, bucket: str):
+        if "delete" not in self.query:
+            raise S3Error(501, "NotImplemented", "Operation not implemented")
+
+        self.server.bucket_path(bucket, must_exist=True)
+        request = self._read_xml()
+        quiet = _find_text(request, "Quiet") == "true"
+        objects = [{"Key": _find_text(o, "Key")} for o in _find_all(request, "Object")]
+        if len(objects) > MAX_DELETE_OBJECTS:
+            raise S3Error(400, "MalformedXML", "Too many objects in the delete request")
+
+        # Keys escaping the bucket are reported per object, like S3 does
+        invalid: list[dict[str, str]] = []
+        valid: list[dict[str, str]] = []
+        for obj in objects:
+            try:
+                self.server.object_path(bucket, obj["Key"] or "")
+                valid.append(obj)
+            except S3Error as e:
+                invalid.append(
+                    {"Key": obj["Key"], "Code": e.code, "Message": e.message}
+                )
+
+        result = {}
+        if valid:
+            result = self.server.client.delete_objects(
+                Bucket=bucket, Delete={"Objects": valid, "Quiet": quiet}
+            )
+
+        root = _element("DeleteResult")
+        for deleted in result.get("Deleted", []):
+            d = ElementTree.SubElement(root, "Deleted")
+            _sub(d, "Key", deleted["Key"])
+        for error in invalid + result.get("Errors", []):
+            e = ElementTree.SubElement(root, "Error")
+            _sub(e, "Key", error.get("Key") or "")
+            _sub(e, "Code", error["Code"])
+            _sub(e, "Message", error["Message"])
+        self._send_xml(200, root)
+
+    # Object operations
+
+    def _get_object(self, bucket: str, key: str):
+        fn = self.server.object_path(bucket, key)
+        try:
+            st = os.stat(fn)
+        except (FileNotFoundError, NotADirectoryError):
+            self.server.bucket_path(bucket, must_exist=True)
+            raise S3Error(404, "NoSuchKey", "The specified key does not exist.")
+
+        size = st.st_size
+        start, end = 0, size - 1
+        status = 200
+        head = self.server.head(bucket, key)
+        headers = {
+            "Content-Type": mimetypes.guess_type(key)[0] or "binary/octet-stream",
+            "ETag": f'"{head.get("ETag", "")}"',
+            "Last-Modified": formatdate(st.st_mtime, usegmt=True),
+            "Accept-Ranges": "bytes",
+        }
+        if head.get("ContentEncoding"):
+            # Compressed artefacts are served as stored, like S3 does
+            headers["Content-Encoding"] = head["ContentEncoding"]
+
+        range_header = self.headers.get("Range")
+        if range_header:
+            start, end = _parse_range(range_header, size)
+            status = 206
+            headers["Content-Range"] = f"bytes {start}-{end}/{size}"
+
+        length = max(0, end - start + 1)
+        headers["Content-Length"] = str(length)
+
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.end_headers()
+
+        if self.command == "HEAD" or length == 0:
+            return
+
+        with open(fn, "rb") as f:
+            f.seek(start)
+            _copy_stream(f, self.wfile, length)
+
+    def _put_object(self, bucket: str, key: str):
+        self.server.bucket_path(bucket, must_exist=True)
+
+        if "uploadId" in self.query:
+            return self._upload_part(bucket, key)
+
+        copy_source = self.headers.get("x-amz-copy-source")
+        if copy_source:
+            return self._copy_object(bucket, key, copy_source)
+
+        fn = self.server.object_path(bucket, key)
+        self._receive_to(fn)
+        self._send_empty(200, {"ETag": f'"{self.server.etag(bucket, key)}"'})
+
+    def _copy_object(self, bucket: str, key: str, copy_source: str):
+        self._discard_body()
+        source = unquote(copy_source.split("?", 1)[0]).lstrip("/")
+        source_bucket, _, source_key = source.partition("/")
+        source_fn = self.server.object_path(source_bucket, source_key)
+        if not os.path.isfile(source_fn):
+            raise S3Error(404, "NoSuchKey", "The specified key does not exist.")
+
+        fn = self.server.object_path(bucket, key)
+        if source_fn != fn:
+            os.makedirs(os.path.dirname(fn), exist_ok=True)
+            tmp = _temp_path(fn)
+            try:
+                shutil.copyfile(source_fn, tmp)
+                os.replace(tmp, fn)
+            finally:
+                if os.path.exists(tmp):
+                    os.remove(tmp)
+
+        root = _element("CopyObjectResult")
+        _sub(root, "LastModified", _iso(os.stat(fn).st_mtime))
+        _sub(root, "ETag", f'"{self.server.etag(bucket, key)}"')
+        self._send_xml(200, root)
+
+    def _delete_object(self, bucket: str, key: str):
+        self._discard_body()
+        if "uploadId" in self.query:
+            shutil.rmtree(
+                self.server.upload_path(self.query["uploadId"]), ignore_errors=True
+            )
+            return self._send_empty(204)
+
+        self.server.bucket_path(bucket, must_exist=True)
+        self.server.object_path(bucket, key)
+        # S3 reports success when deleting a key that does not exist
+        self.server.client.delete_object(Bucket=bucket, Key=key)
+        self._send_empty(204)
+
+    def _post_object(self, bucket: str, key: str):
+        self.server.bucket_path(bucket, must_exist=True)
+        if "uploads" in self.query:
+            return self._create_multipart_upload(bucket, key)
+        if "uploadId" in self.query:
+            return self._complete_multipart_upload(bucket, key)
+        raise S3Error(501, "NotImplemented", "Operation not implemented")
+
+    # Multipart uploads
+
+    def _create_multipart_upload(self, bucket: str, key: str):
+        self._discard_body()
+        upload_id = uuid.uuid4().hex
+        os.makedirs(self.server.upload_path(upload_id))
+
+        root = _element("InitiateMultipartUploadResult")
+        _sub(root, "Bucket", bucket)
+        _sub(root, "Key", key)
+        _sub(root, "UploadId", upload_id)
+        self._send_xml(200, root)
+
+    def _upload_part(self, bucket: str, key: str):
+        upload_dir = self.server.upload_path(self.query["uploadId"], must_exist=True)
+        part_number = int(self.query.get("partNumber", 0))
+        if not 1 <= part_number <= 10000:
+            raise S3Error(
+                400, "InvalidArgument", "Part number must be between 1 and 10000"
+            )
+
+        fn = os.path.join(upload_dir, f"{part_number:05d}")
+        self._receive_to(fn)
+        self._send_empty(200, {"ETag": f'"{generate_file_hash(fn, "md5")}"'})
+
+    def _complete_multipart_upload(self, bucket: str, key: str):
+        upload_dir = self.server.upload_path(self.query["uploadId"], must_exist=True)
+        request = self._read_xml()
+        part_numbers = [
+            int(_find_text(p, "PartNumber")) for p in _find_all(request, "Part")
+        ]
+        if not part_numbers or part_numbers != sorted(part_numbers):
+            raise S3Error(
+                400, "InvalidPartOrder", "The list of parts was not in ascending order."
+            )
+
+        fn = self.server.object_path(bucket, key)
+        os.makedirs(os.path.dirname(fn), exist_ok=True)
+        tmp = _temp_path(fn)
+        try:
+            with open(tmp, "wb") as out:
+                for part_number in part_numbers:
+                    part = os.path.join(upload_dir, f"{part_number:05d}")
+                    if not os.path.isfile(part):
+                        raise S3Error(
+                            400, "InvalidPart", f"Part {part_number} was not uploaded"
+                        )
+                    with open(part, "rb") as f:
+                        shutil.copyfileobj(f, out, STREAM_CHUNK_SIZE)
+            os.replace(tmp, fn)
+        finally:
+            if os.path.exists(tmp):
+                os.remove(tmp)
+
+        shutil.rmtree(upload_dir, ignore_errors=True)
+
+        root = _element("CompleteMultipartUploadResult")
+        _sub(root, "Location", f"/{bucket}/{key}")
+        _sub(root, "Bucket", bucket)
+        _sub(root, "Key", key)
+        _sub(root, "ETag", f'"{self.server.etag(bucket, key)}-{len(part_numbers)}"')
+        self._send_xml(200, root)
+
+    # Request body helpers
+
+    def _receive_to(self, fn: str):
+        """Stream the request body into a file, replacing it atomically."""
+        os.makedirs(os.path.dirname(fn), exist_ok=True)
+        tmp = _temp_path(fn)
+        try:
+            with open(tmp, "wb") as f:
+                self._copy_body(f)
+            os.replace(tmp, fn)
+        finally:
+            if os.path.exists(tmp):
+                os.remove(tmp)
+
+    def _read_body(self) -> bytes:
+        """Read a small request body (XML documents) into memory."""
+        self._body_discarded = True
+        length = int(self.headers.get("Content-Length", 0))
+        try:
+            return self.rfile.read(length) if length else b""
+        except Exception:
+            # Part of the body may be unread: the connection cannot be reused
+            self.close_connection = True
+            raise
+
+    def _read_xml(self) -> ElementTree.Element:
+        """Read and parse an XML request body.
+
+        Raises:
+            S3Error: MalformedXML if the body is not well-formed XML.
+        """
+        try:
+            return ElementTree.fromstring(self._read_body())
+        except ElementTree.ParseError:
+            raise S3Error(
+                400,
+                "MalformedXML",
+                "The XML you provided was not well-formed or did not validate",
+            )
+
+    def _copy_body(self, out) -> None:
+        """Copy the request body to a file, decoding aws-chunked payloads."""
+        self._body_discarded = True
+        length = int(self.headers.get("Content-Length", 0))
+        content_sha = self.headers.get("x-amz-content-sha256", "")
+        encoding = self.headers.get("Content-Encoding", "")
+
+        try:
+            if content_sha.startswith("STREAMING-") or "aws-chunked" in encoding:
+                self._copy_aws_chunked(out, length)
+            elif self.headers.get("Transfer-Encoding", "").lower() == "chunked":
+                self._copy_http_chunked(out)
+            else:
+                _copy_stream(self.rfile, out, length)
+        except Exception:
+            # Part of the body may be unread: the connection cannot be reused
+            self.close_connection = True
+            raise
+
+    def _copy_aws_chunked(self, out, length: int) -> None:
+        """Decode an aws-chunked (SigV4 streaming) request body."""
+        remaining = length
+        while True:
+            line = self.rfile.readline()
+            remaining -= len(line)
+            size = int(line.split(b";", 1)[0].strip() or b"0", 16)
+            if size == 0:
+                break
+            _copy_stream(self.rfile, out, size)
+            remaining -= size + len(self.rfile.readline())
+
+        # Discard trailing checksum headers
+        if remaining > 0:
+            self.rfile.read(remaining)
+
+    def _copy_http_chunked(self, out) -> None:
+        """Decode an HTTP/1.1 chunked transfer-encoded request body."""
+        while True:
+            size = int(self.rfile.readline().split(b";", 1)[0].strip() or b"0", 16)
+            if size == 0:
+                while self.rfile.readline() not in (b"\r\n", b"\n", b""):
+                    pass
+                break
+            _copy_stream(self.rfile, out, size)
+            self.rfile.readline()
+
+    def _discard_body(self) -> None:
+        """Consume any unread request body so the connection can be reused."""
+        if self._body_discarded:
+            return
+        self._body_discarded = True
+        length = int(self.headers.get("Content-Length", 0) or 0)
+        if length and self.command in ("PUT", "POST"):
+            try:
+                _copy_stream(self.rfile, None, length)
+            except OSError:
+                self.close_connection = True
+
+    # Response helpers
+
+    def _send_xml(self, status: int, root: ElementTree.Element) -> None:
+        body = b'<?xml version="1.0" encoding="UTF-8"?>\n' + ElementTree.tostring(root)
+        self.send_response(status)
+        self.send_header("Content-Type", "application/xml")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _send_empty(self, status: int, headers: dict | None = None) -> None:
+        self.send_response(status)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def _send_error(self, error: S3Error, head: bool = False) -> None:
+        if head:
+            return self._send_empty(error.status)
+        root = ElementTree.Element("Error")
+        _sub(root, "Code", error.code)
+        _sub(root, "Message", error.message)
+        _sub(root, "Resource", self.path)
+        self._send_xml(error.status, root)
+
+
+class LocalS3Server(ThreadingHTTPServer):
+    """Threaded HTTP server exposing a local storage volume as an S3 endpoint.
+
+    Attributes:
+        data_path: The root directory of the storage volume.
+        client: The MagicS3Client used for object operations shared with the library.
+    """
+
+    daemon_threads = True
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = DEFAULT_PORT,
+        data_path: str | None = None,
+    ):
+        """Initialize the server.
+
+        Args:
+            host: Interface to listen on.
+            port: Port to listen on. Use 0 to pick a free port.
+            data_path: The storage volume. Defaults to the framework storage volume.
+        """
+        self.data_path = os.path.abspath(data_path or get_storage_volume())
+        self.client = MagicS3Client(DataPath=self.data_path)
+        self._store = LocalObjectStore(self.data_path)
+        os.makedirs(self.data_path, exist_ok=True)
+        super().__init__((host, port), LocalS3RequestHandler)
+
+    @property
+    def endpoint_url(self) -> str:
+        """The URL to pass to boto3 as ``endpoint_url``."""
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def validate_bucket_name(self, bucket: str) -> None:
+        """Reject bucket names that would escape the storage volume."""
+        if bucket.startswith(".") or "/" in bucket or "\\" in bucket:
+            raise S3Error(
+                400, "InvalidBucketName", "The specified bucket is not valid."
+            )
+
+    def bucket_path(self, bucket: str, must_exist: bool = False) -> str:
+        """Directory of a bucket.
+
+        Raises:
+            S3Error: NoSuchBucket if must_exist is set and the bucket is missing.
+        """
+        path = os.path.join(self.data_path, bucket)
+        if must_exist and not os.path.isdir(path):
+            raise S3Error(404, "NoSuchBucket", "The specified bucket does not exist")
+        return path
+
+    def object_path(self, bucket: str, key: str) -> str:
+        """File of an object, refusing keys that escape the bucket."""
+        bucket_dir = os.path.join(self.data_path, bucket)
+        fn = os.path.normpath(os.path.join(bucket_dir, key))
+        if not fn.startswith(bucket_dir + os.sep) or os.path.basename(fn).startswith(
+            TEMP_FILE_PREFIX
+        ):
+            raise S3Error(400, "InvalidArgument", "The specified key is not valid.")
+        return fn
+
+    def upload_path(self, upload_id: str, must_exist: bool = False) -> str:
+        """Staging directory of a multipart upload."""
+        if not re.fullmatch(r"[0-9a-f]{32}", upload_id):
+            raise S3Error(404, "NoSuchUpload", "The specified upload does not exist.")
+        path = os.path.join(self.data_path, MULTIPART_FOLDER, upload_id)
+        if must_exist and not os.path.isdir(path):
+            raise S3Error(404, "NoSuchUpload", "The specified upload does not exist.")
+        return path
+
+    def head(self, bucket: str, key: str) -> dict:
+        """Metadata of an object, shared with the MagicS3Client ETag cache."""
+        return self._store.head_object(bucket, key)
+
+    def etag(self, bucket: str, key: str) -> str:
+        """ETag of an object, shared with the MagicS3Client ETag cache."""
+        return self.head(bucket, key).get("ETag", "")
+
+    def iter_keys(self, bucket_dir: str, prefix: str = ""):
+        """Yield (key, stat) for every object in a bucket in lexicographic key order.
+
+        Args:
+            bucket_dir: Directory of the bucket.
+            prefix: Only keys starting with this prefix are returned.
+        """
+        # Only descend into the part of the tree that can match the prefix
+        base = os.path.dirname(prefix)
+        start_dir = os.path.join(bucket_dir, base) if base else bucket_dir
+        if not os.path.isdir(start_dir):
+            return
+
+        keys = []
+        for root, dirs, files in os.walk(start_dir):
+            rel = os.path.relpath(root, bucket_dir)
+            rel = "" if rel == "." else rel.replace(os.sep, "/") + "/"
+            for name in files:
+                if name.startswith(TEMP_FILE_PREFIX):
+                    continue
+                key = rel + name
+                if key.startswith(prefix):
+                    keys.append(key)
+
+        for key in sorted(keys):
+            try:
+                yield key, os.stat(os.path.join(bucket_dir, key))
+            except FileNotFoundError:
+                continue
+
+
+def start_server(
+    host: str = "127.0.0.1", port: int = DEFAULT_PORT, data_path: str | None = None
+) -> LocalS3Server:
+    """Start a local S3 endpoint on a background daemon thread.
+
+    Args:
+        host: Interface to listen on.
+        port: Port to listen on. Use 0 to pick a free port.
+        data_path: The storage volume. Defaults to the framework storage volume.
+
+    Returns:
+        The running server. Call ``shutdown()`` and ``server_close()`` to stop it.
+    """
+    server = LocalS3Server(host, port, data_path)
+    thread = threading.Thread(
+        target=server.serve_forever, name="local-s3-server", daemon=True
+    )
+    thread.start()
+    log.info(
+        "Local S3 endpoint listening on {} serving {}",
+        server.endpoint_url,
+        server.data_path,
+    )
+    return server
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Run the local S3 endpoint in the foreground."""
+    parser = argparse.ArgumentParser(
+        description="Local S3-compatible endpoint for the core storage volume"
+    )
+    parser.add_argument("--host", default="127.0.0.1", help="Interface to listen on")
+    parser.add_argument(
+        "--port", type=int, default=DEFAULT_PORT, help="Port to listen on"
+    )
+    parser.add_argument(
+        "--data-path", default=None, help="Storage volume (defaults to VOLUME)"
+    )
+    args = parser.parse_args(argv)
+
+    server = LocalS3Server(args.host, args.port, args.data_path)
+    log.info(
+        "Local S3 endpoint listening on {} serving {}",
+        server.endpoint_url,
+        server.data_path,
+    )
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+def _element(tag: str) -> ElementTree.Element:
+    return ElementTree.Element(tag, xmlns=S3_NAMESPACE)
+
+
+def _sub(parent: ElementTree.Element, tag: str, text: str) -> ElementTree.Element:
+    e = ElementTree.SubElement(parent, tag)
+    e.text = text
+    return e
+
+
+def _find_all(root: ElementTree.Element, tag: str) -> list[ElementTree.Element]:
+    """Find child elements by local name, with or without the S3 namespace."""
+    return [e for e in root if e.tag.rsplit("}", 1)[-1] == tag]
+
+
+def _find_text(root: ElementTree.Element, tag: str) -> str | None:
+    found = _find_all(root, tag)
+    return found[0].text if found else None
+
+
+def _iso(timestamp: float) -> str:
+    return datetime.fromtimestamp(timestamp, tz=timezone.utc).strftime(
+        "%Y-%m-%dT%H:%M:%S.000Z"
+    )
+
+
+def _temp_path(fn: str) -> str:
+    return os.path.join(os.path.dirname(fn), f"{TEMP_FILE_PREFIX}{uuid.uuid4().hex}")
+
+
+def _parse_range(header: str, size: int) -> tuple[int, int]:
+    """Parse a single HTTP byte range into inclusive (start, end) offsets.
+
+    Raises:
+        S3Error: InvalidRange if the range cannot be satisfied.
+    """
+    match = RANGE_REGEX.match(header.strip())
+    if not match or match.groups() == ("", ""):
+        raise S3Error(416, "InvalidRange", "The requested range is not satisfiable")
+
+    first, last = match.groups()
+    if first == "":
+        # Suffix range: the last N bytes
+        start, end = max(0, size - int(last)), size - 1
+    else:
+        start = int(first)
+        end = min(int(last), size - 1) if last else size - 1
+
+    if start >= size or start > end:
+        raise S3Error(416, "InvalidRange", "The requested range is not satisfiable")
+
+    return start, end
+
+
+def _copy_stream(source, target, length: int) -> None:
+    """Copy exactly length bytes from source to target in fixed-size chunks.
+
+    Args:
+        source: Readable binary stream.
+        target: Writable binary stream, or None to discard the data.
+        length: Number of bytes to copy.
+
+    Raises:
+        ConnectionError: If the source ends early.
+    """
+    while length > 0:
+        chunk = source.read(min(STREAM_CHUNK_SIZE, length))
+        if not chunk:
+            raise ConnectionError("Unexpected end of stream")
+        if target is not None:
+            target.write(chunk)
+        length -= len(chunk)
+
+
+if __name__ == "__main__":
+    main()
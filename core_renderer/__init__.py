@@ -74,6 +74,14 @@ Performance:
     - Complex nested data structures with recursive rendering
     - Memory-efficient processing of template hierarchies
     - Minimal overhead for simple string template operations
+    - Compiled template strings cached per renderer (LRU, with hit metrics)
+    - Environments and compiled templates shared across renderers
+    - Compiled file templates persisted as bytecode across cold starts
+    - Template trees compiled into importable modules at build time
+    - Large outputs streamed to files or S3 in constant memory
+    - Edited templates invalidate only their dependents, via a dependency graph
+    - Optional asyncio rendering, so concurrent renders share one event loop
+    - Files inlined with read_file cached per process and validated by mtime
 
 Error Handling:
     Comprehensive error handling with:
@@ -81,6 +89,7 @@ Error Handling:
     - Clear error messages for template debugging and development
     - Graceful handling of missing templates and invalid configurations
     - Support for development and production error reporting modes
+    - Static checks of required variables and filters before rendering
 
 Thread Safety:
     The renderer is designed for safe concurrent use in multi-threaded
@@ -88,8 +97,37 @@ Thread Safety:
 """
 
 from .renderer import Jinja2Renderer
+from .template_cache import TemplateCache, DEFAULT_STRING_CACHE_SIZE
+from .bytecode import TemplateBytecodeCache, precompile_templates
+from .incremental import RenderManifest
+from .streaming import TemplateReader
+from .environment_pool import EnvironmentPool, get_environment_pool
+from .facts import FrozenFacts
+from .profiling import RenderProfile
+from .analysis import TemplateRequirementsError
+from .dependencies import TemplateDependencyGraph
+from .compiled import CompiledTemplateLoader, compile_template_tree
+from .file_cache import FileCache, get_file_cache
 
-__all__ = ["Jinja2Renderer"]
+__all__ = [
+    "Jinja2Renderer",
+    "TemplateCache",
+    "DEFAULT_STRING_CACHE_SIZE",
+    "TemplateBytecodeCache",
+    "precompile_templates",
+    "RenderManifest",
+    "TemplateReader",
+    "EnvironmentPool",
+    "get_environment_pool",
+    "FrozenFacts",
+    "RenderProfile",
+    "TemplateRequirementsError",
+    "TemplateDependencyGraph",
+    "CompiledTemplateLoader",
+    "compile_template_tree",
+    "FileCache",
+    "get_file_cache",
+]
 
 # Package metadata for documentation and introspection
 __version__ = "1.0.0"
@@ -120,14 +158,22 @@ def get_renderer_info() -> dict[str, any]:
             "Object rendering for complex data structures",
             "File rendering from configured sources",
             "Batch directory rendering",
+            "Parallel, streamed and incremental batch rendering",
+            "Streaming output to files and S3 uploads",
+            "Multi-component rendering against frozen deployment facts",
             "JSON rendering with parsing",
         ],
+        "caching": [
+            "LRU cache of compiled template strings with hit metrics",
+            "Persistent bytecode cache with build-time precompilation",
+            "Process-wide Environment pool shared by renderers",
+        ],
         "custom_filters": [
             "AWS resource management (aws_tags, docker_image, image_id)",
             "Security rules (ip_rules, iam_rules, parse_port_spec)",
-            "Network operations (split_cidr, subnet planning)",
+            "Network operations (split_cidr, allocate_subnets)",
             "Data transformation (lookup, extract, ensure_list)",
-            "String utilities (shorten_unique, regex_replace)",
+            "String utilities (shorten_unique, regex_replace, regex_replace_all)",
             "Date and formatting (format_date, to_json, to_yaml)",
         ],
         "integration_features": [
@@ -160,6 +206,11 @@ def get_renderer_info() -> dict[str, any]:
             "ECR image references",
             "CloudFormation outputs",
         ],
+        "profiling": "Opt-in per-filter and per-template timing reports",
+        "dependency_tracking": "Edited templates only invalidate their dependents",
+        "compiled_templates": "Template trees compiled at build time load by import",
+        "file_cache": "Files inlined with read_file are read once while unchanged",
+        "async_rendering": "Optional asyncio rendering with non-blocking file reads",
         "thread_safety": "Full thread safety for concurrent rendering",
         "error_handling": "Strict undefined checking with clear error messages",
         "performance": "Optimized for batch processing and large template sets",
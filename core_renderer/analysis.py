@@ -0,0 +1,346 @@
+"""
+Static Template Analysis for the Core Automation Renderer.
+
+With ``StrictUndefined`` a missing fact is only discovered when rendering reaches
+it, after part of the output (and often several other templates) has already been
+rendered. This module inspects the parsed templates instead, so a whole
+``render_files`` tree can be checked against a context before anything renders.
+
+Checks:
+    - **Variables**: Top-level variables a template reads without defining them,
+      including those of the templates it includes or extends
+    - **Filters and Tests**: Names not registered in the Environment
+    - **Templates**: Statically referenced templates that do not exist
+
+Conservative by Design:
+    The analysis must never reject inputs that would render. Variables guarded
+    anywhere in a template by ``is defined``, ``is undefined`` or the ``default``
+    filter are treated as optional, and so are variables and templates only
+    reached in conditionally evaluated code (``if`` and ``for`` bodies,
+    conditional expressions, the right side of ``and``/``or``, macro and call
+    block bodies). Variables assigned by an including template
+    are assumed to be provided to the included one, variables of parent template
+    blocks overridden by a child are ignored, and templates referenced by a
+    computed name are not followed. Anything it cannot prove is left to the
+    render.
+
+Caching:
+    The analysis of a template depends only on its source, so results are cached
+    per source hash and shared by every renderer in the process.
+"""
+
+from typing import Any
+
+import threading
+from collections import OrderedDict
+
+import jinja2
+import jinja2.meta
+import jinja2.nodes as nodes
+
+from .incremental import hash_text
+
+# Number of analyzed template sources kept in memory
+ANALYSIS_CACHE_SIZE = 4096
+
+# Filters and tests that make a missing variable acceptable
+GUARD_FILTERS = ("default", "d")
+GUARD_TESTS = ("defined", "undefined")
+
+_analysis_cache: OrderedDict[str, dict] = OrderedDict()
+_analysis_lock = threading.Lock()
+
+
+class TemplateRequirementsError(jinja2.exceptions.UndefinedError):
+    """A context does not satisfy the static requirements of the templates.
+
+    Subclasses UndefinedError so callers already handling StrictUndefined
+    failures handle it the same way.
+
+    Attributes:
+        problems: Mapping of template name to its problems, see check_templates().
+    """
+
+    def __init__(self, problems: dict[str, dict[str, list[str]]]):
+        self.problems = problems
+        lines = []
+        for name, problem in problems.items():
+            details = "; ".join(
+                f"{kind}: {', '.join(values)}" for kind, values in problem.items()
+            )
+            lines.append(f"{name}: {details}")
+        super().__init__("Template requirements not met:\n" + "\n".join(lines))
+
+
+def analyze_source(env: jinja2.Environment, source: str) -> dict[str, Any]:
+    """Analyze one template source.
+
+    Args:
+        env: The Environment used to parse the source.
+        source: The template source.
+
+    Returns:
+        Dictionary with the frozensets "variables" (required undeclared
+        variables), "assigned" (names the template defines), "filters", "tests",
+        "extends" and "includes" (static template names that receive the
+        context), "imports" (static template names that do not), "optional"
+        (referenced templates that may be missing), "conditional" (referenced
+        templates only reached conditionally), the mapping "blocks" of
+        block name to the variables it requires, and "dynamic" (True if a
+        template is referenced by a computed name).
+
+    Raises:
+        jinja2.TemplateSyntaxError: If the source cannot be parsed.
+    """
+    key = hash_text(source)
+    with _analysis_lock:
+        result = _analysis_cache.get(key)
+        if result is not None:
+            _analysis_cache.move_to_end(key)
+            return result
+
+    ast = env.parse(source)
+
+    # Unknown filters and tests are reported by the caller, but the variable
+    # analysis compiles the template and would fail on them
+    used_filters = {node.name for node in ast.find_all(nodes.Filter)}
+    used_tests = {node.name for node in ast.find_all(nodes.Test)}
+    if not (used_filters <= set(env.filters) and used_tests <= set(env.tests)):
+        overlay = env.overlay()
+        # The overlay shares its parent's dictionaries, so replace rather than update them
+        overlay.filters = {**{f: _placeholder for f in used_filters}, **env.filters}
+        overlay.tests = {**{t: _placeholder for t in used_tests}, **env.tests}
+        env = overlay
+        ast.set_environment(env)
+
+    guarded: set[str] = set()
+    for node in ast.find_all((nodes.Filter, nodes.Test)):
+        names = GUARD_FILTERS if isinstance(node, nodes.Filter) else GUARD_TESTS
+        if node.name in names and isinstance(node.node, nodes.Name):
+            guarded.add(node.node.name)
+
+    # Variables and template references evaluated on every render
+    loads: set[str] = set()
+    reached: set[int] = set()
+    _collect_unconditional(ast, loads, reached)
+
+    assigned = {node.name for node in ast.find_all(nodes.Name) if node.ctx != "load"}
+    assigned.update(node.name for node in ast.find_all(nodes.Macro))
+    for node in ast.find_all(nodes.Import):
+        assigned.add(node.target)
+    for node in ast.find_all(nodes.FromImport):
+        assigned.update(n if isinstance(n, str) else n[-1] for n in node.names)
+
+    extends: set[str] = set()
+    includes: set[str] = set()
+    imports: set[str] = set()
+    optional: set[str] = set()
+    conditional: set[str] = set()
+    always: set[str] = set()
+    dynamic = False
+    for node in ast.find_all(
+        (nodes.Extends, nodes.Include, nodes.Import, nodes.FromImport)
+    ):
+        with_context = isinstance(node, (nodes.Extends, nodes.Include)) or getattr(
+            node, "with_context", False
+        )
+        target = node.template
+        names = [target] if isinstance(target, nodes.Const) else []
+        if isinstance(target, (nodes.Tuple, nodes.List)):
+            names = target.items
+        if not names or not all(
+            isinstance(n, nodes.Const) and isinstance(n.value, str) for n in names
+        ):
+            dynamic = True
+            continue
+        values = [n.value for n in names]
+        if isinstance(node, nodes.Extends):
+            extends.update(values)
+        else:
+            (includes if with_context else imports).update(values)
+        # Only one of several candidates needs to exist
+        if getattr(node, "ignore_missing", False) or len(values) > 1:
+            optional.update(values)
+        (always if id(node) in reached else conditional).update(values)
+
+    blocks: dict[str, frozenset[str]] = {}
+    for node in ast.find_all(nodes.Block):
+        block = nodes.Template(node.body).set_environment(env)
+        blocks[node.name] = frozenset(
+            jinja2.meta.find_undeclared_variables(block) - guarded
+        )
+
+    result = {
+        "variables": frozenset(
+            (jinja2.meta.find_undeclared_variables(ast) - guarded) & loads
+        ),
+        "blocks": blocks,
+        "assigned": frozenset(assigned),
+        "filters": frozenset(used_filters),
+        "tests": frozenset(used_tests),
+        "extends": frozenset(extends),
+        "includes": frozenset(includes),
+        "imports": frozenset(imports),
+        "optional": frozenset(optional),
+        "conditional": frozenset(conditional - always),
+        "dynamic": dynamic,
+    }
+
+    with _analysis_lock:
+        _analysis_cache[key] = result
+        while len(_analysis_cache) > ANALYSIS_CACHE_SIZE:
+            _analysis_cache.popitem(last=False)
+
+    return result
+
+
+def _collect_unconditional(
+    node: nodes.Node, loads: set[str], reached: set[int]
+) -> None:
+    """Collect the variables read and the template references evaluated on every render.
+
+    Args:
+        node: The node to walk.
+        loads: Receives the names of the variables read.
+        reached: Receives the ids of the Extends, Include, Import and
+            FromImport nodes.
+    """
+    if isinstance(node, nodes.Name) and node.ctx == "load":
+        loads.add(node.name)
+    elif isinstance(
+        node, (nodes.Extends, nodes.Include, nodes.Import, nodes.FromImport)
+    ):
+        reached.add(id(node))
+
+    # Only the condition, the iterable or the call runs on every render
+    children: Any
+    if isinstance(node, (nodes.If, nodes.CondExpr)):
+        children = [node.test]
+    elif isinstance(node, nodes.For):
+        children = [node.iter]
+    elif isinstance(node, (nodes.And, nodes.Or)):
+        children = [node.left]
+    elif isinstance(node, nodes.CallBlock):
+        children = [node.call]
+    elif isinstance(node, nodes.Macro):
+        children = []
+    else:
+        children = node.iter_child_nodes()
+
+    for child in children:
+        _collect_unconditional(child, loads, reached)
+
+
+def _placeholder(*args, **kwargs) -> None:
+    """Stands in for unknown filters and tests during analysis."""
+
+
+def template_requirements(env: jinja2.Environment, name: str) -> dict[str, Any]:
+    """Collect the requirements of a template and every template it references.
+
+    Args:
+        env: The Environment loading the templates.
+        name: The template name.
+
+    Returns:
+        Dictionary with the sets "variables", "filters", "tests" and
+        "missing_templates".
+    """
+    variables: set[str] = set()
+    filters: set[str] = set()
+    tests: set[str] = set()
+    missing: set[str] = set()
+
+    # Each entry: template name, names provided by the templates including it,
+    # blocks overridden by the templates extending it, whether it receives the
+    # render context, and whether it may be missing
+    queue: list[tuple[str, frozenset[str], frozenset[str], bool, bool]] = [
+        (name, frozenset(), frozenset(), True, False)
+    ]
+    seen: set[tuple] = set()
+    while queue:
+        entry = queue.pop()
+        current, provided, overridden, with_context, optional = entry
+        if entry[:4] in seen:
+            continue
+        seen.add(entry[:4])
+
+        try:
+            source, _, _ = env.loader.get_source(env, current)
+        except jinja2.TemplateNotFound:
+            if not optional:
+                missing.add(current)
+            continue
+
+        result = analyze_source(env, source)
+        if with_context:
+            required = set(result["variables"])
+            for block in overridden & set(result["blocks"]):
+                required -= result["blocks"][block]
+            variables.update(required - provided)
+        filters.update(result["filters"])
+        tests.update(result["tests"])
+
+        inner = provided | result["assigned"]
+
+        # Templates only reached conditionally may be missing and require nothing
+        def follow(reference: str, blocks: frozenset[str], context: bool) -> None:
+            conditional = reference in result["conditional"]
+            queue.append(
+                (
+                    reference,
+                    inner,
+                    blocks,
+                    context and not conditional,
+                    conditional or reference in result["optional"],
+                )
+            )
+
+        for reference in result["extends"]:
+            follow(reference, overridden | set(result["blocks"]), with_context)
+        for reference in result["includes"]:
+            follow(reference, frozenset(), with_context)
+        for reference in result["imports"]:
+            follow(reference, frozenset(), False)
+
+    return {
+        "variables": variables - set(env.globals),
+        "filters": filters - set(env.filters),
+        "tests": tests - set(env.tests),
+        "missing_templates": missing,
+    }
+
+
+def check_templates(
+    env: jinja2.Environment, names: list[str], context: dict[str, Any]
+) -> dict[str, dict[str, list[str]]]:
+    """Check templates against a context without rendering them.
+
+    Args:
+        env: The Environment loading the templates.
+        names: The template names to check.
+        context: The context the templates will be rendered with.
+
+    Returns:
+        Mapping of template name to its problems, only for templates with
+        problems. Each problem maps "missing_variables", "unknown_filters",
+        "unknown_tests" or "missing_templates" to sorted names.
+    """
+    problems: dict[str, dict[str, list[str]]] = {}
+    for name in names:
+        try:
+            requirements = template_requirements(env, name)
+        except jinja2.TemplateSyntaxError as e:
+            problems[name] = {"syntax_error": [str(e)]}
+            continue
+
+        problem = {
+            "missing_variables": sorted(requirements["variables"] - set(context)),
+            "unknown_filters": sorted(requirements["filters"]),
+            "unknown_tests": sorted(requirements["tests"]),
+            "missing_templates": sorted(requirements["missing_templates"]),
+        }
+        problem = {kind: values for kind, values in problem.items() if values}
+        if problem:
+            problems[name] = problem
+    return problems
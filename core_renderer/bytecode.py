@@ -0,0 +1,235 @@
+"""
+Persistent Jinja2 Bytecode Cache for the Core Automation Renderer.
+
+Compiling a template from source is the most expensive step of loading it. Jinja2
+keeps compiled templates in memory per Environment only, so every new renderer and
+every Lambda cold start compiles the whole component template library again. This
+module stores the compiled bytecode on disk so it can be reused across renderers,
+processes and cold starts.
+
+Key Features:
+    - **Checksum Keyed**: Cache entries are keyed by template name, source checksum,
+      Jinja2 version and async mode, so edited templates or upgraded Jinja2 never
+      reuse stale bytecode, and entries stay valid when the template tree is moved
+    - **Read-only Precompiled Layers**: A cache precompiled at package build time
+      (``<template_path>/.bytecode``) is read first and never written, which suits
+      the read-only Lambda package directory
+    - **Writable Runtime Layer**: Newly compiled templates are written to a
+      private per-user folder of the temp directory (``/tmp`` on Lambda) or the
+      directory set in the ``TEMPLATE_BYTECODE_CACHE`` environment variable
+    - **Failure Tolerant**: A cache that cannot be written only costs recompilation
+
+Precompiling:
+    Compile a template tree into its precompiled layer at build time with::
+
+        python -m core_renderer.bytecode path/to/templates
+
+Notes:
+    Bytecode is only valid for the Python version that produced it. Jinja2 embeds
+    the Python version in each entry and ignores entries from other versions.
+
+    Loading bytecode executes it, so the default temp folder is created with mode
+    0700 and only used while it is owned by the current user with that mode, like
+    Jinja2's own default cache directory. Other users of a shared host cannot
+    plant bytecode in it.
+"""
+
+import os
+import hashlib
+import argparse
+
+import jinja2
+import jinja2.bccache
+
+import core_framework as util
+import core_logging as log
+
+# Environment variable overriding the writable bytecode cache directory ("false" disables it)
+ENV_TEMPLATE_BYTECODE_CACHE = "TEMPLATE_BYTECODE_CACHE"
+
+# Folder within the temp directory holding the writable bytecode cache
+DEFAULT_BYTECODE_FOLDER = "jinja2-bytecode"
+
+# Folder within a template tree holding its precompiled bytecode
+PRECOMPILED_FOLDER = ".bytecode"
+
+
+class TemplateBytecodeCache(jinja2.FileSystemBytecodeCache):
+    """Filesystem bytecode cache keyed by template name, source checksum and Jinja2 version.
+
+    Entries are looked up in the writable directory first and then in any
+    read-only directories (such as a precompiled cache shipped with the package).
+    Only the writable directory is written to.
+
+    Attributes:
+        directory: The writable cache directory.
+        read_only_directories: Additional directories that are only read from.
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        read_only_directories: list[str] | None = None,
+    ):
+        """Initialize the cache.
+
+        Args:
+            directory: The writable cache directory. Created if it does not exist.
+            read_only_directories: Directories holding precompiled entries.
+        """
+        super().__init__(directory)
+        self.read_only_directories = [
+            d for d in (read_only_directories or []) if os.path.isdir(d)
+        ]
+        try:
+            os.makedirs(directory, exist_ok=True)
+        except OSError as e:
+            log.debug("Cannot create template bytecode cache {}: {}", directory, e)
+
+    def get_bucket(
+        self,
+        environment: jinja2.Environment,
+        name: str,
+        filename: str | None,
+        source: str,
+    ) -> jinja2.bccache.Bucket:
+        """Return the cache bucket for a template, keyed by name and source checksum.
+
+        Unlike the default key, the template's absolute filename is not used so
+        entries precompiled on a build machine remain valid at runtime. Async
+        environments compile different code and get their own entries.
+        """
+        checksum = self.get_source_checksum(source)
+        text = f"{jinja2.__version__}|{name}|{checksum}"
+        if environment.is_async:
+            text += "|async"
+        key = hashlib.sha1(text.encode("utf-8")).hexdigest()
+        bucket = jinja2.bccache.Bucket(environment, key, checksum)
+        self.load_bytecode(bucket)
+        return bucket
+
+    def load_bytecode(self, bucket: jinja2.bccache.Bucket) -> None:
+        """Load bytecode from the writable directory, then the read-only ones."""
+        super().load_bytecode(bucket)
+        for directory in self.read_only_directories:
+            if bucket.code is not None:
+                return
+            try:
+                with open(
+                    os.path.join(directory, self.pattern % bucket.key), "rb"
+                ) as f:
+                    bucket.load_bytecode(f)
+            except OSError:
+                continue
+
+    def dump_bytecode(self, bucket: jinja2.bccache.Bucket) -> None:
+        """Write bytecode to the writable directory, ignoring filesystem errors."""
+        try:
+            super().dump_bytecode(bucket)
+        except OSError as e:
+            log.debug("Cannot write template bytecode to {}: {}", self.directory, e)
+
+
+def get_bytecode_cache_dir() -> str | None:
+    """Return the writable bytecode cache directory.
+
+    Returns:
+        The directory from ``TEMPLATE_BYTECODE_CACHE``, a private versioned
+        per-user folder in the temp directory by default, or None if the cache
+        is disabled or the default folder is not safe to use.
+    """
+    directory = os.getenv(ENV_TEMPLATE_BYTECODE_CACHE)
+    if directory is None or directory == "":
+        folder = f"{DEFAULT_BYTECODE_FOLDER}-{jinja2.__version__}"
+        directory = util.get_private_temp_dir(folder)
+        if directory is None and hasattr(os, "getuid"):
+            log.warning(
+                "No private template bytecode cache folder in {}, not caching",
+                util.get_temp_dir(),
+            )
+        return directory
+    if directory.lower() == "false":
+        return None
+    return directory
+
+
+def create_bytecode_cache(
+    template_path: str | None = None, directory: str | None = None
+) -> TemplateBytecodeCache | None:
+    """Create the bytecode cache for a renderer.
+
+    Args:
+        template_path: The renderer's template directory. Its precompiled folder
+            is used as a read-only layer when present.
+        directory: The writable cache directory. Defaults to get_bytecode_cache_dir().
+
+    Returns:
+        The bytecode cache, or None if bytecode caching is disabled.
+    """
+    directory = directory or get_bytecode_cache_dir()
+    if directory is None:
+        return None
+    read_only = (
+        [os.path.join(template_path, PRECOMPILED_FOLDER)] if template_path else []
+    )
+    return TemplateBytecodeCache(directory, read_only)
+
+
+def precompile_templates(template_path: str, output_dir: str | None = None) -> int:
+    """Compile every template in a tree into a bytecode cache directory.
+
+    Run at package build time so the precompiled folder ships with the templates
+    and renderers created at runtime do not compile them again.
+
+    Args:
+        template_path: The template directory.
+        output_dir: Where to write the bytecode. Defaults to the template tree's
+            precompiled folder (``<template_path>/.bytecode``).
+
+    Returns:
+        The number of templates compiled. Files that are not valid templates are
+        skipped with a warning.
+    """
+    # Imported here, the renderer imports this module
+    from .renderer import Jinja2Renderer
+
+    output_dir = output_dir or os.path.join(template_path, PRECOMPILED_FOLDER)
+    # A private Environment, so no template is already compiled in memory
+    renderer = Jinja2Renderer(
+        template_path, bytecode_cache=output_dir, shared_environment=False
+    )
+
+    count = 0
+    prefix = PRECOMPILED_FOLDER + "/"
+    for name in renderer.env.list_templates():
+        if name.startswith(prefix):
+            continue
+        try:
+            renderer.env.get_template(name)
+            count += 1
+        except (jinja2.TemplateError, UnicodeDecodeError) as e:
+            log.warning("Skipping template {}: {}", name, e)
+
+    log.info(
+        "Precompiled {} templates from {} into {}", count, template_path, output_dir
+    )
+    return count
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Precompile a template tree from the command line."""
+    parser = argparse.ArgumentParser(
+        description="Precompile Jinja2 templates to bytecode"
+    )
+    parser.add_argument("template_path", help="Template directory")
+    parser.add_argument(
+        "--output-dir",
+        default=None,
+        help=f"Bytecode directory (defaults to <template_path>/{PRECOMPILED_FOLDER})",
+    )
+    args = parser.parse_args(argv)
+    precompile_templates(args.template_path, args.output_dir)
+
+
+if __name__ == "__main__":
+    main()
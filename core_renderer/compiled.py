@@ -0,0 +1,195 @@
+"""
+Ahead-of-time Compiled Template Trees for the Core Automation Renderer.
+
+The bytecode cache (core_renderer.bytecode) avoids compiling templates, but a
+renderer still reads every template source and checks it against the cache. This
+module compiles a whole template tree into Python modules (a zip archive or a
+directory, see ``jinja2.Environment.compile_templates``) at build time, and
+provides a loader that imports templates from it, so a Lambda cold start imports
+compiled code instead of reading and parsing the ``.j2`` files.
+
+Key Features:
+    - **Build-time Compilation**: One command compiles the tree with the same
+      settings and filters as Jinja2Renderer
+    - **Import-based Loading**: Compiled templates are loaded with
+      ``jinja2.ModuleLoader``; no source is read
+    - **Source Fallback**: Templates missing from the archive load from the
+      template directory as usual, and template listing and static analysis keep
+      using the sources
+    - **Ships With the Tree**: The default archive lives in the precompiled
+      folder (``<template_path>/.bytecode``), which is never rendered
+
+Compiling:
+    Compile a template tree at build time with::
+
+        python -m core_renderer.compiled path/to/templates
+
+    and create renderers with ``Jinja2Renderer(template_path, compiled_templates=True)``.
+
+Notes:
+    Compiled templates are not checked against their sources. Recompile the
+    archive whenever the templates change, as part of the package build.
+"""
+
+from typing import Any, MutableMapping
+
+import os
+import argparse
+
+import jinja2
+from jinja2.utils import internalcode
+
+import core_logging as log
+
+from .bytecode import PRECOMPILED_FOLDER
+
+# Default compiled archive, relative to the precompiled folder of a template tree
+COMPILED_ARCHIVE = "templates.zip"
+
+
+def get_compiled_path(template_path: str) -> str:
+    """Return the default compiled archive of a template tree."""
+    return os.path.join(template_path, PRECOMPILED_FOLDER, COMPILED_ARCHIVE)
+
+
+class CompiledTemplateLoader(jinja2.BaseLoader):
+    """Loader importing templates compiled ahead of time.
+
+    Templates not in the compiled modules are loaded from the fallback loader.
+    Sources (``get_source``, ``list_templates``) always come from the fallback.
+    """
+
+    def __init__(self, compiled_path: str, fallback: jinja2.BaseLoader | None = None):
+        """Initialize the loader.
+
+        Args:
+            compiled_path: The zip archive or directory produced by compile_template_tree.
+            fallback: Loader for the template sources.
+        """
+        self.compiled_path = compiled_path
+        self.fallback = fallback
+        self._modules = jinja2.ModuleLoader(compiled_path)
+
+    def __getattr__(self, name: str) -> Any:
+        # Expose the fallback's attributes, e.g. FileSystemLoader.searchpath
+        fallback = self.__dict__.get("fallback")
+        if fallback is None:
+            raise AttributeError(name)
+        return getattr(fallback, name)
+
+    def get_source(
+        self, environment: jinja2.Environment, template: str
+    ) -> tuple[str, str | None, Any]:
+        if self.fallback is None:
+            raise jinja2.TemplateNotFound(template)
+        return self.fallback.get_source(environment, template)
+
+    def list_templates(self) -> list[str]:
+        if self.fallback is None:
+            return []
+        return self.fallback.list_templates()
+
+    @internalcode
+    def load(
+        self,
+        environment: jinja2.Environment,
+        name: str,
+        globals: MutableMapping[str, Any] | None = None,
+    ) -> jinja2.Template:
+        try:
+            return self._modules.load(environment, name, globals)
+        except jinja2.TemplateNotFound:
+            if self.fallback is None:
+                raise
+        # Compiles from source through get_source (and the bytecode cache)
+        return super().load(environment, name, globals)
+
+
+def compile_template_tree(
+    template_path: str, target: str | None = None, zip: str | None = "deflated"
+) -> int:
+    """Compile every template in a tree into Python modules.
+
+    Args:
+        template_path: The template directory.
+        target: The zip archive or directory to write. Defaults to
+            get_compiled_path(template_path).
+        zip: Compression of the archive ("deflated" or "stored"), or None to
+            write a directory of modules.
+
+    Returns:
+        The number of templates compiled. Files that are not valid templates are
+        skipped with a warning.
+    """
+    # Imported here, the renderer imports this module
+    from .renderer import Jinja2Renderer
+
+    target = target or get_compiled_path(template_path)
+    if zip is not None:
+        os.makedirs(os.path.dirname(os.path.abspath(target)), exist_ok=True)
+
+    # A private Environment with the renderer's settings and filters
+    renderer = Jinja2Renderer(
+        template_path, bytecode_cache=False, shared_environment=False
+    )
+    env = renderer.env
+
+    prefix = PRECOMPILED_FOLDER + "/"
+    compiled: list[str] = []
+
+    def is_template(name: str) -> bool:
+        if name.startswith(prefix):
+            return False
+        try:
+            env.loader.get_source(env, name)
+        except UnicodeDecodeError as e:
+            log.warning("Skipping template {}: {}", name, e)
+            return False
+        return True
+
+    def log_function(message: str) -> None:
+        # Jinja2 reports each template as 'Compiled "name" as ...' or
+        # 'Could not compile "name": error' (syntax errors are skipped)
+        if message.startswith("Compiled "):
+            compiled.append(message)
+        elif message.startswith("Could not compile"):
+            log.warning("Skipping template: {}", message)
+
+    env.compile_templates(
+        target,
+        zip=zip,
+        filter_func=is_template,
+        log_function=log_function,
+        ignore_errors=True,
+    )
+
+    log.info(
+        "Compiled {} templates from {} into {}", len(compiled), template_path, target
+    )
+    return len(compiled)
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Compile a template tree from the command line."""
+    parser = argparse.ArgumentParser(
+        description="Compile Jinja2 templates into importable Python modules"
+    )
+    parser.add_argument("template_path", help="Template directory")
+    parser.add_argument(
+        "--output",
+        default=None,
+        help=f"Zip archive or directory (defaults to <template_path>/{PRECOMPILED_FOLDER}/{COMPILED_ARCHIVE})",
+    )
+    parser.add_argument(
+        "--directory",
+        action="store_true",
+        help="Write a directory of modules instead of a zip archive",
+    )
+    args = parser.parse_args(argv)
+    compile_template_tree(
+        args.template_path, args.output, None if args.directory else "deflated"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,211 @@
+"""
+Template Dependency Graph for the Core Automation Renderer.
+
+Templates reference each other through ``extends``, ``include``, ``import`` and
+``from ... import`` (macro libraries). Without knowing these edges, a cache of
+compiled templates or rendered outputs has to be discarded as a whole whenever
+any template changes. This module maintains the graph of those references so
+caches can be invalidated for exactly the templates an edit affects.
+
+Key Features:
+    - **Incremental**: ``refresh()`` only parses templates whose source changed
+      since the last refresh (checked with the loader's up-to-date callbacks, a
+      stat per file for directories), and drops deleted templates
+    - **Transitive Queries**: Dependencies of a template and dependents of a
+      template, following every kind of reference
+    - **Conservative**: Templates referencing others by a computed name are
+      treated as depending on every template
+    - **Shared Parsing**: References come from core_renderer.analysis, whose
+      per-source cache is shared with the static checks
+"""
+
+from typing import Callable, Iterable
+
+import threading
+
+import jinja2
+
+import core_logging as log
+
+from .analysis import analyze_source
+from .bytecode import PRECOMPILED_FOLDER
+
+
+class TemplateDependencyGraph:
+    """Graph of the references between the templates of an Environment.
+
+    Call refresh() before querying to pick up changed files.
+    """
+
+    def __init__(self, env: jinja2.Environment):
+        """Initialize an empty graph.
+
+        Args:
+            env: The Environment whose loader provides the templates.
+        """
+        self.env = env
+
+        # name -> templates it references directly
+        self._references: dict[str, frozenset[str]] = {}
+        # name -> templates referencing it directly
+        self._referrers: dict[str, set[str]] = {}
+        # Templates referencing others by a computed name
+        self._dynamic: set[str] = set()
+        # name -> loader callback telling whether the parsed source is current
+        self._uptodate: dict[str, Callable[[], bool] | None] = {}
+        self._lock = threading.RLock()
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._uptodate
+
+    def refresh(self) -> set[str]:
+        """Bring the graph up to date with the templates of the loader.
+
+        Returns:
+            The names of the templates added, changed or removed since the
+            last refresh.
+        """
+        with self._lock:
+            prefix = PRECOMPILED_FOLDER + "/"
+            names = {
+                name
+                for name in self.env.loader.list_templates()
+                if not name.startswith(prefix)
+            }
+
+            changed: set[str] = set()
+            for name in set(self._uptodate) - names:
+                self._remove(name)
+                changed.add(name)
+
+            for name in names:
+                uptodate = self._uptodate.get(name)
+                if name in self._uptodate and uptodate is not None and uptodate():
+                    continue
+                self._load(name)
+                changed.add(name)
+
+            return changed
+
+    def references(self, name: str) -> frozenset[str]:
+        """Templates a template references directly."""
+        with self._lock:
+            return self._references.get(name, frozenset())
+
+    def is_dynamic(self, name: str) -> bool:
+        """True if a template references another by a computed name."""
+        with self._lock:
+            return name in self._dynamic
+
+    def dependencies(self, name: str) -> set[str] | None:
+        """Templates a template depends on, directly or transitively.
+
+        Returns:
+            The dependencies, excluding the template itself, or None if any of
+            them is referenced by a computed name.
+        """
+        with self._lock:
+            found: set[str] = set()
+            queue = [name]
+            while queue:
+                current = queue.pop()
+                if current in self._dynamic:
+                    return None
+                for reference in self._references.get(current, ()):
+                    if reference not in found and reference != name:
+                        found.add(reference)
+                        queue.append(reference)
+            return found
+
+    def dependents(self, name: str) -> set[str]:
+        """Templates depending on a template, directly or transitively.
+
+        Templates with computed references are always included, together with
+        their own dependents.
+
+        Returns:
+            The dependents, excluding the template itself.
+        """
+        return self.affected([name]) - {name}
+
+    def affected(self, names: Iterable[str]) -> set[str]:
+        """Templates whose output may change when the given templates change.
+
+        Args:
+            names: The changed templates.
+
+        Returns:
+            The changed templates and all of their dependents.
+        """
+        with self._lock:
+            found = set(names)
+            if not found:
+                return found
+            queue = list(found | self._dynamic)
+            found.update(self._dynamic)
+            while queue:
+                current = queue.pop()
+                for referrer in self._referrers.get(current, ()):
+                    if referrer not in found:
+                        found.add(referrer)
+                        queue.append(referrer)
+            return found
+
+    def invalidate(
+        self, names: Iterable[str], env: jinja2.Environment | None = None
+    ) -> set[str]:
+        """Evict templates and their dependents from the Environment's template cache.
+
+        Args:
+            names: The changed templates.
+            env: The Environment to evict from, e.g. an overlay of the graph's
+                Environment. Defaults to the graph's Environment.
+
+        Returns:
+            The templates evicted (or that would have been, if not cached).
+        """
+        affected = self.affected(names)
+        env = env or self.env
+        cache = env.cache
+        if cache is not None:
+            loader = env.loader
+            for key in list(cache.keys()):
+                if key[0]() is loader and key[1] in affected:
+                    try:
+                        del cache[key]
+                    except KeyError:
+                        pass
+        return affected
+
+    def _load(self, name: str) -> None:
+        """Parse a template and replace its outgoing edges."""
+        self._remove_edges(name)
+        try:
+            source, _, uptodate = self.env.loader.get_source(self.env, name)
+            result = analyze_source(self.env, source)
+        except (jinja2.TemplateError, UnicodeDecodeError) as e:
+            # Not a template (or not one yet): no edges until it changes again
+            log.debug("Cannot analyze template {}: {}", name, e)
+            self._uptodate[name] = None
+            return
+
+        self._uptodate[name] = uptodate
+        references = result["extends"] | result["includes"] | result["imports"]
+        self._references[name] = references
+        for reference in references:
+            self._referrers.setdefault(reference, set()).add(name)
+        if result["dynamic"]:
+            self._dynamic.add(name)
+
+    def _remove(self, name: str) -> None:
+        """Remove a deleted template."""
+        self._remove_edges(name)
+        self._uptodate.pop(name, None)
+
+    def _remove_edges(self, name: str) -> None:
+        """Remove the outgoing edges of a template."""
+        for reference in self._references.pop(name, frozenset()):
+            referrers = self._referrers.get(reference)
+            if referrers is not None:
+                referrers.discard(name)
+        self._dynamic.discard(name)
@@ -0,0 +1,167 @@
+"""
+Shared Jinja2 Environment Pool for the Core Automation Renderer.
+
+A Jinja2 Environment owns the in-memory cache of compiled templates. Creating a
+renderer per component or per request used to create a new Environment each
+time, loading every filter again and compiling every template again. This module
+keeps a bounded, process-wide registry of Environments keyed by their loader
+configuration, so renderers over the same template set share one Environment,
+its filters and its compiled templates.
+
+Key Features:
+    - **Keyed by Loader Configuration**: Template directories are keyed by their
+      absolute path, template dictionaries by a hash of their content
+    - **Size-bounded LRU**: The least recently used Environments are dropped first
+    - **Thread Safe**: Each configuration is created once even under concurrency
+    - **Opt Out**: ``Jinja2Renderer(..., shared_environment=False)`` keeps a
+      private Environment
+
+Notes:
+    Shared Environments are shared state. Filters or globals added to
+    ``renderer.env`` are seen by every renderer over the same template set.
+    Dictionary templates are copied when the Environment is created, so later
+    changes to the caller's dictionary are not seen by the shared Environment.
+"""
+
+from typing import Any, Callable, Hashable
+
+import os
+import hashlib
+import threading
+from collections import OrderedDict
+
+import jinja2
+
+# Default number of Environments kept in the process-wide pool
+DEFAULT_ENVIRONMENT_POOL_SIZE = 32
+
+
+class EnvironmentPool:
+    """Thread-safe LRU registry of Jinja2 Environments keyed by loader configuration.
+
+    Attributes:
+        max_size: Maximum number of Environments kept. 0 disables sharing.
+        hits: Number of lookups served from the pool.
+        misses: Number of lookups that created an Environment.
+        evictions: Number of Environments dropped to respect max_size.
+    """
+
+    def __init__(self, max_size: int = DEFAULT_ENVIRONMENT_POOL_SIZE):
+        """Initialize an empty pool.
+
+        Args:
+            max_size: Maximum number of Environments kept. 0 disables sharing.
+        """
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        self._environments: OrderedDict[Hashable, jinja2.Environment] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._environments)
+
+    def get(
+        self, key: Hashable, create: Callable[[], jinja2.Environment]
+    ) -> jinja2.Environment:
+        """Return the Environment for a key, creating it on a miss.
+
+        Args:
+            key: The loader configuration key, see environment_key().
+            create: Function creating the Environment.
+
+        Returns:
+            The shared Environment.
+        """
+        with self._lock:
+            env = self._environments.get(key)
+            if env is not None:
+                self._environments.move_to_end(key)
+                self.hits += 1
+                return env
+            self.misses += 1
+
+            # Created under the lock so concurrent renderers get the same instance
+            env = create()
+            if self.max_size > 0:
+                self._environments[key] = env
+                while len(self._environments) > self.max_size:
+                    self._environments.popitem(last=False)
+                    self.evictions += 1
+
+        return env
+
+    def clear(self) -> None:
+        """Remove every Environment and reset the metrics."""
+        with self._lock:
+            self._environments.clear()
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+
+    def stats(self) -> dict[str, int | float]:
+        """Return the pool metrics.
+
+        Returns:
+            Dictionary with size, max_size, hits, misses, evictions and hit_rate.
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._environments),
+                "max_size": self.max_size,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+            }
+
+
+def environment_key(
+    environment_class: type[jinja2.Environment],
+    template_path: str | None,
+    dictionary: dict[str, str] | None,
+    bytecode_cache: Any = None,
+    enable_async: bool = False,
+    compiled_templates: Any = None,
+) -> tuple:
+    """Return the pool key of a loader configuration.
+
+    Args:
+        environment_class: The Environment class, e.g. NativeEnvironment.
+        template_path: The template directory, if loading from the filesystem.
+        dictionary: The template dictionary, if loading from a dictionary.
+        bytecode_cache: The renderer's bytecode cache setting.
+        enable_async: Whether the Environment compiles templates for async rendering.
+        compiled_templates: The renderer's compiled templates setting.
+
+    Returns:
+        A hashable key. Equal keys mean interchangeable Environments.
+    """
+    class_name = f"{environment_class.__module__}.{environment_class.__qualname__}"
+    if template_path is not None:
+        source = ("path", os.path.abspath(template_path))
+    else:
+        digest = hashlib.sha256()
+        for name, template in sorted((dictionary or {}).items()):
+            digest.update(name.encode("utf-8") + b"\0")
+            digest.update(template.encode("utf-8") + b"\0")
+        source = ("dict", digest.hexdigest())
+    return (
+        class_name,
+        source,
+        repr(bytecode_cache),
+        bool(enable_async),
+        repr(compiled_templates),
+    )
+
+
+# Process-wide pool used by Jinja2Renderer
+_environment_pool = EnvironmentPool()
+
+
+def get_environment_pool() -> EnvironmentPool:
+    """Return the process-wide Environment pool."""
+    return _environment_pool
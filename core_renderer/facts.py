@@ -0,0 +1,393 @@
+"""
+Frozen Deployment Facts for Multi-component Rendering.
+
+The compiler renders every component of a deployment against the same facts.
+Context-aware filters such as ``tags``, ``ip_rules`` and ``policy_statements``
+derive the same values from the facts (resource name parts, tags per scope,
+security alias sources) on every call, for every resource of every
+component.
+
+FrozenFacts is a read-only snapshot of the facts that computes these derived
+values once and shares them between all renders using it. The filters use the
+precomputed values when ``context`` is a FrozenFacts and derive them from the
+plain dictionary otherwise, so both produce identical output.
+
+Key Features:
+    - **Snapshot**: The facts are deep-copied once, so later changes to the
+      caller's dictionary cannot leak into renders in progress
+    - **Read-only**: Top-level mutation raises TypeError, so the snapshot can be
+      shared by renders running in parallel threads
+    - **Precomputed Values**: Resource name parts, tags per scope and component,
+      security alias sources and component security names are computed at most
+      once
+    - **Drop-in**: A dict subclass, so templates and filters reading the facts
+      as a dictionary are unaffected
+"""
+
+from typing import Any, Callable
+
+import copy
+import threading
+from collections import OrderedDict
+
+import core_framework as util
+
+from core_framework.constants import (
+    DD_APP,
+    DD_BRANCH,
+    DD_BRANCH_SHORT_NAME,
+    DD_BUILD,
+    DD_ENVIRONMENT,
+    DD_PORTFOLIO,
+    DD_SCOPE,
+    DD_TAGS,
+    SCOPE_APP,
+    SCOPE_BRANCH,
+    SCOPE_BUILD,
+    SCOPE_ENVIRONMENT,
+    SCOPE_PORTFOLIO,
+    TAG_APP,
+    TAG_BRANCH,
+    TAG_BUILD,
+    TAG_COMPONENT,
+    TAG_ENVIRONMENT,
+    TAG_NAME,
+    TAG_PORTFOLIO,
+)
+
+
+def get_names(facts: dict) -> dict[str, str]:
+    """Return the resource name parts of the deployment.
+
+    Args:
+        facts: The deployment facts.
+
+    Returns:
+        Dictionary with portfolio, app, branch, branch_short_name, build,
+        environment, aws_region, aws_account_id and base_name (the hyphenated
+        portfolio, app and branch short name).
+    """
+    names = {
+        "portfolio": facts.get(DD_PORTFOLIO, ""),
+        "app": facts.get(DD_APP, ""),
+        "branch": facts.get(DD_BRANCH, ""),
+        "branch_short_name": facts.get(DD_BRANCH_SHORT_NAME, ""),
+        "build": facts.get(DD_BUILD, ""),
+        "environment": facts.get(DD_ENVIRONMENT, ""),
+        "aws_region": (
+            facts["AwsRegion"] if "AwsRegion" in facts else util.get_aws_region()
+        ),
+        "aws_account_id": facts.get("AwsAccountId", ""),
+    }
+    names["base_name"] = "-".join(
+        [names["portfolio"], names["app"], names["branch_short_name"]]
+    )
+    return names
+
+
+def build_tags(facts: dict, scope: str | None, component_name: str) -> dict:
+    """Create the standard tags of a component for a lifecycle scope.
+
+    Args:
+        facts: The deployment facts.
+        scope: The lifecycle scope. Defaults to the deployment scope.
+        component_name: The component name.
+
+    Returns:
+        Dictionary of tag key-value pairs. See filter_tags.
+    """
+    names = get_names(facts)
+    portfolio = names["portfolio"]
+    app = names["app"]
+    branch = names["branch"]
+    branch_short_name = names["branch_short_name"]
+    build = names["build"]
+    environment = names["environment"]
+
+    # Portfolio is mandatory, and always included in the tags
+    tags = {TAG_PORTFOLIO: portfolio, **facts.get(DD_TAGS, {})}
+
+    if not scope:
+        scope = facts.get(DD_SCOPE, SCOPE_BUILD)
+
+    if scope == SCOPE_ENVIRONMENT:
+        tags.update(
+            {
+                TAG_NAME: f"{portfolio}-{app}-{environment}-{component_name}",
+                TAG_ENVIRONMENT: environment,
+            }
+        )
+    elif scope == SCOPE_PORTFOLIO:
+        tags.update(
+            {
+                TAG_ENVIRONMENT: environment,
+                TAG_COMPONENT: component_name,
+                TAG_NAME: f"{portfolio}-{component_name}",
+            }
+        )
+    elif scope == SCOPE_APP:
+        tags.update(
+            {
+                TAG_APP: app,
+                TAG_ENVIRONMENT: environment,
+                TAG_COMPONENT: component_name,
+                TAG_NAME: f"{portfolio}-{app}-{component_name}",
+            }
+        )
+    elif scope == SCOPE_BRANCH:
+        tags.update(
+            {
+                TAG_APP: app,
+                TAG_BRANCH: branch,
+                TAG_ENVIRONMENT: environment,
+                TAG_COMPONENT: component_name,
+                TAG_NAME: f"{portfolio}-{app}-{branch}-{component_name}",
+            }
+        )
+
+    elif scope == SCOPE_BUILD:
+        tags.update(
+            {
+                TAG_APP: app,
+                TAG_BRANCH: branch,
+                TAG_BUILD: build,
+                TAG_ENVIRONMENT: environment,
+                TAG_COMPONENT: component_name,
+                TAG_NAME: f"{portfolio}-{app}-{branch_short_name}-{build}-{component_name}",
+            }
+        )
+
+    return tags
+
+
+def get_security_aliases(facts: dict) -> dict[str, list[dict]]:
+    """Return the security aliases with only their dictionary sources.
+
+    Args:
+        facts: The deployment facts.
+
+    Returns:
+        Dictionary mapping each alias to its list of source dictionaries.
+    """
+    return {
+        alias: [source for source in sources or [] if isinstance(source, dict)]
+        for alias, sources in (facts.get("SecurityAliases") or {}).items()
+    }
+
+
+class FrozenFacts(dict):
+    """Read-only snapshot of deployment facts with precomputed derived values.
+
+    Pass it as the ``context`` variable of a render (or to
+    ``Jinja2Renderer.render_components``) to share one snapshot between every
+    component of a deployment. Nested values are not copied on access; treat
+    them as read-only.
+    """
+
+    def __init__(self, facts: dict):
+        """Snapshot the facts.
+
+        Args:
+            facts: The deployment facts. Deep-copied.
+        """
+        super().__init__(copy.deepcopy(dict(facts)))
+        self._derived: dict[Any, Any] = {}
+        self._lock = threading.Lock()
+
+    def _read_only(self, *args, **kwargs):
+        raise TypeError("FrozenFacts is read-only")
+
+    __setitem__ = _read_only
+    __delitem__ = _read_only
+    __ior__ = _read_only
+    clear = _read_only
+    pop = _read_only
+    popitem = _read_only
+    setdefault = _read_only
+    update = _read_only
+
+    def __copy__(self) -> "FrozenFacts":
+        return self
+
+    def __deepcopy__(self, memo: dict) -> dict:
+        # Deep copies are made to be modified, so return a plain dictionary
+        return copy.deepcopy(dict(self), memo)
+
+    def __reduce__(self):
+        return (FrozenFacts, (dict(self),))
+
+    def thaw(self) -> dict:
+        """Return a mutable deep copy of the facts."""
+        return copy.deepcopy(dict(self))
+
+    def derived(self, key: Any, build: Callable[[dict], Any]) -> Any:
+        """Return a value derived from the facts, computing it once.
+
+        Args:
+            key: Hashable name of the derived value.
+            build: Function computing the value from the facts.
+
+        Returns:
+            The derived value. Shared between callers; do not modify it.
+        """
+        with self._lock:
+            if key in self._derived:
+                return self._derived[key]
+
+        # Derived values are pure, so a concurrent duplicate computation is harmless
+        value = build(self)
+        with self._lock:
+            return self._derived.setdefault(key, value)
+
+    @property
+    def names(self) -> dict[str, str]:
+        """Resource name parts of the deployment. See get_names."""
+        return self.derived("names", get_names)
+
+    @property
+    def security_aliases(self) -> dict[str, list[dict]]:
+        """Security alias sources. See get_security_aliases."""
+        return self.derived("security_aliases", get_security_aliases)
+
+    @property
+    def security_index(self) -> "SecurityIndex":
+        """Security rule sources, resolved once per alias and component."""
+        return self.derived("security_index", SecurityIndex)
+
+    def tags(self, scope: str | None, component_name: str) -> dict:
+        """Return the standard tags of a component for a scope.
+
+        Returns:
+            A new dictionary the caller may modify. See build_tags.
+        """
+        tags = self.derived(
+            ("tags", scope, component_name),
+            lambda facts: build_tags(facts, scope, component_name),
+        )
+        return dict(tags)
+
+
+def get_facts_names(facts: dict) -> dict[str, str]:
+    """Resource name parts, precomputed when facts is a FrozenFacts."""
+    if isinstance(facts, FrozenFacts):
+        return facts.names
+    return get_names(facts)
+
+
+class SecurityIndex:
+    """Security rule sources of a deployment for ip_rules and iam_rules.
+
+    Each security alias is normalized the first time it is looked up, and the
+    security group and role names of each component are built the first time
+    it is referenced. Shared by every render using the same facts, see
+    get_security_index.
+    """
+
+    def __init__(self, facts: dict):
+        """Index the facts.
+
+        Args:
+            facts: The deployment facts.
+        """
+        self._source = facts.get("SecurityAliases")
+        self._base_name = _security_base_name(facts)
+        self._aliases: dict[str, list[dict] | None] = {}
+        self._components: dict[str, dict[str, str]] = {}
+        self._lock = threading.Lock()
+
+    def is_current(self, facts: dict) -> bool:
+        """True if the facts still hold the aliases and names this index was built from."""
+        return facts.get(
+            "SecurityAliases"
+        ) is self._source and self._base_name == _security_base_name(facts)
+
+    def alias(self, name: str) -> list[dict] | None:
+        """Return the dictionary sources of a security alias.
+
+        Args:
+            name: The alias name.
+
+        Returns:
+            The sources, or None if name is not a security alias. Shared
+            between callers; do not modify it.
+        """
+        with self._lock:
+            if name in self._aliases:
+                return self._aliases[name]
+
+        sources: list[dict] | None = None
+        if self._source and name in self._source:
+            sources = [
+                source
+                for source in self._source[name] or []
+                if isinstance(source, dict)
+            ]
+        with self._lock:
+            return self._aliases.setdefault(name, sources)
+
+    def component(self, name: str) -> dict[str, str]:
+        """Return the security names of a component.
+
+        Args:
+            name: The component name (its label in the app).
+
+        Returns:
+            Dictionary with the "SecurityGroupId" and "RoleName" references.
+            Shared between callers; do not modify it.
+        """
+        with self._lock:
+            component = self._components.get(name)
+        if component is None:
+            prefix = f"{self._base_name}-{name}"
+            component = {
+                "SecurityGroupId": f"{prefix}-security:SecurityGroupId",
+                "RoleName": f"{prefix}-security:RoleName",
+            }
+            with self._lock:
+                component = self._components.setdefault(name, component)
+        return component
+
+
+def _security_base_name(facts: dict) -> str:
+    """The portfolio, app and branch short name that prefix component security names."""
+    return "-".join(
+        [
+            facts.get(DD_PORTFOLIO, ""),
+            facts.get(DD_APP, ""),
+            facts.get(DD_BRANCH_SHORT_NAME, ""),
+        ]
+    )
+
+
+# Number of plain facts dictionaries whose SecurityIndex is kept
+SECURITY_INDEX_CACHE_SIZE = 8
+
+# id(facts) -> (facts, index). The facts are referenced so the id stays theirs
+_security_indexes: OrderedDict[int, tuple[dict, SecurityIndex]] = OrderedDict()
+_security_indexes_lock = threading.Lock()
+
+
+def get_security_index(facts: dict) -> SecurityIndex:
+    """Security rule sources, built once per facts object.
+
+    FrozenFacts keep their index. The indexes of the most recently used plain
+    dictionaries are kept too, and rebuilt if the dictionary's SecurityAliases
+    or name parts are replaced.
+    """
+    if isinstance(facts, FrozenFacts):
+        return facts.security_index
+
+    key = id(facts)
+    with _security_indexes_lock:
+        entry = _security_indexes.get(key)
+        if entry is not None and entry[0] is facts and entry[1].is_current(facts):
+            _security_indexes.move_to_end(key)
+            return entry[1]
+
+    index = SecurityIndex(facts)
+    with _security_indexes_lock:
+        _security_indexes[key] = (facts, index)
+        _security_indexes.move_to_end(key)
+        while len(_security_indexes) > SECURITY_INDEX_CACHE_SIZE:
+            _security_indexes.popitem(last=False)
+    return index
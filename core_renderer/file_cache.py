@@ -0,0 +1,138 @@
+"""
+File Content Cache for the Core Automation Renderer.
+
+The ``read_file`` filter inlines files such as user-data scripts and policy
+snippets into templates. Templates often inline the same file in many
+resources, and every call used to open and read it again, from local disk or
+from a network-mounted storage volume.
+
+This module provides a process-wide cache of file contents keyed by absolute
+path. Each lookup costs one ``stat``: an entry is only used while the file's
+modification time and size are unchanged.
+
+Key Features:
+    - **Validated**: Entries are checked against the file's mtime and size, so
+      edited files are read again
+    - **Byte-bounded LRU**: The least recently used files are evicted once the
+      total size exceeds the limit; larger files are read but not cached
+    - **Shared**: One cache for every renderer in the process
+    - **Metrics**: Hit, miss and eviction counters for tuning the size limit
+"""
+
+import os
+import threading
+from collections import OrderedDict
+
+# Default total size in bytes of the cached file contents
+DEFAULT_FILE_CACHE_BYTES = 16 * 1024 * 1024
+
+
+class FileCache:
+    """Thread-safe LRU cache of text file contents, bounded by total size.
+
+    Attributes:
+        max_bytes: Maximum total size of the cached files. 0 disables caching.
+        hits: Number of reads served from the cache.
+        misses: Number of reads that read the file.
+        evictions: Number of files evicted to respect max_bytes.
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_FILE_CACHE_BYTES):
+        """Initialize an empty cache.
+
+        Args:
+            max_bytes: Maximum total size of the cached files. 0 disables caching.
+        """
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        # path -> (mtime_ns, size, content)
+        self._files: OrderedDict[str, tuple[int, int, str]] = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._files)
+
+    def read(self, path: str, encoding: str = "utf-8") -> str:
+        """Return the text of a file, from the cache while it is unchanged.
+
+        Args:
+            path: The file path.
+            encoding: The file encoding.
+
+        Returns:
+            The file content, with universal newlines as ``open(path, "r")``.
+
+        Raises:
+            OSError: If the file cannot be read.
+            UnicodeDecodeError: If the file is not valid text.
+        """
+        key = os.path.abspath(path)
+        stat = os.stat(key)
+
+        with self._lock:
+            entry = self._files.get(key)
+            if entry is not None and entry[:2] == (stat.st_mtime_ns, stat.st_size):
+                self._files.move_to_end(key)
+                self.hits += 1
+                return entry[2]
+            self.misses += 1
+
+        with open(key, "r", encoding=encoding) as f:
+            # Validate against the file actually read
+            stat = os.fstat(f.fileno())
+            content = f.read()
+
+        if self.max_bytes > 0 and stat.st_size <= self.max_bytes:
+            with self._lock:
+                previous = self._files.pop(key, None)
+                if previous is not None:
+                    self._bytes -= previous[1]
+                self._files[key] = (stat.st_mtime_ns, stat.st_size, content)
+                self._bytes += stat.st_size
+                while self._bytes > self.max_bytes:
+                    _, (_, size, _) = self._files.popitem(last=False)
+                    self._bytes -= size
+                    self.evictions += 1
+
+        return content
+
+    def clear(self) -> None:
+        """Remove every file and reset the metrics."""
+        with self._lock:
+            self._files.clear()
+            self._bytes = 0
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+
+    def stats(self) -> dict[str, int | float]:
+        """Return the cache metrics.
+
+        Returns:
+            Dictionary with size, bytes, max_bytes, hits, misses, evictions and
+            hit_rate.
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._files),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+            }
+
+
+# Process-wide cache used by the read_file filter
+_file_cache = FileCache()
+
+
+def get_file_cache() -> FileCache:
+    """Return the process-wide file content cache."""
+    return _file_cache
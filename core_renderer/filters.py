@@ -25,6 +25,7 @@ Filter Categories:
     - iam_rules: Create IAM policy statements with resource ARNs
     - parse_port_spec: Parse port specifications for security groups
     - split_cidr: Split CIDR blocks into subnets
+    - allocate_subnets: Carve a VPC CIDR into subnets per availability zone
 
     **Data Processing Filters:**
     - lookup: Navigate nested data structures with dot notation
@@ -35,9 +36,13 @@ Filter Categories:
     **String and Utility Filters:**
     - shorten_unique: Truncate strings with unique suffixes
     - regex_replace: Pattern-based string replacement
+    - regex_replace_all: Several pattern-based replacements in order
     - format_date: Date formatting with flexible input
     - min_int: Find minimum values from multiple inputs
 
+    **File Filters:**
+    - read_file: Read a file, without blocking the event loop in async environments
+
 Integration:
     All filters are designed to work seamlessly with the Core Automation framework's
     context system, automatically extracting deployment metadata like portfolio,
@@ -53,8 +58,10 @@ from typing import Any
 
 import os
 import copy
+import asyncio
+import functools
+import hashlib
 import jinja2
-import jmespath
 import re
 import random
 import string
@@ -67,6 +74,12 @@ from jinja2.environment import Context, Environment
 
 import core_framework as util
 
+from .facts import FrozenFacts, build_tags, get_facts_names, get_security_index
+from .profiling import instrument_environment
+from .paths import navigate_path, search_expression
+from .file_cache import get_file_cache
+from .incremental import record_file_read
+
 from core_framework.constants import (
     CTX_ACCOUNT_ALIASES,
     CTX_APP,
@@ -80,19 +93,15 @@ from core_framework.constants import (
     CTX_SHARED_FILES_PREFIX,
     CTX_SNAPSHOT_ALIASES,
     DD_APP,
-    DD_BRANCH,
     DD_BRANCH_SHORT_NAME,
     DD_BUILD,
     DD_ECR,
-    DD_ENVIRONMENT,
     DD_PORTFOLIO,
     DD_SCOPE,
-    DD_TAGS,
     ECR_REGISTRY_URI,
     SCOPE_APP,
     SCOPE_BRANCH,
     SCOPE_BUILD,
-    SCOPE_ENVIRONMENT,
     SCOPE_PORTFOLIO,
     SCOPE_SHARED,
     ST_CIDR,
@@ -100,15 +109,22 @@ from core_framework.constants import (
     ST_IP_ADDRESS,
     ST_PREFIX,
     ST_SECURITY_GROUP,
-    TAG_APP,
-    TAG_BRANCH,
-    TAG_BUILD,
-    TAG_COMPONENT,
-    TAG_ENVIRONMENT,
-    TAG_NAME,
-    TAG_PORTFOLIO,
+    V_FALSE,
+    V_TRUE,
 )
 
+# Number of parsed port specifications kept in memory
+PORT_SPEC_CACHE_SIZE = 512
+
+# Number of compiled regular expressions (and replacement lists) kept in memory
+REGEX_CACHE_SIZE = 1024
+
+# Most subnets split_cidr returns without an explicit limit
+MAX_SPLIT_SUBNETS = 4096
+
+# Environment variable selecting the legacy shorten_unique suffixes ("true")
+ENV_SHORTEN_UNIQUE_LEGACY = "SHORTEN_UNIQUE_LEGACY"
+
 
 @pass_context
 def filter_aws_tags(
@@ -178,10 +194,11 @@ def filter_docker_image(render_context: Context, object: Any) -> str | None:
             "Must specify Fn::Pipeline::DockerImage lookup"
         )
 
-    portfolio = facts.get(DD_PORTFOLIO, "")
-    app = facts.get(DD_APP, "")
-    branch = facts.get(DD_BRANCH_SHORT_NAME, "")
-    build = facts.get(DD_BUILD, "")
+    names = get_facts_names(facts)
+    portfolio = names["portfolio"]
+    app = names["app"]
+    branch = names["branch_short_name"]
+    build = names["build"]
     component = render_context.get(CTX_COMPONENT_NAME, "unspecified")
 
     ecr_repository_name = "-".join(
@@ -270,7 +287,8 @@ def filter_extract(object: Any, path: str, default: str = "_error_") -> str:
 
     Performs safe value extraction from complex nested data structures using
     JMESPath query expressions. Provides flexible error handling with
-    configurable default values.
+    configurable default values. Each expression is compiled once
+    (see core_renderer.paths).
 
     Args:
         object: The source object to query. Can be dict, list, or any
@@ -291,7 +309,7 @@ def filter_extract(object: Any, path: str, default: str = "_error_") -> str:
     value = (
         None
         if object is None or isinstance(object, jinja2.Undefined)
-        else jmespath.search(path, object)
+        else search_expression(path, object)
     )
 
     if value is None:
@@ -340,9 +358,7 @@ def filter_iam_rules(render_context: Context, resource: dict) -> list:
     if facts is None or app is None:
         return []
 
-    portfolio = facts.get(DD_PORTFOLIO, "")
-    app_name = facts.get(DD_APP, "")
-    branch_short_name = facts.get(DD_BRANCH_SHORT_NAME, "")
+    security_index = get_security_index(facts)
 
     security_rules: list[dict] = []
     for security_rule in resource.get("Pipeline::Security", {}):
@@ -374,30 +390,15 @@ def filter_iam_rules(render_context: Context, resource: dict) -> list:
                 )
 
             # Source is component
+            component = security_index.component(source)
             security_rules.append(
                 {
                     "Type": "component",
-                    "Value": "-".join(
-                        [
-                            portfolio,
-                            app_name,
-                            branch_short_name,
-                            source,
-                            "security:RoleName",
-                        ]
-                    ),
+                    "Value": component["RoleName"],
                     "Description": f"Component {source}",
                     "Allow": filter_ensure_list(security_rule.get("Allow", [])),
                     "SourceType": app_source.get("Type", ""),
-                    "SecurityGroupId": "-".join(
-                        [
-                            portfolio,
-                            app_name,
-                            branch_short_name,
-                            source,
-                            "security:SecurityGroupId",
-                        ]
-                    ),
+                    "SecurityGroupId": component["SecurityGroupId"],
                 }
             )
 
@@ -545,10 +546,7 @@ def filter_ip_rules(  # noqa C901
     if facts is None or app is None:
         return []
 
-    security_aliases: dict = facts.get("SecurityAliases", {})
-    portfolio = facts.get(DD_PORTFOLIO, "")
-    branch_short_name = facts.get(DD_BRANCH_SHORT_NAME, "")
-    app_name = facts.get(DD_APP, "")
+    security_index = get_security_index(facts)
 
     security_rules: list[dict] = []
 
@@ -561,27 +559,18 @@ def filter_ip_rules(  # noqa C901
 
             sources: list[dict] = []
 
-            if security_source in security_aliases:
+            alias_sources = security_index.alias(security_source)
+            if alias_sources is not None:
                 # Source is an alias in facts
-                sources = [
-                    o
-                    for o in security_aliases.get(security_source, None)
-                    if isinstance(o, dict)
-                ]
+                sources = alias_sources
             elif security_source in app:
                 # Source is component
                 sources = [
                     {
                         "Type": ST_COMPONENT,
-                        "Value": "-".join(
-                            [
-                                portfolio,
-                                app_name,
-                                branch_short_name,
-                                security_source,
-                                "security:SecurityGroupId",
-                            ]
-                        ),
+                        "Value": security_index.component(security_source)[
+                            "SecurityGroupId"
+                        ],
                         "Description": "Component {}".format(security_source),
                     }
                 ]
@@ -593,22 +582,6 @@ def filter_ip_rules(  # noqa C901
                     )
                 )
 
-            # Convert old format SecurityAliases to new format
-            sources = list(
-                map(
-                    lambda source: (
-                        source
-                        if isinstance(source, dict)
-                        else {
-                            "Type": ST_CIDR,
-                            "Value": source,
-                            "Description": security_source,
-                        }
-                    ),
-                    sources,
-                )
-            )
-
             # Filter security rule source_types
             sources = [
                 source for source in sources if source.get("Type", "") in source_types
@@ -623,20 +596,21 @@ def filter_ip_rules(  # noqa C901
                     for allow in filter_ensure_list(security_rule.get("Allow", [])):
                         if not isinstance(allow, str):
                             continue
-                        security_rules.append(
-                            {**source, **filter_parse_port_spec(allow)}
-                        )
+                        security_rules.append({**source, **_parse_port_spec(allow)})
 
     return security_rules
 
 
 @pass_context
-def filter_lookup(render_context: Context, path: str, default: str = "_error_") -> str:
+def filter_lookup(
+    render_context: Context, path: str, default: str = "_error_", query: bool = False
+) -> str:
     """Look up a value in the render context using the specified path.
 
     Navigates nested data structures using dot notation with support for
     array indexing and property names containing special characters. Provides
-    flexible path traversal for complex template variable access.
+    flexible path traversal for complex template variable access. Each distinct
+    path is parsed once (see core_renderer.paths).
 
     Args:
         render_context: The Jinja2 context containing template variables and data.
@@ -644,6 +618,8 @@ def filter_lookup(render_context: Context, path: str, default: str = "_error_")
              'items[0].name', 'data.key/with/slashes').
         default: Value to return if path doesn't exist. Special value '_error_'
                 causes an exception to be raised.
+        query: Treat path as a JMESPath expression over the context
+              (e.g. 'Components[?Type==`web`].Name').
 
     Returns:
         The value found at the specified path, or the default value if
@@ -655,7 +631,10 @@ def filter_lookup(render_context: Context, path: str, default: str = "_error_")
     """
     context_data = render_context.parent
 
-    value = _navigate_path(context_data, path)
+    if query:
+        value = search_expression(path, context_data)
+    else:
+        value = navigate_path(context_data, path)
 
     if value is None:
         if default == "_error_":
@@ -669,85 +648,6 @@ def filter_lookup(render_context: Context, path: str, default: str = "_error_")
     return value
 
 
-def _navigate_path(data: Any, path: str) -> Any:
-    """Recursively navigate through nested data using dot-separated path.
-
-    Internal helper function that handles the complex logic of path navigation
-    through nested dictionaries and lists. Supports array indexing with bracket
-    notation and property names containing forward slashes.
-
-    Args:
-        data: The current data object to navigate through (dict, list, or other).
-        path: The remaining path to navigate using dot-separated segments.
-             Supports array indexing with [n] syntax.
-
-    Returns:
-        The value at the specified path, or None if path is invalid or not found.
-
-    Features:
-        - Array indexing: 'items[0]' accesses first element of items array
-        - Property names with slashes: 'config.key/with/slashes.value'
-        - Recursive navigation through nested structures
-    """
-    if not path:
-        return data
-
-    if not isinstance(data, (dict, list)):
-        return None
-
-    # Split on the first dot to get the current segment and remaining path
-    if "." in path:
-        current_segment, remaining_path = path.split(".", 1)
-    else:
-        current_segment = path
-        remaining_path = ""
-
-    # Handle array indexing: items[1] -> key="items", index=1
-    if "[" in current_segment and current_segment.endswith("]"):
-        # Extract the key and index
-        key_part, index_part = current_segment.split("[", 1)
-        index_str = index_part.rstrip("]")
-
-        try:
-            index = int(index_str)
-        except ValueError:
-            return None  # Invalid index
-
-        # Navigate to the array first
-        if isinstance(data, dict):
-            if key_part not in data:
-                return None
-            array_data = data[key_part]
-        else:
-            return None  # Can't use key on non-dict
-
-        # Check if it's actually a list and index is valid
-        if not isinstance(array_data, list) or index >= len(array_data) or index < 0:
-            return None
-
-        # Get the item at the index
-        current_value = array_data[index]
-
-    else:
-        # Regular property access (handles keys with forward slashes)
-        if isinstance(data, dict):
-            if current_segment not in data:
-                return None
-            current_value = data[current_segment]
-        elif isinstance(data, list):
-            # If we're trying to access a property on a list, that's invalid
-            return None
-        else:
-            return None
-
-    # If no remaining path, return the current value
-    if not remaining_path:
-        return current_value
-
-    # Recursively navigate the remaining path
-    return _navigate_path(current_value, remaining_path)
-
-
 def filter_min_int(*values) -> Any | None:
     """Find the minimum integer value from the provided arguments.
 
@@ -849,6 +749,12 @@ def filter_parse_port_spec(port_spec: str) -> dict:
         jinja2.exceptions.FilterArgumentError: If port specification format is invalid
                                              or values are out of valid ranges.
     """
+    return dict(_parse_port_spec(port_spec))
+
+
+@functools.lru_cache(maxsize=PORT_SPEC_CACHE_SIZE)
+def _parse_port_spec(port_spec: str) -> dict:
+    """Parse a port specification once. Shared result; see filter_parse_port_spec."""
     PORT_SPEC_REGEX = r"^((?:TCP)|(?:UDP)|(?:ICMP)|(?:ALL)):((?:[0-9]+)|(?:\*))(?:-((?:[0-9]+)|(?:\*)))?$"
     match = re.match(PORT_SPEC_REGEX, port_spec)
 
@@ -959,14 +865,11 @@ def filter_policy_statements(render_context: Context, statement: dict) -> dict:
     if facts is None:
         return {}
 
-    aws_region = facts.get("AwsRegion", util.get_aws_region())
-    aws_account_id = facts.get("AwsAccountId", "")
-
-    portfolio = facts.get(DD_PORTFOLIO, "")
-    app = facts.get(DD_APP, "")
-    branch_short_name = facts.get(DD_BRANCH_SHORT_NAME, "")
+    names = get_facts_names(facts)
+    aws_region = names["aws_region"]
+    aws_account_id = names["aws_account_id"]
 
-    base_resource_name_hyphenated = "-".join([portfolio, app, branch_short_name])
+    base_resource_name_hyphenated = names["base_name"]
 
     resources = []
     added: set[str] = set()
@@ -1050,7 +953,8 @@ def filter_regex_replace(s, find, replace) -> str:
     """Perform regex-based string replacement operations.
 
     Provides regex pattern matching and replacement functionality for template
-    string manipulation. Uses Python's re.sub for pattern matching.
+    string manipulation. Uses Python's re.sub for pattern matching, with each
+    pattern compiled once and kept in an LRU of REGEX_CACHE_SIZE patterns.
 
     Args:
         s: The source string to perform replacement on.
@@ -1060,7 +964,54 @@ def filter_regex_replace(s, find, replace) -> str:
     Returns:
         Modified string with all pattern matches replaced.
     """
-    return re.sub(find, replace, s)
+    return _compile_regex(find).sub(replace, s)
+
+
+def filter_regex_replace_all(s, replacements: dict | list) -> str:
+    """Apply several regex replacements in order.
+
+    Useful for sanitizing names, e.g.
+    ``name | regex_replace_all([['[^a-z0-9-]', '-'], ['-+', '-']])``. Each
+    replacement sees the result of the previous ones. The compiled list is
+    cached, so repeating the same replacements costs only the substitutions.
+
+    Args:
+        s: The source string to perform replacements on.
+        replacements: Mapping of pattern to replacement, or list of
+                     [pattern, replacement] pairs.
+
+    Returns:
+        Modified string with every replacement applied.
+
+    Raises:
+        jinja2.exceptions.FilterArgumentError: If replacements is not a mapping
+                                             or a list of pairs.
+    """
+    pairs = replacements.items() if isinstance(replacements, dict) else replacements
+    try:
+        key = tuple((find, replace) for find, replace in pairs)
+    except (TypeError, ValueError) as e:
+        raise jinja2.exceptions.FilterArgumentError(
+            "Filter_regex_replace_all: Replacements must be a dictionary or a list of [pattern, replacement] pairs"
+        ) from e
+
+    for pattern, replace in _compile_replacements(key):
+        s = pattern.sub(replace, s)
+    return s
+
+
+@functools.lru_cache(maxsize=REGEX_CACHE_SIZE)
+def _compile_regex(pattern: str) -> re.Pattern:
+    """Compile a regular expression once."""
+    return re.compile(pattern)
+
+
+@functools.lru_cache(maxsize=REGEX_CACHE_SIZE)
+def _compile_replacements(
+    pairs: tuple[tuple[str, str], ...],
+) -> tuple[tuple[re.Pattern, str], ...]:
+    """Compile the patterns of a list of replacements once."""
+    return tuple((_compile_regex(find), replace) for find, replace in pairs)
 
 
 def filter_format_date(value: Any, f: str = "%d-%b-%y") -> str:
@@ -1120,13 +1071,19 @@ def filter_rstrip(value: str, chars: str) -> str:
 
 
 def filter_shorten_unique(
-    value: str, limit: int, unique_length: int = 0, charset: str | None = None
+    value: str,
+    limit: int,
+    unique_length: int = 0,
+    charset: str | None = None,
+    legacy: bool | None = None,
 ):
     """Shorten a string to a specified limit and append a unique string of a given length.
 
     Truncates strings while maintaining uniqueness through deterministic suffix
     generation. Useful for AWS resource names with length limitations while
-    ensuring collision avoidance.
+    ensuring collision avoidance. The suffix is derived from a BLAKE2 digest of
+    the value and touches no shared random state, so it is safe in parallel
+    renders.
 
     Args:
         value: The source string to shorten.
@@ -1134,6 +1091,9 @@ def filter_shorten_unique(
         unique_length: Length of unique suffix to append. 0 means no suffix.
         charset: Character set for unique string generation. Defaults to
                 alphanumeric uppercase characters.
+        legacy: Generate the suffix of earlier releases (a seeded random
+               sequence), to keep the names of existing resources. Defaults
+               to the SHORTEN_UNIQUE_LEGACY environment variable.
 
     Returns:
         Shortened string with deterministic unique suffix if needed.
@@ -1145,14 +1105,38 @@ def filter_shorten_unique(
     if charset is None:
         charset = string.ascii_uppercase + string.digits
 
+    if legacy is None:
+        legacy = os.getenv(ENV_SHORTEN_UNIQUE_LEGACY, V_FALSE).lower() == V_TRUE
+
     shortened_string = value[0 : (limit - unique_length)]
 
-    random.seed(value)
-    unique_string = "".join(random.choice(charset) for _ in range(unique_length))
+    if legacy:
+        # A private generator yields the same sequence as seeding the global one
+        generator = random.Random(value)
+        unique_string = "".join(generator.choice(charset) for _ in range(unique_length))
+    else:
+        unique_string = _hash_suffix(value, unique_length, charset)
 
     return shortened_string + unique_string
 
 
+def _hash_suffix(value: str, length: int, charset: str) -> str:
+    """Map a BLAKE2 digest of value onto length characters of charset."""
+    digest = hashlib.blake2b(value.encode("utf-8")).digest()
+    number = int.from_bytes(digest, "big")
+    # Characters drawn from one digest; longer suffixes hash the digest again
+    per_digest = len(digest) * 8 // max(1, (len(charset) - 1).bit_length())
+
+    characters = []
+    for position in range(length):
+        if position and position % per_digest == 0:
+            digest = hashlib.blake2b(digest).digest()
+            number = int.from_bytes(digest, "big")
+        number, index = divmod(number, len(charset))
+        characters.append(charset[index])
+    return "".join(characters)
+
+
 @pass_context
 def filter_snapshot_id(
     render_context: Context, snapshot_spec: dict, component_type: str
@@ -1285,25 +1269,35 @@ def filter_snapshot_name(
 
 
 def filter_split_cidr(
-    cidr: str, allowed_prefix_lengths: list[int] = [8, 16, 24, 32]
+    cidr: str,
+    allowed_prefix_lengths: list[int] = [8, 16, 24, 32],
+    limit: int | None = None,
+    offset: int = 0,
 ) -> list[str]:
     """Split a CIDR into subnets based on allowed prefix lengths.
 
     Divides CIDR blocks into smaller subnets using specified prefix lengths.
     Useful for VPC subnet planning and network segmentation in AWS deployments.
+    Only the requested subnets are generated, by integer arithmetic on the
+    network address.
 
     Args:
         cidr: CIDR notation string to split (e.g., '10.0.0.0/16').
         allowed_prefix_lengths: List of valid prefix lengths for subnet creation.
                                Defaults to common subnet sizes [8, 16, 24, 32].
+        limit: Maximum number of subnets returned. None returns all of them, up
+              to MAX_SPLIT_SUBNETS.
+        offset: Number of leading subnets skipped.
 
     Returns:
         List of subnet CIDR strings. Returns original CIDR if it already
         matches an allowed prefix length.
 
     Raises:
-        jinja2.exceptions.FilterArgumentError: If CIDR is invalid or prefix
-                                             length exceeds allowed values.
+        jinja2.exceptions.FilterArgumentError: If CIDR is invalid, prefix
+                                             length exceeds allowed values, or
+                                             more than MAX_SPLIT_SUBNETS subnets
+                                             are requested.
     """
 
     try:
@@ -1315,7 +1309,7 @@ def filter_split_cidr(
 
     # Do not split if CIDR already has an allowed prefix length
     if ip.prefixlen in allowed_prefix_lengths:
-        return [str(ip)]
+        return [str(ip)][offset:][:limit]
 
     # Find the smallest allowed prefix length
     try:
@@ -1327,7 +1321,133 @@ def filter_split_cidr(
             )
         )
 
-    return [str(x) for x in ip.subnet(size)]
+    max_bits = 32 if ip.version == 4 else 128
+    if size > max_bits:
+        raise jinja2.exceptions.FilterArgumentError(
+            "Failed to split CIDR '{}', prefix {} is longer than {} bits".format(
+                cidr, size, max_bits
+            )
+        )
+
+    count = 1 << (size - ip.prefixlen)
+    first = max(offset, 0)
+    last = count if limit is None else min(count, first + max(limit, 0))
+    if last - first > MAX_SPLIT_SUBNETS:
+        raise jinja2.exceptions.FilterArgumentError(
+            "Failed to split CIDR '{}' into {} subnets of /{}, more than {}. Use limit and offset".format(
+                cidr, last - first, size, MAX_SPLIT_SUBNETS
+            )
+        )
+
+    step = 1 << (max_bits - size)
+    return [
+        _format_network(ip.first + index * step, size, ip.version)
+        for index in range(first, last)
+    ]
+
+
+def filter_allocate_subnets(
+    cidr: str,
+    subnets: dict[str, int] | list[int],
+    zones: list[str] | int = 1,
+) -> list[dict]:
+    """Carve a VPC CIDR into subnets of the requested sizes in every zone.
+
+    Every requested subnet is allocated once per zone. Subnets are packed from
+    the start of the CIDR, largest first, so every subnet is aligned and no
+    space is lost between them. The allocation is computed with integer
+    arithmetic on the network address for all subnets at once.
+
+    Args:
+        cidr: The VPC CIDR to allocate from (e.g., '10.0.0.0/16').
+        subnets: Prefix length of each subnet, either by name
+                (e.g., {'public': 24, 'private': 20}) or as a list.
+        zones: Availability zone names, or the number of zones.
+
+    Returns:
+        One dictionary per subnet and zone, in request order then zone order,
+        with 'Name' (the subnet name, or its index in the list), 'AzIndex',
+        'Zone' (when zone names are given) and 'Cidr'.
+
+    Raises:
+        jinja2.exceptions.FilterArgumentError: If the CIDR or a prefix length is
+                                             invalid, or the subnets do not fit.
+    """
+    try:
+        ip = netaddr.IPNetwork(cidr)
+    except Exception as e:
+        raise jinja2.exceptions.FilterArgumentError(
+            "Invalid CIDR '{}' - {}".format(cidr, str(e))
+        )
+
+    if isinstance(subnets, dict):
+        requests = list(subnets.items())
+    elif isinstance(subnets, list):
+        requests = list(enumerate(subnets))
+    else:
+        raise jinja2.exceptions.FilterArgumentError(
+            "Filter_allocate_subnets: Subnets must be a dictionary or a list of prefix lengths"
+        )
+
+    zone_names = zones if isinstance(zones, list) else None
+    zone_count = len(zones) if isinstance(zones, list) else int(zones)
+    if zone_count < 1:
+        raise jinja2.exceptions.FilterArgumentError(
+            "Filter_allocate_subnets: At least one zone is required"
+        )
+
+    max_bits = 32 if ip.version == 4 else 128
+    for name, prefix_length in requests:
+        if (
+            not isinstance(prefix_length, int)
+            or prefix_length < ip.prefixlen
+            or prefix_length > max_bits
+        ):
+            raise jinja2.exceptions.FilterArgumentError(
+                "Filter_allocate_subnets: Invalid prefix length {} for subnet '{}' in '{}'".format(
+                    prefix_length, name, cidr
+                )
+            )
+
+    # Block sizes of every (request, zone), allocated largest first. A running
+    # sum of decreasing powers of two is always aligned to the next block size.
+    blocks = [
+        (1 << (max_bits - prefix_length), position, zone)
+        for position, (_, prefix_length) in enumerate(requests)
+        for zone in range(zone_count)
+    ]
+    order = sorted(range(len(blocks)), key=lambda i: -blocks[i][0])
+
+    offsets = [0] * len(blocks)
+    total = 0
+    for i in order:
+        offsets[i] = total
+        total += blocks[i][0]
+
+    if total > ip.size:
+        raise jinja2.exceptions.FilterArgumentError(
+            "Filter_allocate_subnets: Subnets need {} addresses, more than the {} of '{}'".format(
+                total, ip.size, cidr
+            )
+        )
+
+    allocations: list[dict] = []
+    for (size, position, zone), offset in zip(blocks, offsets):
+        name, prefix_length = requests[position]
+        allocation = {"Name": name, "AzIndex": zone}
+        if zone_names is not None:
+            allocation["Zone"] = zone_names[zone]
+        allocation["Cidr"] = _format_network(
+            ip.first + offset, prefix_length, ip.version
+        )
+        allocations.append(allocation)
+    return allocations
+
+
+def _format_network(address: int, prefix_length: int, version: int) -> str:
+    """Format an integer network address as a CIDR string, without netaddr objects."""
+    strategy = netaddr.strategy.ipv4 if version == 4 else netaddr.strategy.ipv6
+    return f"{strategy.int_to_str(address)}/{prefix_length}"
 
 
 def filter_subnet_network_zone(data: Any, default: str = "private") -> str:
@@ -1441,67 +1561,10 @@ def filter_tags(
     if component_name is None:
         component_name = render_context.get(CTX_COMPONENT_NAME, "")
 
-    portfolio = facts.get(DD_PORTFOLIO, "")
-    app = facts.get(DD_APP, "")
-    branch = facts.get(DD_BRANCH, "")
-    branch_short_name = facts.get(DD_BRANCH_SHORT_NAME, "")
-    build = facts.get(DD_BUILD, "")
-    environment = facts.get(DD_ENVIRONMENT, "")
-
-    # Portfolio is mandatory, and always included in the tags
-    tags = {TAG_PORTFOLIO: portfolio, **facts.get(DD_TAGS, {})}
+    if isinstance(facts, FrozenFacts):
+        return facts.tags(scope, component_name)
 
-    if not scope:
-        scope = facts.get(DD_SCOPE, SCOPE_BUILD)
-
-    if scope == SCOPE_ENVIRONMENT:
-        tags.update(
-            {
-                TAG_NAME: f"{portfolio}-{app}-{environment}-{component_name}",
-                TAG_ENVIRONMENT: environment,
-            }
-        )
-    elif scope == SCOPE_PORTFOLIO:
-        tags.update(
-            {
-                TAG_ENVIRONMENT: environment,
-                TAG_COMPONENT: component_name,
-                TAG_NAME: f"{portfolio}-{component_name}",
-            }
-        )
-    elif scope == SCOPE_APP:
-        tags.update(
-            {
-                TAG_APP: app,
-                TAG_ENVIRONMENT: environment,
-                TAG_COMPONENT: component_name,
-                TAG_NAME: f"{portfolio}-{app}-{component_name}",
-            }
-        )
-    elif scope == SCOPE_BRANCH:
-        tags.update(
-            {
-                TAG_APP: app,
-                TAG_BRANCH: branch,
-                TAG_ENVIRONMENT: environment,
-                TAG_COMPONENT: component_name,
-                TAG_NAME: f"{portfolio}-{app}-{branch}-{component_name}",
-            }
-        )
-
-    elif scope == SCOPE_BUILD:
-        tags.update(
-            {
-                TAG_APP: app,
-                TAG_BRANCH: branch,
-                TAG_BUILD: build,
-                TAG_ENVIRONMENT: environment,
-                TAG_COMPONENT: component_name,
-                TAG_NAME: f"{portfolio}-{app}-{branch_short_name}-{build}-{component_name}",
-            }
-        )
-
-    return tags
+    return build_tags(facts, scope, component_name)
 
 
 def filter_to_json(data: Any) -> Any:
@@ -1553,6 +1616,9 @@ def filter_to_yaml(data: Any) -> Any:
     if not data:
         return ""
 
+    if isinstance(data, FrozenFacts):
+        data = dict(data)
+
     try:
         # Use yaml.safe_dump to convert the data to YAML format
         # default_flow_style=False ensures that the output is in block style
@@ -1570,27 +1636,41 @@ def filter_to_yaml(data: Any) -> Any:
 @pass_context
 def filter_read_file(render_context: Context, file_path: str) -> str:
     """Read the contents of a file and return as string."""
+    return _read_file(_read_file_path(render_context, file_path), file_path)
 
+
+@pass_context
+async def filter_read_file_async(render_context: Context, file_path: str) -> str:
+    """Read the contents of a file without blocking the event loop.
+
+    Registered as ``read_file`` in async environments. The read runs in the
+    default executor so other renders on the loop proceed meanwhile.
+    """
+    full_path = _read_file_path(render_context, file_path)
+    return await asyncio.to_thread(_read_file, full_path, file_path)
+
+
+def _read_file_path(render_context: Context, file_path: str) -> str:
+    """Resolve the path read by the read_file filter."""
     facts: dict | None = render_context.get(CTX_CONTEXT, None)
 
-    # Handle relative paths from the template directory
-    if hasattr(filter_read_file, "_template_path") and filter_read_file._template_path:
-        full_path = os.path.join(filter_read_file._template_path, file_path)
-    else:
-        full_path = __file_url(facts, {"Fn::Pipeline::FileUrl": {"Path": file_path}})
+    # Handle relative paths from the template directory of this environment
+    searchpath = getattr(render_context.environment.loader, "searchpath", None)
+    if searchpath:
+        return os.path.join(searchpath[0], file_path)
+    return __file_url(facts, {"Fn::Pipeline::FileUrl": {"Path": file_path}})
+
 
+def _read_file(full_path: str, file_path: str) -> str:
+    """Read a file for the read_file filter, through the process-wide file cache."""
+    record_file_read(full_path)
     try:
-        with open(full_path, "r", encoding="utf-8") as f:
-            return f.read()
+        return get_file_cache().read(full_path)
     except FileNotFoundError:
         raise FileNotFoundError(f"Template file not found: {file_path}")
     except Exception as e:
         raise Exception(f"Error reading template file {file_path}: {str(e)}")
 
-    raise jinja2.exceptions.UndefinedError(
-        "Error reading file '{}': {}".format(file_path, str(e))
-    ) from e
-
 
 def __file_url(facts: dict, pipeline_file_spec: dict) -> Any:
     """Generate a file URL based on the provided pipeline file specification and context facts.
@@ -1722,7 +1802,7 @@ def __create_resource_arn(
     return __format_arn(group, region, account_id, base_resource_name_hyphenated)
 
 
-def load_filters(environment: Environment) -> None:
+def load_filters(environment: Environment, profile: Any = None) -> None:
     """Load custom filters into the Jinja2 environment.
 
     Registers all Core Automation filters and globals with the provided
@@ -1730,16 +1810,17 @@ def load_filters(environment: Environment) -> None:
 
     Args:
         environment: Jinja2 Environment instance to register filters with.
+        profile: Optional RenderProfile. When given, every filter and callable
+            global of the environment (built-in ones included) and its template
+            compiles are timed into it (see core_renderer.profiling).
 
     Note:
         This function must be called to make all custom filters available
         in Jinja2 templates for Core Automation rendering.
     """
 
-    if hasattr(environment.loader, "searchpath") and environment.loader.searchpath:
-        filter_read_file._template_path = environment.loader.searchpath[0]
-
     # Filters
+    environment.filters["allocate_subnets"] = filter_allocate_subnets
     environment.filters["aws_tags"] = filter_aws_tags
     environment.filters["docker_image"] = filter_docker_image
     environment.filters["ebs_encrypt"] = filter_ebs_encrypt
@@ -1757,6 +1838,7 @@ def load_filters(environment: Environment) -> None:
     environment.filters["parse_port_spec"] = filter_parse_port_spec
     environment.filters["process_cfn_init"] = filter_process_cfn_init
     environment.filters["regex_replace"] = filter_regex_replace
+    environment.filters["regex_replace_all"] = filter_regex_replace_all
     environment.filters["rstrip"] = filter_rstrip
     environment.filters["shorten_unique"] = filter_shorten_unique
     environment.filters["snapshot_id"] = filter_snapshot_id
@@ -1770,9 +1852,16 @@ def load_filters(environment: Environment) -> None:
     environment.filters["policy_statements"] = filter_policy_statements
     environment.filters["read_file"] = filter_read_file
 
+    # IO-bound filters with a non-blocking variant in async environments
+    if environment.is_async:
+        environment.filters["read_file"] = filter_read_file_async
+
     # Globals
     environment.globals["raise"] = raise_exception
 
+    if profile is not None:
+        instrument_environment(environment, profile)
+
 
 def raise_exception(message):
     """Raise an exception with the specified message.
@@ -0,0 +1,403 @@
+"""
+Incremental Rendering Support for Jinja2Renderer.render_files.
+
+Rendering a large component template library is repeated for every build even when
+only one template or one fact changed. This module records, per rendered template,
+everything its output depends on and keeps the output in a cache directory, so a
+later ``render_files(..., cache_dir=...)`` only renders templates whose inputs
+changed and returns the previous output for the others.
+
+Recorded Inputs:
+    - **Template Source**: Hash of the template source
+    - **Referenced Templates**: Hashes of every template reached through
+      ``extends``, ``include`` and ``import``, transitively
+    - **Context Subset**: Hashes of the top-level context variables the template
+      actually read while rendering (through the template and its includes, or
+      through ``pass_context`` filters), including variables it looked up but
+      that were absent, so defining them later renders the template again
+    - **Inlined Files**: Modification time and size of every file read by the
+      ``read_file`` filter
+
+Conservative Fallbacks:
+    - Templates referencing other templates by a computed name are always rendered
+    - Filters that read the whole context (``render_context.parent``) make the
+      template depend on the whole context
+    - Other inputs outside the context and template tree (e.g. changes to
+      filter implementations) are not tracked. Clear the cache directory when
+      they change.
+"""
+
+from typing import TYPE_CHECKING, Any, Callable, Iterator
+
+import os
+import json
+import hashlib
+import tempfile
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+import jinja2
+import jinja2.meta
+import jinja2.runtime
+
+if TYPE_CHECKING:
+    from .dependencies import TemplateDependencyGraph
+
+# Name of the manifest file in the cache directory
+MANIFEST_FILE = "manifest.json"
+
+# Folder in the cache directory holding rendered outputs
+OUTPUTS_FOLDER = "outputs"
+
+# Bump when the manifest format or what it records changes
+MANIFEST_VERSION = 2
+
+# Recorded read meaning "the whole context"
+ALL_CONTEXT = "*"
+
+# Prefix of recorded reads naming a file read by the read_file filter
+FILE_READ = "file:"
+
+# Recorded hash of a context variable absent from the context
+ABSENT_HASH = "absent"
+
+# Context variables read by the render in progress in this thread/task
+_context_reads: ContextVar[set[str] | None] = ContextVar("_context_reads", default=None)
+
+
+class RecordingContext(jinja2.runtime.Context):
+    """Jinja2 Context that records the variables a render reads.
+
+    Recording is only active inside ``record_context_reads()``; otherwise the
+    context behaves exactly like the Jinja2 Context it replaces.
+    """
+
+    @property
+    def parent(self) -> dict[str, Any]:
+        """The parent variables. Direct access counts as reading the whole context."""
+        _record_read(ALL_CONTEXT)
+        return self._parent
+
+    @parent.setter
+    def parent(self, value: dict[str, Any]) -> None:
+        self._parent = value
+
+    def resolve_or_missing(self, key: str) -> Any:
+        _record_read(key)
+        if key in self.vars:
+            return self.vars[key]
+        if key in self._parent:
+            return self._parent[key]
+        return jinja2.runtime.missing
+
+    def __contains__(self, name: str) -> bool:
+        _record_read(name)
+        return name in self.vars or name in self._parent
+
+    def keys(self):
+        _record_read(ALL_CONTEXT)
+        return self.get_all().keys()
+
+    def values(self):
+        _record_read(ALL_CONTEXT)
+        return self.get_all().values()
+
+    def items(self):
+        _record_read(ALL_CONTEXT)
+        return self.get_all().items()
+
+    def get_all(self) -> dict[str, Any]:
+        # Used to pass the context to included templates, whose own reads are recorded
+        if not self.vars:
+            return self._parent
+        if not self._parent:
+            return self.vars
+        return dict(self._parent, **self.vars)
+
+
+def _record_read(key: str) -> None:
+    """Record a context read if recording is active."""
+    reads = _context_reads.get()
+    if reads is not None:
+        reads.add(key)
+
+
+def record_file_read(path: str) -> None:
+    """Record a file read by the read_file filter if recording is active."""
+    _record_read(FILE_READ + os.path.abspath(path))
+
+
+def is_recording() -> bool:
+    """True inside ``record_context_reads()``."""
+    return _context_reads.get() is not None
+
+
+@contextmanager
+def record_context_reads() -> Iterator[set[str]]:
+    """Record the context variables read by renders in this block.
+
+    Yields:
+        The set that receives the names of the variables read, and the paths
+        of the files read prefixed with FILE_READ.
+    """
+    reads: set[str] = set()
+    token = _context_reads.set(reads)
+    try:
+        yield reads
+    finally:
+        _context_reads.reset(token)
+
+
+def hash_text(text: str) -> str:
+    """SHA-256 of a string."""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def hash_value(value: Any) -> str:
+    """Stable SHA-256 of a JSON-like value.
+
+    Values that cannot be serialized stably hash differently on every run, so
+    templates reading them are always rendered.
+    """
+    try:
+        text = json.dumps(value, sort_keys=True, default=str)
+    except (TypeError, ValueError):
+        text = repr(value) + str(id(value))
+    return hash_text(text)
+
+
+class RenderManifest:
+    """Manifest of rendered templates, their inputs and cached outputs.
+
+    Attributes:
+        cache_dir: Directory holding the manifest and outputs.
+        hits: Number of templates served from the cache.
+        misses: Number of templates rendered.
+    """
+
+    def __init__(
+        self,
+        cache_dir: str,
+        env: jinja2.Environment,
+        context: dict[str, Any],
+        graph: "TemplateDependencyGraph | None" = None,
+    ):
+        """Load the manifest of a cache directory.
+
+        Args:
+            cache_dir: Directory holding the manifest and outputs.
+            env: The Environment templates are loaded from.
+            context: The context of this render.
+            graph: Up-to-date dependency graph of the templates. When given,
+                template dependencies are read from it instead of parsing
+                every template again.
+        """
+        self.cache_dir = cache_dir
+        self.hits = 0
+        self.misses = 0
+
+        self._env = env
+        self._graph = graph
+        self._context = context
+        self._salt = f"{MANIFEST_VERSION}|{jinja2.__version__}"
+        self._entries: dict[str, dict] = {}
+        self._source_hashes: dict[str, str | None] = {}
+        self._context_hashes: dict[str, str] = {}
+        self._file_hashes: dict[str, str | None] = {}
+        self._lock = threading.Lock()
+
+        os.makedirs(os.path.join(cache_dir, OUTPUTS_FOLDER), exist_ok=True)
+        try:
+            with open(
+                os.path.join(cache_dir, MANIFEST_FILE), "r", encoding="utf-8"
+            ) as f:
+                data = json.load(f)
+            if data.get("salt") == self._salt:
+                self._entries = data.get("templates", {})
+        except (OSError, ValueError):
+            pass
+
+    def get(self, name: str) -> str | None:
+        """Return the cached output of a template if none of its inputs changed.
+
+        Args:
+            name: The template name.
+
+        Returns:
+            The previous output, or None if the template must be rendered.
+        """
+        entry = self._entries.get(name)
+        if entry is None or not self._is_fresh(name, entry):
+            return None
+        try:
+            with open(self._output_path(name), "r", encoding="utf-8", newline="") as f:
+                content = f.read()
+        except OSError:
+            return None
+        with self._lock:
+            self.hits += 1
+        return content
+
+    def put(self, name: str, content: str, reads: set[str]) -> None:
+        """Record a rendered template and store its output.
+
+        Args:
+            name: The template name.
+            content: The rendered output.
+            reads: The context variables and files the render read.
+        """
+        source_hash = self._source_hash(name)
+        dependencies = self._dependencies(name)
+
+        entry: dict[str, Any] = {"source": source_hash, "dynamic": dependencies is None}
+        if dependencies is not None:
+            entry["templates"] = {d: self._source_hash(d) for d in dependencies}
+        files = sorted(r[len(FILE_READ) :] for r in reads if r.startswith(FILE_READ))
+        if files:
+            entry["files"] = {f: self._file_hash(f) for f in files}
+        if ALL_CONTEXT in reads:
+            entry["context"] = {ALL_CONTEXT: self._context_hash(ALL_CONTEXT)}
+        else:
+            entry["context"] = {
+                k: self._context_hash(k)
+                for k in sorted(reads)
+                if not k.startswith(FILE_READ)
+            }
+
+        _atomic_write(self._output_path(name), content, self.cache_dir)
+        with self._lock:
+            self._entries[name] = entry
+            self.misses += 1
+
+    def save(self) -> None:
+        """Write the manifest atomically."""
+        with self._lock:
+            data = {"salt": self._salt, "templates": self._entries}
+            text = json.dumps(data, indent=1, sort_keys=True)
+        _atomic_write(os.path.join(self.cache_dir, MANIFEST_FILE), text, self.cache_dir)
+
+    def _is_fresh(self, name: str, entry: dict) -> bool:
+        """True if the recorded inputs of a template are unchanged."""
+        if entry.get("dynamic") or entry.get("source") != self._source_hash(name):
+            return False
+        for dependency, source_hash in entry.get("templates", {}).items():
+            if self._source_hash(dependency) != source_hash:
+                return False
+        for key, value_hash in entry.get("context", {}).items():
+            if self._context_hash(key) != value_hash:
+                return False
+        for path, file_hash in entry.get("files", {}).items():
+            if self._file_hash(path) != file_hash:
+                return False
+        return True
+
+    def _source_hash(self, name: str) -> str | None:
+        """Hash of a template's source, or None if it does not exist."""
+        with self._lock:
+            if name in self._source_hashes:
+                return self._source_hashes[name]
+        try:
+            source, _, _ = self._env.loader.get_source(self._env, name)
+            value = hash_text(source)
+        except jinja2.TemplateNotFound:
+            value = None
+        with self._lock:
+            self._source_hashes[name] = value
+        return value
+
+    def _context_hash(self, key: str) -> str:
+        """Hash of a top-level context variable, or of the whole context for "*".
+
+        Variables absent from the context hash to ABSENT_HASH.
+        """
+        with self._lock:
+            if key in self._context_hashes:
+                return self._context_hashes[key]
+        if key == ALL_CONTEXT:
+            value_hash = hash_value(self._context)
+        elif key in self._context:
+            value_hash = hash_value(self._context[key])
+        else:
+            value_hash = ABSENT_HASH
+        with self._lock:
+            self._context_hashes[key] = value_hash
+        return value_hash
+
+    def _file_hash(self, path: str) -> str | None:
+        """Modification time and size of a file, or None if it does not exist."""
+        with self._lock:
+            if path in self._file_hashes:
+                return self._file_hashes[path]
+        try:
+            stat = os.stat(path)
+            value = f"{stat.st_mtime_ns}:{stat.st_size}"
+        except OSError:
+            value = None
+        with self._lock:
+            self._file_hashes[path] = value
+        return value
+
+    def _dependencies(self, name: str) -> list[str] | None:
+        """Templates reached from a template through extends/include/import.
+
+        Returns:
+            The sorted transitive dependencies, or None if any of them is
+            referenced by a computed name.
+        """
+        if self._graph is not None:
+            dependencies = self._graph.dependencies(name)
+            return None if dependencies is None else sorted(dependencies)
+
+        found: set[str] = set()
+        queue = [name]
+        while queue:
+            current = queue.pop()
+            try:
+                source, _, _ = self._env.loader.get_source(self._env, current)
+                ast = self._env.parse(source)
+            except jinja2.TemplateNotFound:
+                continue
+            for reference in jinja2.meta.find_referenced_templates(ast):
+                if reference is None:
+                    return None
+                if reference not in found and reference != name:
+                    found.add(reference)
+                    queue.append(reference)
+        return sorted(found)
+
+    def _output_path(self, name: str) -> str:
+        return os.path.join(self.cache_dir, OUTPUTS_FOLDER, hash_text(name))
+
+
+def render_recorded(
+    render: Callable[[str, dict[str, Any]], str],
+    name: str,
+    context: dict[str, Any],
+) -> tuple[str, set[str]]:
+    """Render a template while recording the context variables it reads.
+
+    Args:
+        render: Function rendering a template name with a context.
+        name: The template name.
+        context: The render context.
+
+    Returns:
+        The rendered content and the names of the variables read.
+    """
+    with record_context_reads() as reads:
+        content = render(name, context)
+    return content, reads
+
+
+def _atomic_write(path: str, text: str, directory: str) -> None:
+    """Write a text file atomically."""
+    fd, tmp = tempfile.mkstemp(dir=directory, prefix=".tmp-")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8", newline="") as f:
+            f.write(text)
+        os.replace(tmp, path)
+    except Exception:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+        raise
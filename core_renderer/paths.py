@@ -0,0 +1,102 @@
+"""
+Compiled Lookup Paths for the Core Automation Renderer Filters.
+
+The ``lookup`` filter used to split its dot path and parse ``[n]`` indexes on
+every call, and ``extract`` re-parsed its JMESPath expression on every call.
+Templates call both with the same literal paths thousands of times per render,
+so this module parses each distinct path once into a compiled accessor and
+keeps it in an LRU cache.
+
+Key Features:
+    - **Compiled Steps**: A dot path becomes a tuple of ``(key, index)`` steps
+      walked by a tight loop, with no string handling per call
+    - **JMESPath Expressions**: Compiled once with ``jmespath.compile``
+    - **Size-bounded LRU**: Shared by every renderer in the process, with hit
+      and miss counters through ``cache_info()``
+"""
+
+from typing import Any
+
+import functools
+
+import jmespath
+import jmespath.parser
+
+# Number of compiled paths (and, separately, JMESPath expressions) kept in memory
+PATH_CACHE_SIZE = 1024
+
+# A step of a compiled path: the dictionary key, then the list index (if any)
+PathStep = tuple[str, int | None]
+
+
+@functools.lru_cache(maxsize=PATH_CACHE_SIZE)
+def compile_path(path: str) -> tuple[PathStep, ...] | None:
+    """Parse a dot path with optional ``[n]`` indexes into steps.
+
+    Args:
+        path: Dot-separated path, e.g. ``items[0].name``. Keys may contain any
+            character except dots, including forward slashes.
+
+    Returns:
+        The steps, or None if the path can never match (an invalid index).
+    """
+    segments = path.split(".")
+    # A trailing dot ends the path
+    if len(segments) > 1 and segments[-1] == "":
+        segments.pop()
+
+    steps: list[PathStep] = []
+    for segment in segments:
+        if "[" in segment and segment.endswith("]"):
+            key, index = segment.split("[", 1)
+            try:
+                steps.append((key, int(index.rstrip("]"))))
+            except ValueError:
+                return None
+        else:
+            steps.append((segment, None))
+    return tuple(steps)
+
+
+def navigate_path(data: Any, path: str) -> Any:
+    """Return the value at a dot path, or None if it does not exist.
+
+    Args:
+        data: The data to navigate. Only dictionaries are navigated by key,
+            and only lists reached through a key are indexed.
+        path: The dot path. An empty path returns data itself.
+
+    Returns:
+        The value at the path, or None if any step does not exist.
+    """
+    if not path:
+        return data
+
+    steps = compile_path(path)
+    if steps is None:
+        return None
+
+    for key, index in steps:
+        if not isinstance(data, dict) or key not in data:
+            return None
+        data = data[key]
+        if index is not None:
+            if not isinstance(data, list) or not 0 <= index < len(data):
+                return None
+            data = data[index]
+    return data
+
+
+@functools.lru_cache(maxsize=PATH_CACHE_SIZE)
+def compile_expression(expression: str) -> jmespath.parser.ParsedResult:
+    """Compile a JMESPath expression once.
+
+    Raises:
+        jmespath.exceptions.ParseError: If the expression is invalid.
+    """
+    return jmespath.compile(expression)
+
+
+def search_expression(expression: str, data: Any) -> Any:
+    """Evaluate a JMESPath expression, compiling it at most once."""
+    return compile_expression(expression).search(data)
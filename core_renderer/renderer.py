@@ -12,20 +12,58 @@ Key Features:
     - **Custom Filters**: Automatic loading of Core Automation Jinja2 filters
     - **Flexible Output**: String, object, file, and batch rendering capabilities
     - **Error Handling**: Strict undefined variable handling for reliable templates
+    - **Compiled String Cache**: Template strings are compiled once and reused
+    - **Shared Environments**: Renderers over the same templates share compiled templates
+    - **Object Rendering**: Only templated string leaves of nested data are rendered
+    - **Bytecode Cache**: Compiled file templates persist across renderers and cold starts
+    - **Compiled Template Trees**: Templates compiled at build time load by import
+    - **Parallel Batch Rendering**: Optional thread or process pools and streamed results
+    - **Incremental Batch Rendering**: Unchanged templates are served from a cache
+    - **Async Rendering**: Optional asyncio rendering with non-blocking file reads
+    - **Streaming Output**: Templates render straight into files or S3 uploads
+    - **Multi-component Rendering**: Components share one frozen facts snapshot
+    - **Profiling**: Optional per-filter and per-template timing reports
+    - **Static Checks**: Missing variables and filters are found before rendering
+    - **Dependency Graph**: Edited templates only invalidate their dependents
     - **Cross-Platform**: Proper path handling for Windows and Unix systems
 
 The renderer is optimized for AWS CloudFormation template generation but can be used
 for any text-based template rendering within the Core Automation framework.
 """
 
-from typing import Any
+from typing import Any, Iterator, IO
 import jinja2
+import jinja2.nativetypes
 import core_logging as log
 import os
 import pathlib
 import json
+import time
+import asyncio
+from collections import deque
+from concurrent.futures import Executor, ThreadPoolExecutor, ProcessPoolExecutor
+
+from core_framework.constants import CTX_COMPONENT_NAME, CTX_CONTEXT
 
 from .filters import load_filters
+from .facts import FrozenFacts
+from .template_cache import TemplateCache, DEFAULT_STRING_CACHE_SIZE
+from .bytecode import create_bytecode_cache, PRECOMPILED_FOLDER
+from .incremental import (
+    RecordingContext,
+    RenderManifest,
+    is_recording,
+    render_recorded,
+)
+from .streaming import TemplateReader, write_chunks, DEFAULT_STREAM_BUFFER_SIZE
+from .environment_pool import environment_key, get_environment_pool
+from .profiling import RenderProfile, KIND_RENDER, STRING_TEMPLATE_NAME
+from .analysis import TemplateRequirementsError, check_templates
+from .dependencies import TemplateDependencyGraph
+from .compiled import CompiledTemplateLoader, get_compiled_path
+
+# Markers that make a string a Jinja2 template (expression, statement, comment)
+TEMPLATE_MARKERS = ("{{", "{%", "{#")
 
 
 class Jinja2Renderer:
@@ -55,10 +93,29 @@ class Jinja2Renderer:
     # If loading from filesystem
     template_path: str | None = None
 
+    # Compiled templates for render_string
+    string_cache: TemplateCache
+
+    # Environment and compiled templates for type-preserving object rendering
+    _native_env: jinja2.nativetypes.NativeEnvironment | None = None
+    _native_cache: TemplateCache
+
+    # Template dependency graph, built on first use
+    _dependency_graph: TemplateDependencyGraph | None = None
+
+    # Overlay of env recording the context reads of incremental renders
+    _recording_env: jinja2.Environment | None = None
+
     def __init__(
         self,
         template_path: str | None = None,
         dictionary: dict[str, str] | None = None,
+        string_cache_size: int = DEFAULT_STRING_CACHE_SIZE,
+        bytecode_cache: bool | str = True,
+        shared_environment: bool = True,
+        profile: bool | RenderProfile = False,
+        enable_async: bool = False,
+        compiled_templates: bool | str = False,
     ):
         """Initialize the Jinja2 renderer with template source configuration.
 
@@ -71,6 +128,32 @@ class Jinja2Renderer:
                           templates are loaded from the file system using relative paths.
             dictionary: Dictionary mapping template names to template strings. Used
                        when templates are embedded or generated dynamically.
+            string_cache_size: Maximum number of compiled template strings kept for
+                       render_string. 0 disables the cache.
+            bytecode_cache: Persist compiled templates on disk. True uses the
+                       default cache directory (see core_renderer.bytecode), a string
+                       selects the directory, False disables it.
+            shared_environment: Use the process-wide Environment shared by all
+                       renderers with the same template source and bytecode cache
+                       setting, so filters are loaded and templates compiled once
+                       (see core_renderer.environment_pool). False creates a
+                       private Environment.
+            profile: Time every filter, global, template compile and template
+                       render into a RenderProfile, available as ``self.profile``
+                       (see core_renderer.profiling). True creates a new profile;
+                       a RenderProfile instance can be shared between renderers.
+                       Profiled renderers always use a private Environment.
+            enable_async: Compile templates for asyncio rendering with
+                       render_string_async, render_file_async and
+                       render_files_async. IO-bound filters such as ``read_file``
+                       then yield to the event loop instead of blocking it. The
+                       synchronous methods keep working outside a running loop.
+            compiled_templates: Import templates compiled ahead of time instead of
+                       reading and compiling their sources (see
+                       core_renderer.compiled). True uses the archive in the
+                       template tree's precompiled folder, a string selects the
+                       archive or directory. Templates missing from it, and all
+                       templates of async renderers, load from source.
 
         Note:
             Exactly one of template_path or dictionary must be provided. The renderer
@@ -78,30 +161,192 @@ class Jinja2Renderer:
         """
         self.template_path = template_path
         self.dictionary = dictionary
+        self.enable_async = enable_async
+        self.profile = (
+            (profile if isinstance(profile, RenderProfile) else RenderProfile())
+            if profile
+            else None
+        )
+
+        # Instrumenting a shared Environment would time every renderer using it
+        shared_environment = shared_environment and self.profile is None
+        self._shared_environment = shared_environment
+
+        # Constructor arguments of equivalent renderers in worker processes
+        self._config: dict[str, Any] = {
+            "template_path": template_path,
+            "dictionary": dictionary,
+            "string_cache_size": string_cache_size,
+            "bytecode_cache": bytecode_cache,
+            "shared_environment": shared_environment,
+            "profile": self.profile is not None,
+            "enable_async": enable_async,
+            "compiled_templates": compiled_templates,
+        }
+
+        def create() -> jinja2.Environment:
+            loader: jinja2.BaseLoader
+            if template_path is not None:
+                # Absolute, like the pool key: the working directory may change
+                loader = jinja2.FileSystemLoader(os.path.abspath(template_path))
+            elif shared_environment:
+                # Shared with other renderers: must not follow this caller's edits
+                loader = jinja2.DictLoader(dict(dictionary or {}))
+            else:
+                loader = jinja2.DictLoader(dictionary)
+
+            compiled_path = (
+                compiled_templates
+                if isinstance(compiled_templates, str)
+                else (
+                    get_compiled_path(template_path)
+                    if compiled_templates and template_path
+                    else None
+                )
+            )
+            if compiled_path and enable_async:
+                log.warning("Compiled templates are synchronous, loading from source")
+            elif compiled_path and not os.path.exists(compiled_path):
+                log.warning("Compiled templates not found: {}", compiled_path)
+            elif compiled_path:
+                loader = CompiledTemplateLoader(compiled_path, loader)
+
+            if bytecode_cache is True:
+                bcc = create_bytecode_cache(template_path)
+            elif bytecode_cache:
+                bcc = create_bytecode_cache(template_path, bytecode_cache)
+            else:
+                bcc = None
+
+            return self._create_environment(
+                jinja2.Environment, loader, bcc, self.profile, enable_async
+            )
 
-        loader: jinja2.BaseLoader
-        if template_path is not None:
-            loader = jinja2.FileSystemLoader(template_path)
+        if shared_environment:
+            key = environment_key(
+                jinja2.Environment,
+                template_path,
+                dictionary,
+                bytecode_cache,
+                enable_async,
+                compiled_templates,
+            )
+            self.env = get_environment_pool().get(key, create)
         else:
-            loader = jinja2.DictLoader(dictionary)
+            self.env = create()
 
-        self.env = jinja2.Environment(
+        self.string_cache = TemplateCache(string_cache_size)
+        self._native_cache = TemplateCache(string_cache_size)
+
+    @staticmethod
+    def _create_environment(
+        environment_class: type[jinja2.Environment],
+        loader: jinja2.BaseLoader,
+        bytecode_cache: jinja2.BytecodeCache | None = None,
+        profile: RenderProfile | None = None,
+        enable_async: bool = False,
+    ) -> jinja2.Environment:
+        """Create a Jinja2 environment with the Core Automation settings and filters."""
+        env = environment_class(
             loader=loader,
+            bytecode_cache=bytecode_cache,
+            enable_async=enable_async,
             autoescape=False,
             keep_trailing_newline=True,
             trim_blocks=False,
             lstrip_blocks=True,
             undefined=jinja2.StrictUndefined,
         )
+        load_filters(env, profile)
+        return env
+
+    @property
+    def native_env(self) -> jinja2.nativetypes.NativeEnvironment:
+        """NativeEnvironment sharing this renderer's loader, created on first use.
+
+        Templates rendered by it return Python values (int, bool, list, ...)
+        instead of strings when the output is a single literal.
+        """
+        if self._native_env is None:
+
+            def create() -> jinja2.Environment:
+                loader = self.env.loader
+                # Compiled templates hold string-rendering code, not native code
+                if isinstance(loader, CompiledTemplateLoader) and loader.fallback:
+                    loader = loader.fallback
+                return self._create_environment(
+                    jinja2.nativetypes.NativeEnvironment,
+                    loader,
+                    profile=self.profile,
+                )
+
+            if self._shared_environment:
+                key = environment_key(
+                    jinja2.nativetypes.NativeEnvironment,
+                    self.template_path,
+                    self.dictionary,
+                )
+                self._native_env = get_environment_pool().get(key, create)
+            else:
+                self._native_env = create()
+        return self._native_env
+
+    @property
+    def recording_env(self) -> jinja2.Environment:
+        """Private overlay of env whose renders record the context variables they read.
+
+        Used by render_file inside ``record_context_reads()`` (incremental
+        renders). The Environment may be shared with other renderers, so the
+        recording context class is only set on this overlay, which keeps its
+        own compiled template cache.
+        """
+        if self._recording_env is None:
+            env = self.env.overlay()
+            env.context_class = RecordingContext
+            self._recording_env = env
+        return self._recording_env
+
+    @property
+    def dependency_graph(self) -> TemplateDependencyGraph:
+        """Graph of the extends/include/import references between templates.
+
+        Created on first use. Call ``invalidate_changed()`` (or ``refresh()`` on
+        the graph) to bring it up to date with edited files.
+        """
+        if self._dependency_graph is None:
+            self._dependency_graph = TemplateDependencyGraph(self.env)
+        return self._dependency_graph
 
-        load_filters(self.env)
+    def invalidate_changed(self) -> set[str]:
+        """Evict edited templates and the templates depending on them.
+
+        Refreshes the dependency graph, re-parsing only the templates whose
+        source changed, and removes the affected templates from the compiled
+        template cache of the Environment. Unaffected templates stay compiled.
+
+        Returns:
+            The names of the changed templates and all of their dependents.
+        """
+        graph = self.dependency_graph
+        changed = graph.refresh()
+        affected = graph.invalidate(changed)
+        if self._recording_env is not None:
+            graph.invalidate(changed, self._recording_env)
+        if affected:
+            log.debug(
+                "Templates changed: {}, invalidated: {}",
+                len(changed),
+                len(affected),
+            )
+        return affected
 
     def render_string(self, string: str, context: dict[str, Any]) -> str:
         """Render a Jinja2 template string using the provided context.
 
         Processes a template string directly without loading from file system
         or dictionary sources. Useful for dynamic template generation and
-        simple string templating operations.
+        simple string templating operations. Each distinct string is compiled
+        once and kept in the renderer's string_cache.
 
         Args:
             string: Jinja2 template string containing variables and expressions
@@ -112,54 +357,129 @@ class Jinja2Renderer:
         Returns:
             Rendered string with all template variables and expressions resolved.
         """
-        return self.env.from_string(string).render(context)
+        return self._render_template(
+            self.get_string_template(string), context, STRING_TEMPLATE_NAME
+        )
+
+    def get_string_template(self, string: str) -> jinja2.Template:
+        """Return the compiled template for a template string.
+
+        Args:
+            string: Jinja2 template string.
+
+        Returns:
+            The compiled template, from the string_cache when already compiled.
+        """
+        return self.string_cache.get(string, self.env.from_string)
 
     def render_object(
-        self, data: list[Any] | dict[str, Any] | str, context: dict[str, Any]
+        self,
+        data: list[Any] | dict[str, Any] | str,
+        context: dict[str, Any],
+        native: bool = False,
     ) -> list[Any] | dict[str, Any] | str:
         """Render a Python object (list, dict, or string) using the provided context.
 
-        Recursively processes complex data structures to render embedded template
-        strings while preserving the overall structure. Handles nested dictionaries,
-        lists, and string values that may contain Jinja2 template syntax.
+        Walks nested dictionaries and lists iteratively and renders only the string
+        keys and values that contain Jinja2 markers (``{{``, ``{%`` or ``{#``).
+        Everything else is returned as is, and containers with no templated
+        content are shared with the input rather than copied, so the cost is
+        proportional to the number of templated leaves.
 
         Args:
             data: Python object to render. Can be:
                  - str: Rendered directly as template string
                  - list: Each element rendered recursively
-                 - dict: Converted to JSON, rendered, then parsed back
+                 - dict: Each key and value rendered recursively
             context: Dictionary of variables for template rendering.
+            native: Render values with a NativeEnvironment so that templated
+                 values keep their Python types (e.g. ``"{{ port }}"`` renders
+                 to an int). Keys are always rendered as strings.
 
         Returns:
             Rendered object with same structure as input but with all template
-            strings resolved using the provided context.
+            strings resolved using the provided context. The input is never
+            modified.
 
         Raises:
             TypeError: If data type is not supported for rendering.
         """
         if isinstance(data, str):
-            # If data is a string, render it directly
-            rendered_string = self.render_string(data, context)
-            return rendered_string
-
-        # BUG - If the resulting data is invalid yaml, it will raise an error.
-        if isinstance(data, list):
-            result = []
-            for item in data:
-                if isinstance(item, str):
-                    result.append(self.render_string(item, context))
-                elif isinstance(item, dict):
-                    result.append(self.render_object(item, context))
-            return result
-        elif isinstance(data, dict):
-            json_data = json.dumps(data, indent=2)
-            rendered_json = self.render_json(json_data, context)
-            return json.loads(rendered_json)
-        else:
+            return self._render_leaf(data, context, native)
+
+        if not isinstance(data, (dict, list)):
             raise TypeError(
                 "Unsupported data type for rendering: {}".format(type(data))
             )
 
+        # Each frame: [node, iterator over children, rendered children,
+        #              changed flag, key waiting for the child being rendered]
+        stack: list[list] = [[data, self._children(data), [], False, None]]
+        result: Any = data
+
+        while stack:
+            frame = stack[-1]
+            node, children = frame[0], frame[1]
+            descended = False
+
+            for child in children:
+                if isinstance(node, dict):
+                    key, value = child
+                    new_key = self._render_leaf(key, context, False)
+                    frame[3] = frame[3] or new_key is not key
+                else:
+                    new_key, value = None, child
+
+                if isinstance(value, (dict, list)):
+                    frame[4] = new_key
+                    stack.append([value, self._children(value), [], False, None])
+                    descended = True
+                    break
+
+                new_value = self._render_leaf(value, context, native)
+                frame[3] = frame[3] or new_value is not value
+                frame[2].append((new_key, new_value))
+
+            if descended:
+                continue
+
+            # All children rendered: rebuild the node only if something changed
+            stack.pop()
+            rendered = frame[0]
+            if frame[3]:
+                if isinstance(node, dict):
+                    rendered = dict(frame[2])
+                else:
+                    rendered = [value for _, value in frame[2]]
+
+            if stack:
+                parent = stack[-1]
+                parent[2].append((parent[4], rendered))
+                parent[3] = parent[3] or rendered is not node
+            else:
+                result = rendered
+
+        return result
+
+    @staticmethod
+    def _children(node: dict | list):
+        """Iterate over the (key, value) pairs of a dict or the items of a list."""
+        return iter(node.items()) if isinstance(node, dict) else iter(node)
+
+    def _render_leaf(self, value: Any, context: dict[str, Any], native: bool) -> Any:
+        """Render a leaf value if it is a string containing template markers.
+
+        Returns:
+            The rendered value, or the value itself (same object) if it is not
+            a template.
+        """
+        if not isinstance(value, str) or not any(m in value for m in TEMPLATE_MARKERS):
+            return value
+        if native:
+            template = self._native_cache.get(value, self.native_env.from_string)
+            return self._render_template(template, context, STRING_TEMPLATE_NAME)
+        return self.render_string(value, context)
+
     def render_json(self, json_data: str, context: dict[str, Any]) -> dict | None:
         """Render a JSON string using the Jinja2 environment.
 
@@ -198,13 +518,288 @@ class Jinja2Renderer:
             Rendered template content as a string with all variables and
             expressions resolved.
 
+        Raises:
+            jinja2.TemplateNotFound: If the specified template cannot be found.
+        """
+        env = self.recording_env if is_recording() else self.env
+        template = env.get_template(filename)
+        return self._render_template(template, context, filename)
+
+    def _render_template(
+        self, template: jinja2.Template, context: dict[str, Any], name: str
+    ) -> Any:
+        """Render a template, recording the render time when profiling."""
+        if self.profile is None:
+            return template.render(context)
+        start = time.perf_counter()
+        try:
+            return template.render(context)
+        finally:
+            self.profile.record(KIND_RENDER, name, time.perf_counter() - start)
+
+    async def render_string_async(self, string: str, context: dict[str, Any]) -> str:
+        """Render a template string on the running event loop.
+
+        Requires a renderer created with ``enable_async=True``. See render_string.
+
+        Args:
+            string: Jinja2 template string.
+            context: Dictionary of variables for template rendering.
+
+        Returns:
+            Rendered string with all template variables and expressions resolved.
+        """
+        return await self._render_template_async(
+            self.get_string_template(string), context, STRING_TEMPLATE_NAME
+        )
+
+    async def render_file_async(self, filename: str, context: dict[str, Any]) -> str:
+        """Render a template file on the running event loop.
+
+        Requires a renderer created with ``enable_async=True``. Loading and
+        compiling a template the first time is synchronous; it is cached
+        afterwards. See render_file.
+
+        Args:
+            filename: Template name, as for render_file.
+            context: Dictionary of variables for template rendering.
+
+        Returns:
+            Rendered template content as a string.
+
+        Raises:
+            jinja2.TemplateNotFound: If the specified template cannot be found.
+        """
+        template = self.env.get_template(filename)
+        return await self._render_template_async(template, context, filename)
+
+    async def render_files_async(
+        self,
+        path: str,
+        context: dict[str, Any],
+        max_concurrency: int | None = None,
+    ) -> dict[str, str]:
+        """Render all templates in a path concurrently on the running event loop.
+
+        Requires a renderer created with ``enable_async=True``. See render_files.
+
+        Args:
+            path: Relative path from template_path to the directory containing
+                 templates to render. Use empty string for template_path root.
+            context: Dictionary of variables for template rendering across all files.
+            max_concurrency: Maximum number of files rendering at the same time.
+                 None renders every file concurrently.
+
+        Returns:
+            Dictionary mapping relative file paths to rendered content strings,
+            in the same order as render_files.
+
+        Raises:
+            jinja2.TemplateError: The error of the first file (in order) that
+                failed to render.
+        """
+        log.debug("Rendering files in path: {}", path)
+
+        if self.template_path is None:
+            log.warning("No template path set.  Cannot render files.")
+            return {}
+
+        files = self._list_files(path)
+        semaphore = asyncio.Semaphore(max_concurrency) if max_concurrency else None
+
+        async def render(renderer_path: str) -> str:
+            if semaphore is None:
+                return await self.render_file_async(renderer_path, context)
+            async with semaphore:
+                return await self.render_file_async(renderer_path, context)
+
+        results = await asyncio.gather(
+            *(render(renderer_path) for _, renderer_path in files),
+            return_exceptions=True,
+        )
+
+        rendered: dict[str, str] = {}
+        for (short_path, _), result in zip(files, results):
+            if isinstance(result, BaseException):
+                log.error("Failed to render file '{}'", short_path)
+                raise result
+            rendered[short_path] = result
+        return rendered
+
+    async def _render_template_async(
+        self, template: jinja2.Template, context: dict[str, Any], name: str
+    ) -> Any:
+        """Render a template asynchronously, recording the render time when profiling."""
+        if self.profile is None:
+            return await template.render_async(context)
+        start = time.perf_counter()
+        try:
+            return await template.render_async(context)
+        finally:
+            self.profile.record(KIND_RENDER, name, time.perf_counter() - start)
+
+    def render_file_to(
+        self,
+        filename: str,
+        context: dict[str, Any],
+        stream: IO,
+        buffer_size: int = DEFAULT_STREAM_BUFFER_SIZE,
+    ) -> int:
+        """Render a template file into a writable stream.
+
+        The template output is generated incrementally and written in chunks of
+        about buffer_size characters, so memory use does not grow with the size
+        of the rendered output.
+
+        Args:
+            filename: Template identifier, as for render_file.
+            context: Dictionary of variables and values for template rendering.
+            stream: Writable text stream, or binary stream receiving UTF-8.
+            buffer_size: Characters of output buffered per write.
+
+        Returns:
+            The number of characters (text stream) or bytes (binary stream) written.
+
         Raises:
             jinja2.TemplateNotFound: If the specified template cannot be found.
         """
         template = self.env.get_template(filename)
-        return template.render(context)
+        if self.profile is None:
+            return write_chunks(template.generate(context), stream, buffer_size)
+
+        # Rendering and writing are interleaved, so the time includes the writes
+        start = time.perf_counter()
+        try:
+            return write_chunks(template.generate(context), stream, buffer_size)
+        finally:
+            self.profile.record(KIND_RENDER, filename, time.perf_counter() - start)
+
+    def render_files_to(
+        self,
+        path: str,
+        context: dict[str, Any],
+        target: Any,
+        Bucket: str | None = None,
+        Prefix: str = "",
+    ) -> list[str]:
+        """Render all templates in the specified path straight into files or S3.
+
+        Each template is streamed to its destination while it renders, without
+        the rendered output ever being held in memory as a whole.
+
+        Args:
+            path: Relative path from template_path to the directory containing
+                 templates to render. Use empty string for template_path root.
+            context: Dictionary of variables for template rendering across all files.
+            target: A local directory, or an S3 client (boto3 client,
+                 MagicS3Client or one of their proxies). S3 uploads use
+                 ``upload_fileobj``, which boto3 turns into a multipart upload for
+                 large outputs.
+            Bucket: The bucket to upload to. Required when target is an S3 client.
+            Prefix: Prepended to the file path relative to path to form each key.
+
+        Returns:
+            The written file paths, or the uploaded keys, in rendering order.
+
+        Raises:
+            ValueError: If target is an S3 client and no Bucket is given.
+            jinja2.TemplateError: The error of the first file that failed to render.
+        """
+        log.debug("Rendering files in path {} to {}", path, target)
+
+        if self.template_path is None:
+            log.warning("No template path set.  Cannot render files.")
+            return []
+
+        to_directory = isinstance(target, (str, os.PathLike))
+        if not to_directory and not Bucket:
+            raise ValueError("Bucket is required when rendering to S3")
 
-    def render_files(self, path: str, context: dict[str, Any]) -> dict[str, str]:
+        written: list[str] = []
+        for short_path, renderer_path in self._list_files(path):
+            try:
+                if to_directory:
+                    fn = os.path.join(target, *short_path.split("/"))
+                    os.makedirs(os.path.dirname(fn), exist_ok=True)
+                    with open(fn, "w", encoding="utf-8", newline="") as f:
+                        self.render_file_to(renderer_path, context, f)
+                    written.append(fn)
+                else:
+                    template = self.env.get_template(renderer_path)
+                    key = Prefix + short_path
+                    target.upload_fileobj(
+                        Fileobj=TemplateReader(template.generate(context)),
+                        Bucket=Bucket,
+                        Key=key,
+                    )
+                    written.append(key)
+            except Exception:
+                log.error("Failed to render file '{}'", short_path)
+                raise
+
+        return written
+
+    def render_components(
+        self,
+        facts: dict[str, Any],
+        components: dict[str, str],
+        context: dict[str, Any] | None = None,
+        max_workers: int | None = None,
+    ) -> dict[str, str]:
+        """Render the templates of many components against the same deployment facts.
+
+        The facts are frozen once into a FrozenFacts snapshot whose derived
+        values (resource name parts, tags per scope, security aliases) are
+        computed once and shared by every component render, instead of being
+        derived again by the filters for each component and resource.
+
+        Args:
+            facts: The deployment facts, exposed to templates as ``context``.
+                 A FrozenFacts is used as is.
+            components: Mapping of component name to the template rendering it.
+                 Each render sees its name as ``component_name``.
+            context: Additional variables shared by every component (e.g. ``app``).
+            max_workers: Render components in parallel threads. None (the
+                 default) renders sequentially.
+
+        Returns:
+            Dictionary mapping component names to rendered content, in the
+            order of components.
+
+        Raises:
+            jinja2.TemplateError: The error of the first component (in order)
+                that failed to render.
+        """
+        frozen = facts if isinstance(facts, FrozenFacts) else FrozenFacts(facts)
+        shared = {**(context or {}), CTX_CONTEXT: frozen}
+
+        def render(item: tuple[str, str]) -> str:
+            component_name, template_name = item
+            try:
+                return self.render_file(
+                    template_name, {**shared, CTX_COMPONENT_NAME: component_name}
+                )
+            except Exception:
+                log.error("Failed to render component '{}'", component_name)
+                raise
+
+        if max_workers and max_workers > 1:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                results = list(executor.map(render, components.items()))
+        else:
+            results = [render(item) for item in components.items()]
+
+        return dict(zip(components, results))
+
+    def render_files(
+        self,
+        path: str,
+        context: dict[str, Any],
+        max_workers: int | None = None,
+        use_processes: bool = False,
+        cache_dir: str | None = None,
+        check: bool = False,
+    ) -> dict[str, str]:
         """Render all Jinja2 templates in the specified path using the provided context.
 
         Recursively processes all files in a directory tree, rendering each file
@@ -215,23 +810,228 @@ class Jinja2Renderer:
             path: Relative path from template_path to the directory containing
                  templates to render. Use empty string for template_path root.
             context: Dictionary of variables for template rendering across all files.
+            max_workers: Render files in parallel with this many workers. None
+                 (the default) renders sequentially.
+            use_processes: Use a process pool with one renderer per worker instead
+                 of a thread pool. The context must be picklable.
+            cache_dir: Render incrementally. Outputs and a manifest of their inputs
+                 are kept in this directory, and templates whose source, referenced
+                 templates and read context variables are unchanged since the last
+                 run are returned from it without rendering
+                 (see core_renderer.incremental).
+            check: Check every template against the context before rendering
+                 any of them (see check_files).
 
         Returns:
             Dictionary mapping relative file paths to rendered content strings.
             Paths use forward slashes regardless of platform for consistency.
+            Entries are in the same order whether rendered sequentially or in
+            parallel.
+
+        Raises:
+            TemplateRequirementsError: If check is set and the context does not
+                satisfy the templates.
+            jinja2.TemplateError: The error of the first file (in order) that
+                failed to render.
 
         Note:
             Only regular files are processed; directories and special files are
             skipped. Files are processed recursively through subdirectories.
+            Use iter_render_files to process results without holding every
+            rendered file in memory.
         """
-        log.debug("Rendering files in path: {}", path)
+        return dict(
+            self.iter_render_files(
+                path, context, max_workers, use_processes, cache_dir, check
+            )
+        )
+
+    def iter_render_files(
+        self,
+        path: str,
+        context: dict[str, Any],
+        max_workers: int | None = None,
+        use_processes: bool = False,
+        cache_dir: str | None = None,
+        check: bool = False,
+    ) -> Iterator[tuple[str, str]]:
+        """Render the templates in the specified path, yielding each result in order.
+
+        Works like render_files but yields ``(short_path, content)`` pairs as
+        they become available. In parallel mode only a bounded number of
+        rendered files are held waiting for earlier files to finish.
+
+        Args:
+            path: Relative path from template_path to the directory containing
+                 templates to render. Use empty string for template_path root.
+            context: Dictionary of variables for template rendering across all files.
+            max_workers: Render files in parallel with this many workers. None
+                 (the default) renders sequentially.
+            use_processes: Use a process pool with one renderer per worker instead
+                 of a thread pool. The context must be picklable.
+            cache_dir: Render incrementally using the outputs and manifest kept in
+                 this directory. See render_files.
+            check: Check every template against the context before rendering
+                 any of them (see check_files).
+
+        Yields:
+            Tuples of the file path relative to path and the rendered content.
 
-        # Dictionary to hold rendered files
-        files: dict = {}
+        Raises:
+            TemplateRequirementsError: If check is set and the context does not
+                satisfy the templates.
+            jinja2.TemplateError: The error of the first file (in order) that
+                failed to render.
+        """
+        log.debug("Rendering files in path: {}", path)
 
         if self.template_path is None:
             log.warning("No template path set.  Cannot render files.")
-            return files
+            return
+
+        files = self._list_files(path)
+
+        if check:
+            self._check_templates(
+                [renderer_path for _, renderer_path in files], context
+            )
+
+        manifest: RenderManifest | None = None
+        if cache_dir:
+            # Renders record their context reads through recording_env
+            self.invalidate_changed()
+            manifest = RenderManifest(
+                cache_dir, self.env, context, self.dependency_graph
+            )
+
+        def render_here(renderer_path: str) -> tuple[str, set[str] | None]:
+            if manifest is None:
+                return self.render_file(renderer_path, context), None
+            return render_recorded(self.render_file, renderer_path, context)
+
+        executor: Executor | None = None
+        if max_workers and max_workers > 1:
+            if use_processes:
+                executor = ProcessPoolExecutor(
+                    max_workers=max_workers,
+                    initializer=_init_worker,
+                    initargs=(self._config, context, manifest is not None),
+                )
+            else:
+                executor = ThreadPoolExecutor(max_workers=max_workers)
+
+        # Worker processes render with their own renderer, see _init_worker
+        if executor is not None and use_processes:
+            render = _render_in_worker
+        else:
+            render = render_here
+
+        # Keep a bounded window of files in flight and yield them in order.
+        # Each pending item is (short_path, renderer_path, state) where state is a
+        # future, a cached (content, reads) result, or None to render in order.
+        pending: deque = deque()
+        remaining = iter(files)
+        window = max_workers * 2 if executor is not None else 1
+
+        def submit_next() -> None:
+            item = next(remaining, None)
+            if item is None:
+                return
+            short_path, renderer_path = item
+            cached = manifest.get(renderer_path) if manifest is not None else None
+            if cached is not None:
+                pending.append((short_path, renderer_path, (cached, None)))
+            elif executor is not None:
+                pending.append(
+                    (short_path, renderer_path, executor.submit(render, renderer_path))
+                )
+            else:
+                pending.append((short_path, renderer_path, None))
+
+        try:
+            for _ in range(window):
+                submit_next()
+
+            while pending:
+                short_path, renderer_path, result = pending.popleft()
+                try:
+                    if result is None:
+                        result = render(renderer_path)
+                    elif not isinstance(result, tuple):
+                        result = result.result()
+                except Exception:
+                    log.error("Failed to render file '{}'", short_path)
+                    raise
+
+                content, reads = result
+                if manifest is not None and reads is not None:
+                    manifest.put(renderer_path, content, reads)
+
+                submit_next()
+                yield short_path, content
+        finally:
+            for _, _, result in pending:
+                if hasattr(result, "cancel"):
+                    result.cancel()
+            if executor is not None:
+                executor.shutdown(wait=True)
+            if manifest is not None:
+                manifest.save()
+                log.debug(
+                    "Incremental render: {} cached, {} rendered",
+                    manifest.hits,
+                    manifest.misses,
+                )
+
+    def check_files(self, path: str, context: dict[str, Any]) -> None:
+        """Check the templates in a path against a context without rendering them.
+
+        Parses each template and the templates it includes, imports or extends,
+        and verifies that every variable they read is in the context and every
+        filter and test they use is registered (see core_renderer.analysis).
+        The analysis is cached per template source, so repeated checks of the
+        same tree take milliseconds.
+
+        Args:
+            path: Relative path from template_path to the directory containing
+                 templates to check. Use empty string for template_path root.
+            context: The context the templates will be rendered with.
+
+        Raises:
+            TemplateRequirementsError: Listing the problems of every template.
+        """
+        if self.template_path is None:
+            log.warning("No template path set.  Cannot check files.")
+            return
+        files = self._list_files(path)
+        self._check_templates([renderer_path for _, renderer_path in files], context)
+
+    def check_file(self, filename: str, context: dict[str, Any]) -> None:
+        """Check one template against a context without rendering it.
+
+        Args:
+            filename: Template identifier, as for render_file.
+            context: The context the template will be rendered with.
+
+        Raises:
+            TemplateRequirementsError: Listing the problems of the template.
+        """
+        self._check_templates([filename], context)
+
+    def _check_templates(self, names: list[str], context: dict[str, Any]) -> None:
+        """Raise TemplateRequirementsError if any template's requirements are unmet."""
+        problems = check_templates(self.env, names, context)
+        if problems:
+            raise TemplateRequirementsError(problems)
+
+    def _list_files(self, path: str) -> list[tuple[str, str]]:
+        """List the template files under path.
+
+        Returns:
+            Tuples of (short_path, renderer_path): the file path relative to path
+            and relative to template_path, both with forward slashes.
+        """
+        files: list[tuple[str, str]] = []
 
         files_path = pathlib.Path(os.path.join(self.template_path, path))
         for file_path in files_path.glob("**/*"):
@@ -240,6 +1040,10 @@ class Jinja2Renderer:
             if not file_path.is_file():
                 continue
 
+            # Skip precompiled template bytecode
+            if PRECOMPILED_FOLDER in file_path.relative_to(self.template_path).parts:
+                continue
+
             # Retrieve file path relative to the files path and the base path
             short_path = str(file_path.relative_to(files_path))
             renderer_path = str(file_path.relative_to(self.template_path))
@@ -249,14 +1053,40 @@ class Jinja2Renderer:
             short_path = short_path.replace("\\", "/")
             renderer_path = renderer_path.replace("\\", "/")
 
-            # Load and render the files
             log.debug(
                 "Rendering file '{}' with short_path '{}'", renderer_path, short_path
             )
 
-            rendered_template = self.render_file(renderer_path, context)
-
-            # Save the rendered file into our dictionary
-            files[short_path] = rendered_template
+            files.append((short_path, renderer_path))
 
         return files
+
+
+# Renderer and context of a render_files process pool worker
+_worker_renderer: Jinja2Renderer | None = None
+_worker_context: dict[str, Any] | None = None
+_worker_record: bool = False
+
+
+def _init_worker(config: dict[str, Any], context: dict[str, Any], record: bool) -> None:
+    """Create the per-process renderer of a render_files process pool worker.
+
+    Args:
+        config: The constructor arguments of the parent renderer. Filter and
+            render timings of a profiled renderer stay in the worker process.
+        context: The render context.
+        record: Record the context reads of each render (incremental renders).
+    """
+    global _worker_renderer, _worker_context, _worker_record
+    _worker_renderer = Jinja2Renderer(**config)
+    _worker_context = context
+    _worker_record = record
+
+
+def _render_in_worker(renderer_path: str) -> tuple[str, set[str] | None]:
+    """Render one file in a render_files process pool worker."""
+    if _worker_record:
+        return render_recorded(
+            _worker_renderer.render_file, renderer_path, _worker_context
+        )
+    return _worker_renderer.render_file(renderer_path, _worker_context), None
@@ -0,0 +1,114 @@
+"""
+Streaming Template Output for the Core Automation Renderer.
+
+``Template.render`` builds the whole output string in memory. For very large
+generated CloudFormation templates or configuration files the output is then
+often copied again when it is uploaded. This module consumes
+``Template.generate()`` incrementally instead, so output is written to files or
+uploaded to S3 in fixed-size chunks and memory use does not grow with the size
+of the template output.
+
+Key Features:
+    - **Chunked Writes**: Generated text is buffered up to a fixed size and then
+      written, keeping the number of writes low without holding the whole output
+    - **Text or Binary Targets**: Text streams receive str, binary streams
+      receive UTF-8 encoded bytes
+    - **Readable Adapter**: TemplateReader exposes a template as a binary file
+      object so S3 clients can upload it with ``upload_fileobj`` (managed
+      multipart upload on S3, a direct file write with MagicS3Client)
+"""
+
+from typing import Any, Iterator
+
+import io
+
+# Characters of generated output buffered before each write
+DEFAULT_STREAM_BUFFER_SIZE = 64 * 1024
+
+
+def write_chunks(
+    chunks: Iterator[str],
+    stream: Any,
+    buffer_size: int = DEFAULT_STREAM_BUFFER_SIZE,
+    encoding: str = "utf-8",
+) -> int:
+    """Write generated template text to a stream in buffered chunks.
+
+    Args:
+        chunks: The template output, e.g. ``template.generate(context)``.
+        stream: A writable text or binary stream.
+        buffer_size: Approximate number of characters buffered per write.
+        encoding: Encoding used for binary streams.
+
+    Returns:
+        The number of characters (text streams) or bytes (binary streams) written.
+    """
+    binary = not isinstance(stream, io.TextIOBase)
+    written = 0
+    buffer: list[str] = []
+    size = 0
+
+    def flush() -> int:
+        data = "".join(buffer)
+        buffer.clear()
+        if binary:
+            data = data.encode(encoding)
+        stream.write(data)
+        return len(data)
+
+    for chunk in chunks:
+        buffer.append(chunk)
+        size += len(chunk)
+        if size >= buffer_size:
+            written += flush()
+            size = 0
+
+    if buffer:
+        written += flush()
+
+    return written
+
+
+class TemplateReader(io.RawIOBase):
+    """Readable binary stream over generated template output.
+
+    Output is produced on demand as the stream is read, so it can be passed to
+    ``upload_fileobj``, ``shutil.copyfileobj`` or ``put_object`` without
+    rendering the whole template first.
+    """
+
+    def __init__(self, chunks: Iterator[str], encoding: str = "utf-8"):
+        """Initialize the reader.
+
+        Args:
+            chunks: The template output, e.g. ``template.generate(context)``.
+            encoding: Encoding of the bytes produced.
+        """
+        self._chunks = iter(chunks)
+        self._encoding = encoding
+        self._pending = b""
+        self._position = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, b) -> int:
+        """Fill b with the next bytes of output.
+
+        Returns:
+            The number of bytes read, 0 at the end of the output.
+        """
+        while not self._pending:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                return 0
+            self._pending = chunk.encode(self._encoding)
+
+        n = min(len(b), len(self._pending))
+        b[:n] = self._pending[:n]
+        self._pending = self._pending[n:]
+        self._position += n
+        return n
+
+    def tell(self) -> int:
+        return self._position
@@ -0,0 +1,114 @@
+"""
+Compiled Template Cache for the Core Automation Renderer.
+
+Jinja2 caches templates loaded through its loader, but templates created with
+``Environment.from_string`` are lexed, parsed and compiled on every call. The
+renderer calls ``from_string`` for every templated value in facts and action
+definitions, so the same small snippets are compiled thousands of times per
+component.
+
+This module provides a thread-safe LRU cache of compiled ``jinja2.Template``
+objects keyed by their source string, with size limits and hit metrics.
+
+Key Features:
+    - **Compile Once**: Each distinct source string is compiled a single time
+    - **Size-bounded LRU**: The least recently used templates are evicted first
+    - **Metrics**: Hit, miss and eviction counters for tuning the cache size
+    - **Thread Safe**: Safe to share between threads rendering concurrently
+"""
+
+from typing import Callable
+
+import threading
+from collections import OrderedDict
+
+import jinja2
+
+# Default number of compiled string templates kept per renderer
+DEFAULT_STRING_CACHE_SIZE = 1024
+
+
+class TemplateCache:
+    """Thread-safe LRU cache of compiled Jinja2 templates keyed by source string.
+
+    Attributes:
+        max_size: Maximum number of templates kept. 0 disables caching.
+        hits: Number of lookups served from the cache.
+        misses: Number of lookups that compiled the template.
+        evictions: Number of templates evicted to respect max_size.
+    """
+
+    def __init__(self, max_size: int = DEFAULT_STRING_CACHE_SIZE):
+        """Initialize an empty cache.
+
+        Args:
+            max_size: Maximum number of templates kept. 0 disables caching.
+        """
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        self._templates: OrderedDict[str, jinja2.Template] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._templates)
+
+    def get(
+        self, source: str, compile: Callable[[str], jinja2.Template]
+    ) -> jinja2.Template:
+        """Return the compiled template for a source string, compiling it on a miss.
+
+        Args:
+            source: The template source.
+            compile: Function compiling the source, e.g. ``env.from_string``.
+
+        Returns:
+            The compiled template.
+        """
+        with self._lock:
+            template = self._templates.get(source)
+            if template is not None:
+                self._templates.move_to_end(source)
+                self.hits += 1
+                return template
+            self.misses += 1
+
+        # Compile outside the lock; concurrent misses on the same source are harmless
+        template = compile(source)
+
+        if self.max_size > 0:
+            with self._lock:
+                self._templates[source] = template
+                self._templates.move_to_end(source)
+                while len(self._templates) > self.max_size:
+                    self._templates.popitem(last=False)
+                    self.evictions += 1
+
+        return template
+
+    def clear(self) -> None:
+        """Remove every template and reset the metrics."""
+        with self._lock:
+            self._templates.clear()
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+
+    def stats(self) -> dict[str, int | float]:
+        """Return the cache metrics.
+
+        Returns:
+            Dictionary with size, max_size, hits, misses, evictions and hit_rate.
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._templates),
+                "max_size": self.max_size,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+            }
@@ -0,0 +1,155 @@
+"""
+Unit tests for transparent artefact compression in core_helper.compression.
+"""
+
+import io
+import gzip
+import pytest
+
+from core_helper.magic import MagicS3Client
+from core_helper.compression import CompressingS3Client, choose_encoding
+
+
+@pytest.fixture
+def client(tmp_path, monkeypatch) -> MagicS3Client:
+    """
+    Provides a MagicS3Client with artefact compression enabled.
+    """
+    monkeypatch.setenv("ARTEFACT_COMPRESSION", "gzip")
+    return MagicS3Client(Region="us-east-1", DataPath=str(tmp_path))
+
+
+def test_choose_encoding():
+    """
+    Tests the encoding is chosen per content type and only when enabled.
+    """
+    assert choose_encoding("template.yaml", mode=None) is None
+    assert choose_encoding("package.zip", mode="auto") is None
+    assert choose_encoding("index.html", mode="auto") == "gzip"
+    assert choose_encoding("deploy.actions", mode="auto") in ("gzip", "zstd")
+    assert choose_encoding("template.yaml", mode="gzip") == "gzip"
+
+
+def test_local_put_and_get_compressed(client, tmp_path):
+    """
+    Tests compressible objects are stored compressed and read back decoded.
+    """
+    content = "Resources:\n" + "  Bucket:\n    Type: AWS::S3::Bucket\n" * 200
+    client.put_object(Bucket="bucket", Key="files/template.yaml", Body=content)
+
+    stored = (tmp_path / "bucket" / "files" / "template.yaml").read_bytes()
+    assert len(stored) < len(content) / 5
+    assert gzip.decompress(stored).decode() == content
+
+    head = client.head_object(Bucket="bucket", Key="files/template.yaml")
+    assert head["ContentEncoding"] == "gzip"
+    assert head == client.Bucket("bucket").head_object(Key="files/template.yaml")
+
+    response = client.get_object(Bucket="bucket", Key="files/template.yaml")
+    with response["Body"] as body:
+        assert body.read().decode() == content
+
+    fileobj = io.BytesIO()
+    client.download_fileobj(Bucket="bucket", Key="files/template.yaml", Fileobj=fileobj)
+    assert fileobj.getvalue().decode() == content
+
+    # Binary content is stored as is
+    client.put_object(Bucket="bucket", Key="package.zip", Body=b"PK\x03\x04")
+    assert (tmp_path / "bucket" / "package.zip").read_bytes() == b"PK\x03\x04"
+    assert "ContentEncoding" not in client.head_object(
+        Bucket="bucket", Key="package.zip"
+    )
+
+
+class FakeS3Client:
+    """
+    Minimal stand-in for a boto3 S3 client storing raw bodies and headers.
+    """
+
+    def __init__(self):
+        self.objects: dict[str, dict] = {}
+
+    def put_object(self, Bucket, Key, Body, **kwargs):
+        data = Body.read() if hasattr(Body, "read") else Body
+        self.objects[Key] = {"Data": data, **kwargs}
+        return {}
+
+    def get_object(self, Bucket, Key):
+        obj = self.objects[Key]
+        response = {k: v for k, v in obj.items() if k != "Data"}
+        response["Body"] = io.BytesIO(obj["Data"])
+        return response
+
+
+def test_s3_client_proxy():
+    """
+    Tests the S3 proxy sets ContentEncoding on put and decodes on get.
+    """
+    s3 = FakeS3Client()
+    client = CompressingS3Client(s3, mode="gzip")
+
+    client.put_object(Bucket="b", Key="outputs.json", Body='{"a": 1}' * 100)
+    assert s3.objects["outputs.json"]["ContentEncoding"] == "gzip"
+
+    response = client.get_object(Bucket="b", Key="outputs.json")
+    assert response["Body"].read() == b'{"a": 1}' * 100
+
+    # Callers that encode the body themselves are left alone
+    client.put_object(
+        Bucket="b", Key="raw.json", Body=b"{}", ContentEncoding="identity"
+    )
+    assert s3.objects["raw.json"]["Data"] == b"{}"
+
+
+def test_encoded_keys_are_stored_and_read_as_is(tmp_path, monkeypatch):
+    """
+    Tests keys naming compressed files are never compressed again nor decoded.
+    """
+    data = gzip.compress(b'{"a": 1}', mtime=0)
+    assert choose_encoding("outputs.json.gz", mode="auto") is None
+    assert choose_encoding("outputs.json.gz", "application/json", "gzip") is None
+
+    for mode in ("auto", "false"):
+        monkeypatch.setenv("ARTEFACT_COMPRESSION", mode)
+        client = MagicS3Client(Region="us-east-1", DataPath=str(tmp_path))
+        client.put_object(Bucket="bucket", Key="outputs.json.gz", Body=data)
+        assert (tmp_path / "bucket" / "outputs.json.gz").read_bytes() == data
+
+        response = client.get_object(Bucket="bucket", Key="outputs.json.gz")
+        assert "ContentEncoding" not in response
+        with response["Body"] as body:
+            assert body.read() == data
+
+    s3 = FakeS3Client()
+    s3.put_object(Bucket="b", Key="site.svgz", Body=data, ContentEncoding="gzip")
+    response = CompressingS3Client(s3, mode="auto").get_object(
+        Bucket="b", Key="site.svgz"
+    )
+    assert response["Body"].read() == data
+
+
+def test_ranged_reads_are_not_decoded():
+    """
+    Tests ranged reads of compressed objects return the stored bytes.
+    """
+
+    class RangedS3Client(FakeS3Client):
+        def get_object(self, Bucket, Key, Range=None):
+            response = super().get_object(Bucket, Key)
+            if Range:
+                start, end = map(int, Range[len("bytes=") :].split("-"))
+                data = response["Body"].read()
+                response["Body"] = io.BytesIO(data[start : end + 1])
+                response["ContentRange"] = f"bytes {start}-{end}/{len(data)}"
+            return response
+
+    s3 = RangedS3Client()
+    client = CompressingS3Client(s3, mode="gzip")
+    client.put_object(Bucket="b", Key="outputs.json", Body='{"a": 1}' * 100)
+    stored = s3.objects["outputs.json"]["Data"]
+
+    response = client.get_object(Bucket="b", Key="outputs.json", Range="bytes=0-9")
+    assert response["Body"].read() == stored[:10]
+    assert client.get_object(Bucket="b", Key="outputs.json")["Body"].read() == (
+        b'{"a": 1}' * 100
+    )
@@ -0,0 +1,203 @@
+"""
+Unit tests for the local S3 emulation in core_helper.magic.
+"""
+
+import io
+import os
+import pytest
+
+from core_helper.magic import (
+    MagicS3Client,
+    SeekableStreamWrapper,
+    MAX_DELETE_OBJECTS,
+)
+
+
+@pytest.fixture
+def client(tmp_path) -> MagicS3Client:
+    """
+    Provides a MagicS3Client storing its buckets under a temporary directory.
+    """
+    return MagicS3Client(Region="us-east-1", DataPath=str(tmp_path))
+
+
+def test_delete_objects(client, tmp_path):
+    """
+    Tests batch deletion reports the S3 Deleted/Errors shape.
+    """
+    keys = [f"artefacts/file-{i}.json" for i in range(50)]
+    for key in keys:
+        client.put_object(Bucket="bucket", Key=key, Body="{}")
+
+    result = client.delete_objects(
+        Bucket="bucket",
+        Delete={"Objects": [{"Key": k} for k in keys] + [{"Key": "missing.txt"}]},
+    )
+
+    assert result["Errors"] == []
+    assert [d["Key"] for d in result["Deleted"]] == keys + ["missing.txt"]
+    assert not any(os.path.exists(tmp_path / "bucket" / k) for k in keys)
+
+    # Quiet mode only reports errors
+    result = client.delete_objects(
+        Bucket="bucket", Delete={"Objects": [{"Key": "a"}], "Quiet": True}
+    )
+    assert result == {"Errors": []}
+
+    with pytest.raises(ValueError):
+        client.delete_objects(
+            Bucket="bucket",
+            Delete={
+                "Objects": [{"Key": str(i)} for i in range(MAX_DELETE_OBJECTS + 1)]
+            },
+        )
+
+
+def test_copy_object_across_buckets(client, tmp_path):
+    """
+    Tests copying an object from one bucket to another.
+    """
+    client.put_object(Bucket="source", Key="a/b.txt", Body="hello")
+
+    result = client.copy_object(
+        Bucket="target",
+        Key="c/d.txt",
+        CopySource={"Bucket": "source", "Key": "a/b.txt"},
+    )
+
+    assert "Error" not in result
+    assert result["CopyObjectResult"]["ETag"] is not None
+    assert (tmp_path / "target" / "c" / "d.txt").read_text() == "hello"
+
+    # String copy source form
+    result = client.copy_object(
+        Bucket="target", Key="e.txt", CopySource="source/a/b.txt"
+    )
+    assert "Error" not in result
+    assert (tmp_path / "target" / "e.txt").read_text() == "hello"
+
+
+class _NonSeekable:
+    """Minimal non-seekable stream over a bytes payload."""
+
+    def __init__(self, data: bytes):
+        self._stream = io.BytesIO(data)
+
+    def read(self, amt: int = -1) -> bytes:
+        return self._stream.read(amt)
+
+
+def test_seekable_stream_wrapper():
+    """
+    Tests random access reads over a non-seekable stream.
+    """
+    data = bytes(range(256)) * 40
+    wrapper = SeekableStreamWrapper(_NonSeekable(data), chunk_size=100)
+
+    assert wrapper.read(10) == data[:10]
+    assert wrapper.seek(-5, 1) == 5
+    assert wrapper.read(300) == data[5:305]
+    assert wrapper.seek(-10, 2) == len(data) - 10
+    assert wrapper.read() == data[-10:]
+    assert wrapper.read(10) == b""
+
+    # Reads inside one chunk are zero-copy views
+    wrapper.seek(0)
+    view = wrapper.read_view(50)
+    assert isinstance(view, memoryview)
+    assert view == data[:50]
+
+    buffer = bytearray(20)
+    assert wrapper.readinto(buffer) == 20
+    assert bytes(buffer) == data[50:70]
+
+
+def test_seekable_stream_wrapper_spill():
+    """
+    Tests the buffer spills to a temporary file above the memory threshold.
+    """
+    data = os.urandom(10000)
+    wrapper = SeekableStreamWrapper(
+        _NonSeekable(data), chunk_size=512, max_memory_size=2048
+    )
+
+    assert wrapper.read(1000) == data[:1000]
+    assert not wrapper.spilled
+    assert wrapper.read(2000) == data[1000:3000]
+    assert wrapper.spilled
+    wrapper.seek(100)
+    assert wrapper.read() == data[100:]
+    wrapper.close()
+
+
+def test_seekable_stream_wrapper_forward_only():
+    """
+    Tests consumed data is discarded when only forward seeks are needed.
+    """
+    data = os.urandom(10000)
+    wrapper = SeekableStreamWrapper(
+        _NonSeekable(data), chunk_size=100, forward_only=True
+    )
+
+    assert wrapper.read(950) == data[:950]
+    assert wrapper.seek(5000) == 5000
+    assert wrapper.read(100) == data[5000:5100]
+    assert wrapper._memory_size <= 200
+
+    with pytest.raises(ValueError):
+        wrapper.seek(0)
+
+
+def test_client_hot_path_matches_models(client, tmp_path):
+    """
+    Tests the lightweight client path returns the same shape as the pydantic models.
+    """
+    client.put_object(Bucket="bucket", Key="dir/template.yaml", Body="a: 1\n")
+
+    head = client.head_object(Bucket="bucket", Key="dir/template.yaml")
+    assert head == client.Bucket("bucket").head_object(Key="dir/template.yaml")
+    assert head["ETag"] and head["VersionId"]
+
+    response = client.get_object(Bucket="bucket", Key="dir/template.yaml")
+    with response["Body"] as body:
+        assert body.read() == b"a: 1\n"
+
+    fileobj = io.BytesIO()
+    result = client.download_fileobj(
+        Bucket="bucket", Key="dir/template.yaml", Fileobj=fileobj
+    )
+    assert "Error" not in result
+    assert fileobj.getvalue() == b"a: 1\n"
+
+    # ETag follows content changes
+    client.put_object(Bucket="bucket", Key="dir/template.yaml", Body="a: 22\n")
+    os.utime(tmp_path / "bucket" / "dir" / "template.yaml", ns=(1, 1))
+    assert client.head_object(Bucket="bucket", Key="dir/template.yaml")["ETag"] != (
+        head["ETag"]
+    )
+
+    assert "Error" not in client.delete_object(Bucket="bucket", Key="dir/template.yaml")
+    assert "Error" in client.delete_object(Bucket="bucket", Key="dir/template.yaml")
+    assert "Error" in client.get_object(Bucket="bucket", Key="dir/template.yaml")
+
+
+def test_seekable_stream_wrapper_forward_only_spill():
+    """
+    Tests a forward-only spill file is rewritten without the discarded data,
+    and the buffer property still returns the buffered bytes.
+    """
+    data = os.urandom(20000)
+    wrapper = SeekableStreamWrapper(
+        _NonSeekable(data), chunk_size=512, max_memory_size=2048, forward_only=True
+    )
+
+    for start in range(0, 18000, 3000):
+        assert wrapper.read(3000) == data[start : start + 3000]
+        assert wrapper.spilled
+        assert os.fstat(wrapper._spill.fileno()).st_size <= 3000 + 512
+    assert wrapper.read() == data[18000:]
+    wrapper.close()
+
+    wrapper = SeekableStreamWrapper(_NonSeekable(data), chunk_size=100)
+    wrapper.read(250)
+    assert wrapper.buffer == bytearray(data[:300])
@@ -0,0 +1,116 @@
+"""
+Unit tests for the ETag-validated S3 object cache in core_helper.s3_cache.
+"""
+
+import io
+import os
+import shutil
+import pytest
+from botocore.exceptions import ClientError
+
+from core_helper.s3_cache import S3ObjectCache, CachedS3Client
+
+
+class FakeS3Client:
+    """
+    Minimal stand-in for a boto3 S3 client honouring IfNoneMatch.
+    """
+
+    def __init__(self):
+        self.objects: dict[tuple[str, str], tuple[bytes, str]] = {}
+        self.downloads = 0
+
+    def put(self, bucket: str, key: str, data: bytes, etag: str):
+        self.objects[(bucket, key)] = (data, f'"{etag}"')
+
+    def get_object(self, Bucket, Key, IfNoneMatch=None):
+        data, etag = self.objects[(Bucket, Key)]
+        if IfNoneMatch == etag:
+            raise ClientError(
+                {
+                    "Error": {"Code": "304", "Message": "Not Modified"},
+                    "ResponseMetadata": {"HTTPStatusCode": 304},
+                },
+                "GetObject",
+            )
+        self.downloads += 1
+        return {
+            "Body": io.BytesIO(data),
+            "ETag": etag,
+            "ContentLength": len(data),
+            "ContentType": "application/json",
+        }
+
+
+@pytest.fixture
+def s3():
+    return FakeS3Client()
+
+
+def test_cache_revalidates_with_etag(s3, tmp_path):
+    """
+    Tests an unchanged object is downloaded once and then served from disk.
+    """
+    cache = S3ObjectCache(cache_dir=str(tmp_path))
+    client = CachedS3Client(s3, cache)
+    s3.put("bucket", "facts.json", b'{"a": 1}', "v1")
+
+    for _ in range(3):
+        response = client.get_object(Bucket="bucket", Key="facts.json")
+        with response["Body"] as body:
+            assert body.read() == b'{"a": 1}'
+
+    assert s3.downloads == 1
+    assert cache.hits == 2
+    assert cache.misses == 1
+
+    # A changed object is downloaded again
+    s3.put("bucket", "facts.json", b'{"a": 2}', "v2")
+    response = client.get_object(Bucket="bucket", Key="facts.json")
+    with response["Body"] as body:
+        assert body.read() == b'{"a": 2}'
+    assert response["ETag"] == '"v2"'
+    assert s3.downloads == 2
+
+    # A new cache over the same directory reuses the stored objects
+    warm = S3ObjectCache(cache_dir=str(tmp_path))
+    fileobj = io.BytesIO()
+    warm.download_fileobj(s3, "bucket", "facts.json", fileobj)
+    assert fileobj.getvalue() == b'{"a": 2}'
+    assert s3.downloads == 2
+
+
+def test_cache_lru_eviction(s3, tmp_path):
+    """
+    Tests the least recently used objects are evicted beyond the size limit.
+    """
+    cache = S3ObjectCache(cache_dir=str(tmp_path), max_size=250)
+    for name in ["a", "b", "c"]:
+        s3.put("bucket", name, name.encode() * 100, name)
+        cache.get_object(s3, "bucket", name)["Body"].close()
+
+    assert cache.size <= 250
+    assert len(list(tmp_path.glob("*.json"))) == 2
+
+    # "a" was evicted and must be downloaded again
+    downloads = s3.downloads
+    cache.get_object(s3, "bucket", "a")["Body"].close()
+    assert s3.downloads == downloads + 1
+
+
+def test_default_cache_dir_is_private(tmp_path, monkeypatch):
+    """
+    Tests the default cache folder is private to the user, and a folder other
+    users can write to is never used.
+    """
+    monkeypatch.setenv("TEMP_DIR", str(tmp_path))
+
+    cache = S3ObjectCache()
+    assert os.path.dirname(cache.cache_dir) == str(tmp_path)
+    assert os.stat(cache.cache_dir).st_mode & 0o777 == 0o700
+
+    os.chmod(cache.cache_dir, 0o777)
+    other = S3ObjectCache()
+    assert other.cache_dir != cache.cache_dir
+    assert os.stat(other.cache_dir).st_mode & 0o777 == 0o700
+    shutil.rmtree(other.cache_dir)
@@ -0,0 +1,176 @@
+"""
+Unit tests for the local S3-compatible endpoint in core_helper.s3_server.
+"""
+
+import io
+import http.client
+import urllib.error
+import urllib.request
+import pytest
+import boto3
+from botocore.config import Config
+from botocore.exceptions import ClientError
+from urllib.parse import urlsplit
+
+from core_helper.s3_server import start_server
+
+
+@pytest.fixture
+def s3(tmp_path):
+    """
+    Provides a boto3 S3 client connected to a local endpoint serving tmp_path.
+    """
+    server = start_server(port=0, data_path=str(tmp_path))
+    client = boto3.client(
+        "s3",
+        endpoint_url=server.endpoint_url,
+        region_name="us-east-1",
+        aws_access_key_id="local",
+        aws_secret_access_key="local",
+        config=Config(s3={"addressing_style": "path"}),
+    )
+    yield client
+    server.shutdown()
+    server.server_close()
+
+
+def test_object_round_trip(s3, tmp_path):
+    """
+    Tests put, get, range get, head, copy and delete through boto3.
+    """
+    s3.create_bucket(Bucket="bucket")
+    s3.put_object(Bucket="bucket", Key="dir/a b.txt", Body=b"0123456789")
+
+    assert (tmp_path / "bucket" / "dir" / "a b.txt").read_bytes() == b"0123456789"
+
+    response = s3.get_object(Bucket="bucket", Key="dir/a b.txt")
+    assert response["Body"].read() == b"0123456789"
+
+    response = s3.get_object(Bucket="bucket", Key="dir/a b.txt", Range="bytes=2-5")
+    assert response["Body"].read() == b"2345"
+    assert response["ContentRange"] == "bytes 2-5/10"
+
+    response = s3.get_object(Bucket="bucket", Key="dir/a b.txt", Range="bytes=-3")
+    assert response["Body"].read() == b"789"
+
+    head = s3.head_object(Bucket="bucket", Key="dir/a b.txt")
+    assert head["ContentLength"] == 10
+
+    s3.copy_object(
+        Bucket="bucket",
+        Key="copy.txt",
+        CopySource={"Bucket": "bucket", "Key": "dir/a b.txt"},
+    )
+    assert (tmp_path / "bucket" / "copy.txt").read_bytes() == b"0123456789"
+
+    s3.delete_object(Bucket="bucket", Key="dir/a b.txt")
+    with pytest.raises(ClientError) as e:
+        s3.get_object(Bucket="bucket", Key="dir/a b.txt")
+    assert e.value.response["Error"]["Code"] == "NoSuchKey"
+
+
+def test_list_objects(s3):
+    """
+    Tests prefix, delimiter and pagination of ListObjectsV2 and batch delete.
+    """
+    s3.create_bucket(Bucket="bucket")
+    keys = [f"files/{i:02d}.json" for i in range(5)] + ["root.txt", "other/x.txt"]
+    for key in keys:
+        s3.put_object(Bucket="bucket", Key=key, Body=b"{}")
+
+    response = s3.list_objects_v2(Bucket="bucket", Delimiter="/")
+    assert [c["Key"] for c in response["Contents"]] == ["root.txt"]
+    assert [p["Prefix"] for p in response["CommonPrefixes"]] == ["files/", "other/"]
+
+    paginator = s3.get_paginator("list_objects_v2")
+    pages = list(paginator.paginate(Bucket="bucket", Prefix="files/", MaxKeys=2))
+    assert len(pages) == 3
+    assert [c["Key"] for p in pages for c in p["Contents"]] == sorted(keys[:5])
+
+    response = s3.delete_objects(
+        Bucket="bucket", Delete={"Objects": [{"Key": k} for k in keys]}
+    )
+    assert len(response["Deleted"]) == len(keys)
+    assert s3.list_objects_v2(Bucket="bucket")["KeyCount"] == 0
+
+
+def test_multipart_upload(s3, tmp_path):
+    """
+    Tests multipart uploads assemble parts in order through upload_fileobj.
+    """
+    s3.create_bucket(Bucket="bucket")
+    data = bytes(range(256)) * (6 * 1024 * 4)
+
+    config = boto3.s3.transfer.TransferConfig(
+        multipart_threshold=5 * 1024 * 1024, multipart_chunksize=5 * 1024 * 1024
+    )
+    s3.upload_fileobj(io.BytesIO(data), "bucket", "big.bin", Config=config)
+
+    assert (tmp_path / "bucket" / "big.bin").read_bytes() == data
+    assert not (tmp_path / ".multipart").exists() or not any(
+        (tmp_path / ".multipart").iterdir()
+    )
+
+    fileobj = io.BytesIO()
+    s3.download_fileobj("bucket", "big.bin", fileobj)
+    assert fileobj.getvalue() == data
+
+
+def test_delete_rejects_keys_outside_bucket(s3, tmp_path):
+    """
+    Tests single and batch deletes refuse keys escaping the bucket directory.
+    """
+    s3.create_bucket(Bucket="bucket")
+    victim = tmp_path / "victim.txt"
+    victim.write_bytes(b"keep")
+
+    request = urllib.request.Request(
+        f"{s3.meta.endpoint_url}/bucket/%2E%2E/victim.txt", method="DELETE"
+    )
+    with pytest.raises(urllib.error.HTTPError) as e:
+        urllib.request.urlopen(request)
+    assert e.value.code == 400
+    assert victim.exists()
+
+    s3.put_object(Bucket="bucket", Key="a.txt", Body=b"a")
+    response = s3.delete_objects(
+        Bucket="bucket",
+        Delete={"Objects": [{"Key": "../victim.txt"}, {"Key": "a.txt"}]},
+    )
+    assert [d["Key"] for d in response["Deleted"]] == ["a.txt"]
+    assert [(e["Key"], e["Code"]) for e in response["Errors"]] == [
+        ("../victim.txt", "InvalidArgument")
+    ]
+    assert victim.exists()
+
+
+def test_error_after_body_keeps_connection_usable(s3):
+    """
+    Tests a request failing after its body was read does not hang, and the
+    next request on the same keep-alive connection is answered.
+    """
+    s3.create_bucket(Bucket="bucket")
+    endpoint = urlsplit(s3.meta.endpoint_url)
+    connection = http.client.HTTPConnection(endpoint.hostname, endpoint.port, timeout=5)
+    try:
+        connection.request("POST", "/bucket?delete", body=b"<Delete><Object>")
+        response = connection.getresponse()
+        assert response.status == 400
+        assert b"MalformedXML" in response.read()
+
+        connection.request("PUT", "/bucket/a.txt", body=b"abc")
+        response = connection.getresponse()
+        response.read()
+        assert response.status == 200
+
+        connection.request("PUT", "/bucket/%2E%2E/x.txt", body=b"abc")
+        response = connection.getresponse()
+        response.read()
+        assert response.status == 400
+
+        connection.request("GET", "/bucket/a.txt")
+        response = connection.getresponse()
+        assert response.status == 200
+        assert response.read() == b"abc"
+    finally:
+        connection.close()
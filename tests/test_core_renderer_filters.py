@@ -9,6 +9,7 @@ from jinja2.runtime import Context
 from datetime import date
 import core_framework as util
 from core_renderer.filters import (
+    filter_allocate_subnets,
     filter_aws_tags,
     filter_docker_image,
     filter_ebs_encrypt,
@@ -26,6 +27,7 @@ from core_renderer.filters import (
     filter_policy_statements,
     filter_process_cfn_init,
     filter_regex_replace,
+    filter_regex_replace_all,
     filter_format_date,
     filter_rstrip,
     filter_shorten_unique,
@@ -132,7 +134,10 @@ def test_filter_docker_image(render_context):
     """
     # Happy path
     obj = {"Fn::Pipeline::DockerImage": {"Name": "my-image:latest"}}
-    expected_uri = "123456789012.dkr.ecr.us-east-1.amazonaws.com/private/test-portfolio-test-app-feature-build-123-test-component:my-image:latest"
+    expected_uri = (
+        "123456789012.dkr.ecr.us-east-1.amazonaws.com/private/"
+        "test-portfolio-test-app-feature-build-123-test-component:my-image:latest"
+    )
     assert filter_docker_image(render_context, obj) == expected_uri
 
     # Error case: Missing 'Fn::Pipeline::DockerImage'
@@ -343,6 +348,31 @@ def test_filter_ip_rules(render_context):
     assert len(result) == 0
 
 
+def test_security_index_reused(render_context):
+    """
+    Tests ip_rules and iam_rules build the security index once per facts
+    dictionary, and rebuild it when the aliases are replaced.
+    """
+    from unittest.mock import patch
+    import core_renderer.facts as facts_module
+
+    facts = render_context.get(CTX_CONTEXT)
+    resource = {"Pipeline::Security": [{"Source": "component-a", "Allow": "TCP:80"}]}
+
+    with patch.object(
+        facts_module, "SecurityIndex", wraps=facts_module.SecurityIndex
+    ) as index_class:
+        facts_module._security_indexes.clear()
+        first = filter_ip_rules(render_context, resource)
+        assert filter_ip_rules(render_context, resource) == first
+        filter_iam_rules(render_context, resource)
+        assert index_class.call_count == 1
+
+        facts["SecurityAliases"] = {"component-a": [{"Type": "cidr", "Value": "x"}]}
+        assert filter_ip_rules(render_context, resource)[0]["Value"] == "x"
+        assert index_class.call_count == 2
+
+
 def test_filter_lookup(render_context):
     """
     Tests the filter_lookup function.
@@ -359,6 +389,40 @@ def test_filter_lookup(render_context):
         filter_lookup(render_context, '"non-existent-key"')
 
 
+def test_filter_lookup_paths(render_context):
+    """
+    Tests compiled lookup paths with indexes, slashes and JMESPath queries.
+    """
+    from core_renderer.paths import compile_path
+
+    render_context.parent["data"] = {
+        "items": [{"name": "a"}, {"name": "b"}],
+        "key/with/slashes": {"v": 1},
+        "": {"empty": True},
+    }
+
+    assert filter_lookup(render_context, "data.items[1].name") == "b"
+    assert filter_lookup(render_context, "data.key/with/slashes.v") == 1
+    assert (
+        filter_lookup(render_context, "data.items.") == render_context["data"]["items"]
+    )
+    assert filter_lookup(render_context, "data..empty") is True
+    for path in ("data.items[2]", "data.items[-1]", "data.items[x]", "data.items.0"):
+        assert filter_lookup(render_context, path, default="d") == "d"
+
+    compile_path.cache_clear()
+    for _ in range(3):
+        filter_lookup(render_context, "data.items[0].name")
+    assert compile_path.cache_info().hits == 2
+    assert compile_path("a[0].b") == (("a", 0), ("b", None))
+
+    assert filter_lookup(render_context, "data.items[*].name", query=True) == [
+        "a",
+        "b",
+    ]
+    assert filter_extract(render_context["data"], "items[0].name") == "a"
+
+
 def test_filter_min_int():
     """
     Tests the filter_min_int function.
@@ -556,6 +620,27 @@ def test_filter_regex_replace():
     assert filter_regex_replace("hello 123 world", r"\d+", "NUM") == "hello NUM world"
 
 
+def test_filter_regex_replace_all():
+    """
+    Tests regex_replace_all applies replacements in order and caches compiled patterns.
+    """
+    from core_renderer.filters import _compile_regex, _compile_replacements
+
+    rules = [["[^a-z0-9-]", "-"], ["-+", "-"], ["^-|-$", ""]]
+    assert filter_regex_replace_all("my app_name!!", rules) == "my-app-name"
+    assert filter_regex_replace_all("a.b", {r"\.": "_", "(a)_": r"\1-"}) == "a-b"
+    assert filter_regex_replace_all("abc", []) == "abc"
+
+    _compile_replacements.cache_clear()
+    for _ in range(3):
+        filter_regex_replace_all("My App", rules)
+    assert _compile_replacements.cache_info().hits == 2
+    assert _compile_regex("-+") is _compile_regex("-+")
+
+    with pytest.raises(jinja2.exceptions.FilterArgumentError):
+        filter_regex_replace_all("abc", ["not-a-pair"])
+
+
 def test_filter_format_date():
     """
     Tests the filter_format_date function.
@@ -590,6 +675,39 @@ def test_filter_shorten_unique():
     assert filter_shorten_unique("short", 10, 2) == "short"
 
 
+def test_filter_shorten_unique_suffixes(monkeypatch):
+    """
+    Tests hash-based suffixes leave the global random state alone, and the legacy
+    suffixes of earlier releases stay available.
+    """
+    import random
+    import string
+
+    long_string = "this-is-a-very-long-string-that-needs-to-be-shortened"
+
+    random.seed(42)
+    state = random.getstate()
+    assert filter_shorten_unique(long_string, 20, 4) == "this-is-a-very-lCEZH"
+    assert filter_shorten_unique(long_string, 20, 4, legacy=True) == (
+        "this-is-a-very-lTSH6"
+    )
+    assert random.getstate() == state
+
+    # Legacy suffixes match seeding the global generator with the value
+    random.seed(long_string)
+    charset = string.ascii_uppercase + string.digits
+    expected = "".join(random.choice(charset) for _ in range(4))
+    assert filter_shorten_unique(long_string, 20, 4, legacy=True)[-4:] == expected
+
+    monkeypatch.setenv("SHORTEN_UNIQUE_LEGACY", "true")
+    assert filter_shorten_unique(long_string, 20, 4) == "this-is-a-very-lTSH6"
+    assert filter_shorten_unique(long_string, 20, 4, legacy=False).endswith("CEZH")
+
+    # Long suffixes and custom charsets
+    suffix = filter_shorten_unique(long_string * 10, 400, 200, charset="ab")[-200:]
+    assert len(suffix) == 200 and set(suffix) == {"a", "b"}
+
+
 def test_filter_snapshot_id(render_context):
     """
     Tests the filter_snapshot_id function.
@@ -702,6 +820,46 @@ def test_filter_split_cidr():
         filter_split_cidr("10.0.0.0/24", [22, 20])
 
 
+def test_filter_split_cidr_bounded():
+    """
+    Tests split_cidr returns a window of the subnets and refuses unbounded splits.
+    """
+    assert filter_split_cidr("10.0.0.0/8", [24], limit=2, offset=256) == [
+        "10.1.0.0/24",
+        "10.1.1.0/24",
+    ]
+    assert filter_split_cidr("10.0.0.0/24", [26], offset=3) == ["10.0.0.192/26"]
+    assert filter_split_cidr("2001:db8::/62", [64], limit=2) == [
+        "2001:db8::/64",
+        "2001:db8:0:1::/64",
+    ]
+    with pytest.raises(jinja2.exceptions.FilterArgumentError, match="limit"):
+        filter_split_cidr("10.0.0.0/8", [24])
+
+
+def test_filter_allocate_subnets():
+    """
+    Tests allocate_subnets packs every subnet per zone, largest first.
+    """
+    allocations = filter_allocate_subnets(
+        "10.0.0.0/16", {"public": 24, "private": 20}, ["az-a", "az-b"]
+    )
+    assert allocations == [
+        {"Name": "public", "AzIndex": 0, "Zone": "az-a", "Cidr": "10.0.32.0/24"},
+        {"Name": "public", "AzIndex": 1, "Zone": "az-b", "Cidr": "10.0.33.0/24"},
+        {"Name": "private", "AzIndex": 0, "Zone": "az-a", "Cidr": "10.0.0.0/20"},
+        {"Name": "private", "AzIndex": 1, "Zone": "az-b", "Cidr": "10.0.16.0/20"},
+    ]
+    assert [a["Cidr"] for a in filter_allocate_subnets("10.0.0.0/24", [26], 4)] == (
+        filter_split_cidr("10.0.0.0/24", [26])
+    )
+
+    with pytest.raises(jinja2.exceptions.FilterArgumentError, match="more than"):
+        filter_allocate_subnets("10.0.0.0/24", [25], 3)
+    with pytest.raises(jinja2.exceptions.FilterArgumentError, match="prefix length"):
+        filter_allocate_subnets("10.0.0.0/24", {"big": 16})
+
+
 def test_filter_subnet_network_zone():
     """
     Tests the filter_subnet_network_zone function.
@@ -925,3 +1083,74 @@ def test_raise_exception():
     """
     with pytest.raises(Exception, match="This is a test exception"):
         raise_exception("This is a test exception")
+
+
+def test_filters_with_frozen_facts(render_context):
+    """
+    Tests the filters give the same results with frozen facts as with plain facts.
+    """
+    from core_renderer import FrozenFacts
+
+    parent = dict(render_context.parent)
+    parent[CTX_CONTEXT] = FrozenFacts(parent[CTX_CONTEXT])
+    env = render_context.environment
+    frozen_context = env.context_class(env, parent=parent, name="test", blocks={})
+
+    resource = {
+        "Pipeline::Security": [
+            {"Source": ["office-vpn", "component-a"], "Allow": "TCP:443"}
+        ]
+    }
+    statement = {"Action": ["s3:GetObject", "sqs:SendMessage"], "Effect": "Allow"}
+
+    for scope in [None, SCOPE_PORTFOLIO, SCOPE_APP, SCOPE_BRANCH, SCOPE_BUILD]:
+        assert filter_tags(frozen_context, scope) == filter_tags(render_context, scope)
+    assert filter_ip_rules(frozen_context, resource) == filter_ip_rules(
+        render_context, resource
+    )
+    assert filter_iam_rules(
+        frozen_context, {"Pipeline::Security": [{"Source": "component-a"}]}
+    ) == filter_iam_rules(
+        render_context, {"Pipeline::Security": [{"Source": "component-a"}]}
+    )
+    assert filter_policy_statements(
+        frozen_context, statement
+    ) == filter_policy_statements(render_context, statement)
+
+    # Tags returned to templates can be modified without affecting the snapshot
+    filter_tags(frozen_context)["Extra"] = "x"
+    assert "Extra" not in filter_tags(frozen_context)
+
+    with pytest.raises(TypeError):
+        parent[CTX_CONTEXT]["Portfolio"] = "other"
+
+
+def test_security_index(render_context):
+    """
+    Tests security sources are indexed once per frozen facts and port specs parsed once.
+    """
+    from core_renderer import FrozenFacts
+    from core_renderer.filters import _parse_port_spec
+
+    facts = FrozenFacts(render_context.parent[CTX_CONTEXT])
+    parent = {**render_context.parent, CTX_CONTEXT: facts}
+    env = render_context.environment
+    frozen_context = env.context_class(env, parent=parent, name="test", blocks={})
+
+    resource = {
+        "Pipeline::Security": [
+            {"Source": ["office-vpn", "component-a"], "Allow": ["TCP:443", "UDP:53"]}
+        ]
+    }
+    _parse_port_spec.cache_clear()
+    first = filter_ip_rules(frozen_context, resource)
+    assert filter_ip_rules(frozen_context, resource) == first
+    assert _parse_port_spec.cache_info().misses == 2
+    assert facts.security_index is facts.security_index
+    assert facts.security_index.component("component-a") is (
+        facts.security_index.component("component-a")
+    )
+
+    # Parsed port specs returned to templates can be modified safely
+    filter_parse_port_spec("TCP:443")["FromPort"] = "1"
+    assert filter_parse_port_spec("TCP:443")["FromPort"] == "443"
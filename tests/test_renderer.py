@@ -5,6 +5,7 @@ from core_renderer import Jinja2Renderer
 import core_framework as util
 import jinja2
 import traceback
+import weakref
 import ruamel.yaml as yaml
 
 
@@ -113,3 +114,658 @@ async def test_render(contexts):
         print(e)
         traceback.print_exc()
         assert False, "An unexpected, non-Jinja2 error occurred during rendering."
+
+
+def test_render_string_cache():
+    """
+    Tests repeated template strings are compiled once and evicted in LRU order.
+    """
+    renderer = Jinja2Renderer(dictionary={}, string_cache_size=2)
+
+    for i in range(5):
+        assert renderer.render_string("{{ a }}-x", {"a": i}) == f"{i}-x"
+
+    stats = renderer.string_cache.stats()
+    assert stats["misses"] == 1
+    assert stats["hits"] == 4
+
+    renderer.render_string("{{ a }}-y", {"a": 1})
+    renderer.render_string("{{ a }}-z", {"a": 1})
+    assert renderer.string_cache.evictions == 1
+    assert len(renderer.string_cache) == 2
+
+    # Disabled cache still renders
+    renderer = Jinja2Renderer(dictionary={}, string_cache_size=0)
+    assert renderer.render_string("{{ a }}", {"a": 1}) == "1"
+    assert len(renderer.string_cache) == 0
+
+
+def test_render_object_tree_walk():
+    """
+    Tests only templated leaves are rendered and untouched subtrees are shared.
+    """
+    renderer = Jinja2Renderer(dictionary={})
+    static = {"Type": "AWS::S3::Bucket", "Tags": [{"Key": "a", "Value": "b"}]}
+    data = {
+        "Static": static,
+        "{{ name }}Bucket": {"Properties": {"BucketName": "{{ name }}-data"}},
+        "Ports": [80, "{{ port }}", None, ["{{ name }}"], True],
+        "Quoted": '{{ name }} says "hi"',
+    }
+    context = {"name": "app", "port": 443}
+
+    result = renderer.render_object(data, context)
+
+    assert result["Static"] is static
+    assert result["appBucket"] == {"Properties": {"BucketName": "app-data"}}
+    assert result["Ports"] == [80, "443", None, ["app"], True]
+    assert result["Quoted"] == 'app says "hi"'
+    assert "{{ name }}Bucket" in data
+
+    # Native rendering keeps the types of templated values
+    result = renderer.render_object(data, context, native=True)
+    assert result["Ports"][1] == 443
+
+    # Deeply nested data does not hit the recursion limit
+    deep: dict = {"v": "{{ name }}"}
+    for _ in range(5000):
+        deep = {"n": deep}
+    result = renderer.render_object(deep, context)
+    for _ in range(5000):
+        result = result["n"]
+    assert result == {"v": "app"}
+
+
+def test_bytecode_cache(tmp_path):
+    """
+    Tests precompiled bytecode is reused without compiling the templates again.
+    """
+    from core_renderer import precompile_templates
+
+    template_path = tmp_path / "templates"
+    (template_path / "sub").mkdir(parents=True)
+    (template_path / "a.yaml.j2").write_text("a: {{ value }}\n")
+    (template_path / "sub" / "b.yaml.j2").write_text("b: {{ value | upper }}\n")
+
+    assert precompile_templates(str(template_path)) == 2
+
+    renderer = Jinja2Renderer(
+        str(template_path), bytecode_cache=str(tmp_path / "runtime")
+    )
+    with patch.object(renderer.env, "compile", side_effect=AssertionError("compiled")):
+        assert renderer.render_file("sub/b.yaml.j2", {"value": "x"}) == "b: X\n"
+
+    # The precompiled folder is not rendered as a template
+    files = renderer.render_files("", {"value": "x"})
+    assert sorted(files) == ["a.yaml.j2", "sub/b.yaml.j2"]
+    assert not any((tmp_path / "runtime").iterdir())
+
+    # A changed template is compiled again
+    (template_path / "a.yaml.j2").write_text("a: {{ value }}!\n")
+    renderer = Jinja2Renderer(
+        str(template_path), bytecode_cache=str(tmp_path / "runtime")
+    )
+    assert renderer.render_file("a.yaml.j2", {"value": "x"}) == "a: x!\n"
+    assert any((tmp_path / "runtime").iterdir())
+
+
+@pytest.mark.parametrize("use_processes", [False, True])
+def test_render_files_parallel(tmp_path, use_processes):
+    """
+    Tests parallel rendering matches sequential rendering, order included.
+    """
+    for i in range(20):
+        folder = tmp_path / f"dir{i % 3}"
+        folder.mkdir(exist_ok=True)
+        (folder / f"file{i}.yaml").write_text(f"n: {{{{ value * {i} }}}}\n")
+
+    renderer = Jinja2Renderer(str(tmp_path), bytecode_cache=False)
+    expected = renderer.render_files("", {"value": 2})
+
+    result = renderer.render_files(
+        "", {"value": 2}, max_workers=4, use_processes=use_processes
+    )
+    assert list(result.items()) == list(expected.items())
+
+    streamed = renderer.iter_render_files("", {"value": 2}, max_workers=4)
+    assert next(streamed) == next(iter(expected.items()))
+    streamed.close()
+
+    # The first failing file is reported
+    (tmp_path / "dir0" / "broken.yaml").write_text("{{ missing }}")
+    with pytest.raises(jinja2.exceptions.UndefinedError):
+        renderer.render_files(
+            "", {"value": 2}, max_workers=4, use_processes=use_processes
+        )
+
+
+def test_bytecode_cache_dir_is_private(tmp_path, monkeypatch):
+    """
+    Tests the default bytecode cache folder is private to the user, and is not
+    used when other users can write to it.
+    """
+    from core_renderer.bytecode import get_bytecode_cache_dir
+
+    monkeypatch.delenv("TEMPLATE_BYTECODE_CACHE", raising=False)
+    monkeypatch.setenv("TEMP_DIR", str(tmp_path))
+
+    directory = get_bytecode_cache_dir()
+    assert os.path.dirname(directory) == str(tmp_path)
+    assert os.stat(directory).st_mode & 0o777 == 0o700
+
+    os.chmod(directory, 0o777)
+    assert get_bytecode_cache_dir() is None
+
+    monkeypatch.setenv("TEMPLATE_BYTECODE_CACHE", "false")
+    assert get_bytecode_cache_dir() is None
+
+
+def test_render_files_incremental(tmp_path):
+    """
+    Tests unchanged templates are served from the cache and changed inputs re-render.
+    """
+    templates = tmp_path / "templates"
+    templates.mkdir()
+    (templates / "a.yaml").write_text("a: {{ app }}\n")
+    (templates / "b.yaml").write_text("{% include 'inc.j2' %}")
+    (templates / "inc.j2").write_text("b: {{ branch }}\n")
+    cache_dir = str(tmp_path / "cache")
+    context = {"app": "web", "branch": "main"}
+
+    def render(context):
+        renderer = Jinja2Renderer(str(templates), bytecode_cache=False)
+        with patch.object(
+            renderer, "render_file", wraps=renderer.render_file
+        ) as render_file:
+            files = renderer.render_files("", context, cache_dir=cache_dir)
+        return files, sorted(c.args[0] for c in render_file.call_args_list)
+
+    files, rendered = render(context)
+    assert files["a.yaml"] == "a: web\n"
+    assert files["b.yaml"] == "b: main\n"
+    assert rendered == ["a.yaml", "b.yaml", "inc.j2"]
+
+    # Nothing changed
+    files, rendered = render(context)
+    assert rendered == []
+    assert files["b.yaml"] == "b: main\n"
+
+    # Only the template reading the changed fact is rendered
+    files, rendered = render({"app": "web", "branch": "dev"})
+    assert rendered == ["b.yaml", "inc.j2"]
+    assert files["b.yaml"] == "b: dev\n"
+
+    # A changed include re-renders the templates including it
+    (templates / "inc.j2").write_text("b: {{ branch }}!\n")
+    files, rendered = render({"app": "web", "branch": "dev"})
+    assert rendered == ["b.yaml", "inc.j2"]
+    assert files["b.yaml"] == "b: dev!\n"
+
+    # The recording context stays off the shared Environment
+    renderer = Jinja2Renderer(str(templates), bytecode_cache=False)
+    assert renderer.env.context_class is jinja2.runtime.Context
+    assert renderer.recording_env.context_class is not jinja2.runtime.Context
+
+
+def test_render_files_incremental_absent_reads_and_files(tmp_path):
+    """
+    Tests defining a variable read while absent, or editing a file inlined with
+    read_file, re-renders the templates using them.
+    """
+    templates = tmp_path / "templates"
+    templates.mkdir()
+    (templates / "a.yaml").write_text("{{ extra | default('none') }}")
+    (templates / "b.yaml").write_text("{{ 'data.txt' | read_file }}")
+    (templates / "data.txt").write_text("one")
+    cache_dir = str(tmp_path / "cache")
+
+    def render(context):
+        renderer = Jinja2Renderer(str(templates), bytecode_cache=False)
+        with patch.object(
+            renderer, "render_file", wraps=renderer.render_file
+        ) as render_file:
+            files = renderer.render_files("", context, cache_dir=cache_dir)
+        return files, sorted(c.args[0] for c in render_file.call_args_list)
+
+    files, rendered = render({})
+    assert files["a.yaml"] == "none" and files["b.yaml"] == "one"
+    assert render({})[1] == []
+
+    files, rendered = render({"extra": "set"})
+    assert rendered == ["a.yaml"]
+    assert files["a.yaml"] == "set"
+
+    data = templates / "data.txt"
+    data.write_text("two")
+    stat = data.stat()
+    os.utime(data, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    files, rendered = render({"extra": "set"})
+    assert rendered == ["b.yaml", "data.txt"]
+    assert files["b.yaml"] == "two"
+
+
+def test_render_files_to_directory_and_s3(tmp_path):
+    """
+    Tests templates stream into a directory and into a MagicS3Client upload.
+    """
+    from core_helper.magic import MagicS3Client
+
+    templates = tmp_path / "templates"
+    (templates / "sub").mkdir(parents=True)
+    (templates / "a.yaml").write_text(
+        "{% for i in range(n) %}{{ app }}-{{ i }}\n{% endfor %}"
+    )
+    (templates / "sub" / "b.txt").write_text("b: {{ app }}\n")
+    context = {"app": "wéb", "n": 5000}
+    expected = "".join(f"wéb-{i}\n" for i in range(5000))
+
+    renderer = Jinja2Renderer(str(templates), bytecode_cache=False)
+
+    with open(tmp_path / "one.yaml", "wb") as f:
+        written = renderer.render_file_to("a.yaml", context, f, buffer_size=100)
+    assert written == len(expected.encode("utf-8"))
+    assert (tmp_path / "one.yaml").read_text(encoding="utf-8") == expected
+
+    out = tmp_path / "out"
+    paths = renderer.render_files_to("", context, str(out))
+    assert len(paths) == 2
+    assert (out / "a.yaml").read_text(encoding="utf-8") == expected
+    assert (out / "sub" / "b.txt").read_text(encoding="utf-8") == "b: wéb\n"
+
+    client = MagicS3Client(Region="us-east-1", DataPath=str(tmp_path / "s3"))
+    keys = renderer.render_files_to("", context, client, Bucket="bkt", Prefix="x/")
+    assert sorted(keys) == ["x/a.yaml", "x/sub/b.txt"]
+    body = client.get_object(Bucket="bkt", Key="x/a.yaml")["Body"].read()
+    assert body.decode("utf-8") == expected
+
+    with pytest.raises(ValueError):
+        renderer.render_files_to("", context, client)
+
+
+def test_shared_environment_pool(tmp_path):
+    """
+    Tests renderers over the same templates share one Environment and its compiled templates.
+    """
+    from core_renderer import EnvironmentPool
+
+    (tmp_path / "a.yaml").write_text("a: {{ app }}\n")
+
+    first = Jinja2Renderer(str(tmp_path), bytecode_cache=False)
+    second = Jinja2Renderer(str(tmp_path), bytecode_cache=False)
+    assert first.env is second.env
+
+    first.render_file("a.yaml", {"app": "x"})
+    with patch.object(second.env, "compile", side_effect=AssertionError("compiled")):
+        assert second.render_file("a.yaml", {"app": "y"}) == "a: y\n"
+
+    # Other sources and opting out get their own Environment
+    assert Jinja2Renderer(str(tmp_path), bytecode_cache=False).native_env is (
+        first.native_env
+    )
+    assert Jinja2Renderer(str(tmp_path), shared_environment=False).env is not first.env
+    assert Jinja2Renderer(dictionary={"t": "1"}).env is not (
+        Jinja2Renderer(dictionary={"t": "2"}).env
+    )
+
+    # Dictionary templates are keyed by content and not affected by later edits
+    templates = {"t": "{{ a }}"}
+    renderer = Jinja2Renderer(dictionary=templates)
+    assert Jinja2Renderer(dictionary=dict(templates)).env is renderer.env
+    templates["t"] = "changed"
+    assert renderer.render_file("t", {"a": 1}) == "1"
+
+    pool = EnvironmentPool(max_size=1)
+    pool.get("a", jinja2.Environment)
+    pool.get("a", jinja2.Environment)
+    pool.get("b", jinja2.Environment)
+    assert pool.stats()["hits"] == 1
+    assert pool.evictions == 1
+    assert len(pool) == 1
+
+
+@pytest.mark.parametrize("max_workers", [None, 4])
+def test_render_components(max_workers):
+    """
+    Tests components render against one frozen facts snapshot, in order.
+    """
+    from core_renderer import FrozenFacts
+
+    renderer = Jinja2Renderer(
+        dictionary={
+            "bucket.yaml": "{{ component_name }}: {{ 'build' | tags | to_json }}",
+            "app.yaml": "{{ context.Portfolio }}-{{ app.name }}-{{ component_name }}",
+        }
+    )
+    facts = {"Portfolio": "p", "App": "a", "BranchShortName": "b", "Build": "1"}
+    components = {f"c{i}": "bucket.yaml" for i in range(10)}
+    components["api"] = "app.yaml"
+
+    result = renderer.render_components(
+        facts, components, {"app": {"name": "x"}}, max_workers=max_workers
+    )
+
+    assert list(result) == list(components)
+    assert result["api"] == "p-x-api"
+    assert result["c3"].startswith("c3: ")
+    assert '"Name": "p-a-b-1-c3"' in result["c3"]
+
+    # The caller's facts are snapshotted, not shared
+    frozen = FrozenFacts(facts)
+    facts["Portfolio"] = "changed"
+    assert renderer.render_components(
+        frozen, {"api": "app.yaml"}, {"app": {"name": "x"}}
+    ) == {"api": "p-x-api"}
+
+
+def test_render_profile():
+    """
+    Tests profiling records filter calls and template compile and render times.
+    """
+    from core_renderer import RenderProfile
+
+    templates = {
+        "main.yaml": "{% for i in range(3) %}{{ i | ensure_list | to_json }}{% endfor %}",
+    }
+    renderer = Jinja2Renderer(dictionary=templates, bytecode_cache=False, profile=True)
+    assert isinstance(renderer.profile, RenderProfile)
+    assert renderer.env is not Jinja2Renderer(dictionary=templates).env
+
+    assert renderer.render_file("main.yaml", {}) == "[0][1][2]"
+    renderer.render_file("main.yaml", {})
+    renderer.render_string("{{ 'x' | upper }}", {})
+
+    report = renderer.profile.log_report()
+    assert report["filters"]["ensure_list"]["calls"] == 6
+    assert report["filters"]["to_json"]["calls"] == 6
+    assert report["filters"]["upper"]["calls"] == 1
+    assert report["templates"]["main.yaml"]["renders"] == 2
+    assert report["templates"]["main.yaml"]["compiles"] == 1
+    assert report["templates"]["<string>"]["renders"] == 1
+
+    # Unprofiled renderers are not instrumented
+    assert Jinja2Renderer(dictionary=templates).profile is None
+    renderer.profile.reset()
+    assert renderer.profile.report()["filters"] == {}
+
+
+def test_check_files(tmp_path):
+    """
+    Tests static checks report missing variables, filters and templates before rendering.
+    """
+    from core_renderer import TemplateRequirementsError
+
+    (tmp_path / "base.j2").write_text(
+        "{{ title }}{% block body %}{{ base_only }}{% endblock %}"
+    )
+    (tmp_path / "child.yaml").write_text(
+        "{% extends 'base.j2' %}{% block body %}{% include 'inc.j2' %}{% endblock %}"
+    )
+    (tmp_path / "inc.j2").write_text(
+        "{{ item }}{{ optional | default('x') }}{% if other is defined %}{{ other }}{% endif %}"
+    )
+    (tmp_path / "loop.yaml").write_text(
+        "{% set item = 1 %}{% for x in items %}{{ x | upper }}{% endfor %}{% include 'inc.j2' %}"
+    )
+    (tmp_path / "bad.yaml").write_text(
+        "{{ app | no_such_filter }}{% include 'missing.j2' %}"
+    )
+
+    renderer = Jinja2Renderer(str(tmp_path), bytecode_cache=False)
+    context = {"title": "t", "item": "i", "items": ["a"], "app": "x"}
+
+    renderer.check_file("child.yaml", context)
+    renderer.check_file("loop.yaml", {"items": []})
+
+    with pytest.raises(TemplateRequirementsError) as e:
+        renderer.check_file("child.yaml", {"item": "i"})
+    assert e.value.problems == {"child.yaml": {"missing_variables": ["title"]}}
+
+    with pytest.raises(TemplateRequirementsError) as e:
+        renderer.render_files("", {**context, "base_only": 1}, check=True)
+    assert e.value.problems == {
+        "bad.yaml": {
+            "unknown_filters": ["no_such_filter"],
+            "missing_templates": ["missing.j2"],
+        }
+    }
+    assert isinstance(e.value, jinja2.exceptions.UndefinedError)
+
+
+def test_check_files_conditional_variables(tmp_path):
+    """
+    Tests variables and templates only reached conditionally are not required.
+    """
+    from core_renderer import TemplateRequirementsError
+
+    (tmp_path / "a.yaml").write_text(
+        "{% if flag %}{{ y }}{% include 'missing.j2' %}{% endif %}"
+        "{{ a if flag else b }}{{ flag and c }}"
+        "{% for i in items %}{{ d }}{% endfor %}ok"
+    )
+    renderer = Jinja2Renderer(str(tmp_path), bytecode_cache=False)
+    context = {"flag": False, "items": [], "b": "B"}
+
+    renderer.check_file("a.yaml", context)
+    assert renderer.render_files("", context, check=True) == {"a.yaml": "BFalseok"}
+
+    with pytest.raises(TemplateRequirementsError) as e:
+        renderer.check_file("a.yaml", {"flag": False})
+    assert e.value.problems == {"a.yaml": {"missing_variables": ["items"]}}
+
+
+def test_dependency_graph(tmp_path):
+    """
+    Tests the dependency graph is refreshed incrementally and an edited macro file
+    only invalidates the templates depending on it.
+    """
+    templates = tmp_path / "templates"
+    templates.mkdir()
+    (templates / "macros.j2").write_text("{% macro tag(x) %}<{{ x }}>{% endmacro %}")
+    (templates / "base.j2").write_text("[{% block body %}{% endblock %}]")
+    (templates / "uses_macro.yaml").write_text(
+        "{% from 'macros.j2' import tag %}{{ tag(app) }}"
+    )
+    (templates / "child.yaml").write_text(
+        "{% extends 'base.j2' %}{% block body %}{% include 'inc.j2' %}{% endblock %}"
+    )
+    (templates / "inc.j2").write_text("{{ app }}")
+    (templates / "plain.yaml").write_text("{{ app }}")
+
+    renderer = Jinja2Renderer(
+        str(templates), bytecode_cache=False, shared_environment=False
+    )
+    graph = renderer.dependency_graph
+    assert len(graph.refresh()) == 6
+    assert graph.refresh() == set()
+
+    assert graph.references("uses_macro.yaml") == {"macros.j2"}
+    assert graph.dependencies("child.yaml") == {"base.j2", "inc.j2"}
+    assert graph.dependents("macros.j2") == {"uses_macro.yaml"}
+    assert graph.dependents("inc.j2") == {"child.yaml"}
+
+    context = {"app": "a"}
+    cache_dir = str(tmp_path / "cache")
+    first = renderer.render_files("", context, cache_dir=cache_dir)
+    assert first["uses_macro.yaml"] == "<a>"
+    assert first["child.yaml"] == "[a]"
+
+    for name in ("uses_macro.yaml", "child.yaml", "plain.yaml"):
+        renderer.env.get_template(name)
+    loader_ref = weakref.ref(renderer.env.loader)
+
+    # Keep the mtime moving even on coarse filesystem timestamps
+    macros = templates / "macros.j2"
+    macros.write_text("{% macro tag(x) %}({{ x }}){% endmacro %}")
+    stat = macros.stat()
+    os.utime(macros, (stat.st_atime, stat.st_mtime + 10))
+
+    assert renderer.invalidate_changed() == {"macros.j2", "uses_macro.yaml"}
+    assert (loader_ref, "uses_macro.yaml") not in renderer.env.cache
+    assert (loader_ref, "child.yaml") in renderer.env.cache
+    assert (loader_ref, "plain.yaml") in renderer.env.cache
+
+    assert renderer.render_files("", context, cache_dir=cache_dir) == {
+        **first,
+        "uses_macro.yaml": "(a)",
+    }
+
+    # Templates named by an expression may depend on anything
+    (templates / "dynamic.yaml").write_text("{% include name %}")
+    assert renderer.invalidate_changed() >= {"dynamic.yaml"}
+    assert graph.dependencies("dynamic.yaml") is None
+    assert "dynamic.yaml" in graph.dependents("plain.yaml")
+
+
+def test_render_async(tmp_path):
+    """
+    Tests async renderers render strings and files concurrently on one event loop,
+    with read_file not blocking the loop.
+    """
+    import asyncio
+
+    (tmp_path / "data.txt").write_text("payload")
+    (tmp_path / "a.yaml").write_text("{{ app | upper }}:{{ 'data.txt' | read_file }}")
+    (tmp_path / "sub").mkdir()
+    (tmp_path / "sub" / "b.yaml").write_text("{% for x in items %}{{ x }}{% endfor %}")
+
+    renderer = Jinja2Renderer(str(tmp_path), bytecode_cache=False, enable_async=True)
+    assert renderer.env.is_async
+    assert Jinja2Renderer(str(tmp_path), bytecode_cache=False).env is not renderer.env
+
+    context = {"app": "x", "items": [1, 2]}
+
+    async def main():
+        string, results = await asyncio.gather(
+            renderer.render_string_async("{{ app }}-{{ items | length }}", context),
+            renderer.render_files_async("", context, max_concurrency=2),
+        )
+        return string, results
+
+    string, results = asyncio.run(main())
+    assert string == "x-2"
+    assert results == {"a.yaml": "X:payload", "data.txt": "payload", "sub/b.yaml": "12"}
+
+    # The synchronous API keeps working outside an event loop
+    assert renderer.render_file("a.yaml", context) == "X:payload"
+
+    with pytest.raises(jinja2.exceptions.UndefinedError):
+        asyncio.run(renderer.render_file_async("a.yaml", {}))
+
+
+def test_compiled_templates(tmp_path):
+    """
+    Tests templates compiled ahead of time load by import, without reading sources.
+    """
+    from core_renderer import compile_template_tree
+
+    template_path = tmp_path / "templates"
+    (template_path / "sub").mkdir(parents=True)
+    (template_path / "a.yaml.j2").write_text(
+        "{% from 'sub/m.j2' import greet %}a: {{ greet(value) }}\n"
+    )
+    (template_path / "sub" / "m.j2").write_text(
+        "{% macro greet(x) %}{{ x | upper }}{% endmacro %}"
+    )
+    (template_path / "bad.j2").write_text("{% if %}")
+    (template_path / "image.bin").write_bytes(b"\xff\xfe\x00")
+
+    assert compile_template_tree(str(template_path)) == 2
+
+    renderer = Jinja2Renderer(
+        str(template_path), bytecode_cache=False, compiled_templates=True
+    )
+    with patch.object(renderer.env.loader.fallback, "get_source") as get_source:
+        get_source.side_effect = AssertionError("source read")
+        assert renderer.render_file("a.yaml.j2", {"value": "x"}) == "a: X\n"
+
+    # Templates missing from the archive load from source
+    (template_path / "new.j2").write_text("{{ value }}")
+    assert renderer.render_file("new.j2", {"value": "n"}) == "n"
+
+    # The archive in the precompiled folder is not rendered as a template
+    files = renderer.render_files("sub", {"value": "x"})
+    assert sorted(files) == ["m.j2"]
+
+    # A renderer without compiled templates is not shared with one using them
+    assert Jinja2Renderer(str(template_path), bytecode_cache=False).env is not (
+        renderer.env
+    )
+
+
+def test_render_files_processes_use_renderer_config(tmp_path):
+    """
+    Tests process pool workers render with the parent renderer's configuration.
+    """
+    from core_renderer import compile_template_tree
+
+    template_path = tmp_path / "templates"
+    template_path.mkdir()
+    for i in range(4):
+        (template_path / f"t{i}.yaml").write_text(f"compiled {i}: {{{{ value }}}}")
+    assert compile_template_tree(str(template_path)) == 4
+
+    # Compiled templates are not checked against their (edited) sources
+    for i in range(4):
+        (template_path / f"t{i}.yaml").write_text(f"source {i}: {{{{ value }}}}")
+
+    renderer = Jinja2Renderer(
+        str(template_path), bytecode_cache=False, compiled_templates=True
+    )
+    expected = renderer.render_files("", {"value": 1})
+    assert expected["t0.yaml"] == "compiled 0: 1"
+    assert (
+        renderer.render_files("", {"value": 1}, max_workers=2, use_processes=True)
+        == expected
+    )
+
+
+def test_read_file_per_template_path(tmp_path):
+    """
+    Tests read_file resolves from the template directory of each renderer.
+    """
+    for name in ("a", "b"):
+        (tmp_path / name).mkdir()
+        (tmp_path / name / "data.txt").write_text(name)
+        (tmp_path / name / "t.yaml").write_text("{{ 'data.txt' | read_file }}")
+
+    a = Jinja2Renderer(str(tmp_path / "a"), bytecode_cache=False)
+    b = Jinja2Renderer(str(tmp_path / "b"), bytecode_cache=False)
+    assert a.render_file("t.yaml", {}) == "a"
+    assert b.render_file("t.yaml", {}) == "b"
+    assert a.render_file("t.yaml", {}) == "a"
+
+
+def test_read_file_cache(tmp_path):
+    """
+    Tests files inlined with read_file are read once while unchanged.
+    """
+    from core_renderer import FileCache, get_file_cache
+
+    (tmp_path / "user-data.sh").write_text("#!/bin/sh\necho hi\n")
+    (tmp_path / "a.yaml").write_text(
+        "{% for i in range(3) %}{{ 'user-data.sh' | read_file }}{% endfor %}"
+    )
+
+    cache = get_file_cache()
+    cache.clear()
+    renderer = Jinja2Renderer(str(tmp_path), bytecode_cache=False)
+    assert renderer.render_file("a.yaml", {}) == "#!/bin/sh\necho hi\n" * 3
+    assert cache.stats()["misses"] == 1 and cache.stats()["hits"] == 2
+
+    # An edited file is read again
+    user_data = tmp_path / "user-data.sh"
+    user_data.write_text("#!/bin/sh\necho changed\n")
+    stat = user_data.stat()
+    os.utime(user_data, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    assert renderer.render_file("a.yaml", {}) == "#!/bin/sh\necho changed\n" * 3
+    assert cache.stats()["misses"] == 2
+
+    # The total size is bounded
+    small = FileCache(max_bytes=30)
+    for name in ("x", "y", "z"):
+        (tmp_path / name).write_text(name * 12)
+        assert small.read(str(tmp_path / name)) == name * 12
+    assert len(small) == 2 and small.stats()["evictions"] == 1
+    (tmp_path / "big").write_text("b" * 31)
+    assert small.read(str(tmp_path / "big")) == "b" * 31
+    assert small.stats()["bytes"] == 24